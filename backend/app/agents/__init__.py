@@ -1,2 +1,21 @@
 """ADK agents package"""
 
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    from app.agents.base_agent import BaseADKAgent
+
+# Shared agent instances keyed by agent name. Populated lazily so importing
+# the package stays side-effect free — no Google ADK / Gemini client imports
+# at startup; routes reuse these instead of paying client/model construction
+# on every request.
+_AGENT_REGISTRY: Dict[str, "BaseADKAgent"] = {}
+
+
+def get_agent_registry() -> Dict[str, "BaseADKAgent"]:
+    """Get the shared agent registry, building agent instances on first use"""
+    if not _AGENT_REGISTRY:
+        from app.agents.infrastructure_monitor import get_agent
+
+        _AGENT_REGISTRY["infrastructure_monitor"] = get_agent()
+    return _AGENT_REGISTRY
@@ -1,11 +1,15 @@
 """Base agent class with Supabase session, Langfuse tracing, and error handling"""
 
-from typing import Optional, Dict, Any, List
+import asyncio
+import time
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Dict, Any, List
 from google.adk.llm_agents import LLMAgent
 from google.adk.models import GenerativeModel
+import httpx
 from langfuse import Langfuse
 from supabase import create_client, Client
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 import logging
 from app.config import settings
 from app.services.observability import observability_service
@@ -14,6 +18,41 @@ from app.services.session_service import session_service
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _get_supabase(url: str, key: str) -> Client:
+    """Get or create a shared Supabase client for the given (url, key) pair
+
+    Client construction builds a full PostgREST/HTTP stack, so reuse one
+    client per credential pair instead of paying TLS + connection setup
+    on every agent instantiation.
+    """
+    return create_client(url, key)
+
+
+# Cached LLMAgent instances keyed by (agent_name, prompt hash) so repeated
+# agent instantiations reuse the initialized model wrapper
+_agent_cache: Dict[tuple, LLMAgent] = {}
+
+# Only transient failures are worth retrying; retrying user-input errors or
+# 4xx responses just burns LLM tokens and user-visible latency
+try:
+    from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
+
+    RETRYABLE_EXCEPTIONS = (
+        TimeoutError,
+        httpx.ConnectError,
+        httpx.ReadTimeout,
+        ServiceUnavailable,
+        ResourceExhausted,
+    )
+except ImportError:
+    RETRYABLE_EXCEPTIONS = (TimeoutError, httpx.ConnectError, httpx.ReadTimeout)
+
+# Bound concurrent LLM calls across all agents so overlapping requests don't
+# blow through the Gemini RPM quota
+_llm_semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+
+
 class BaseADKAgent:
     """Base class for all ADK agents with built-in integrations"""
 
@@ -35,29 +74,35 @@ class BaseADKAgent:
         self.system_prompt = system_prompt
         self.tools = tools or []
 
-        # Initialize Supabase client
-        self.supabase: Client = create_client(
+        # Shared Supabase client (one per credential pair, process-wide)
+        self.supabase: Client = _get_supabase(
             settings.SUPABASE_URL,
             settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_ANON_KEY,
         )
 
-        # Create ADK agent
+        # Create ADK agent (reused across instantiations of the same agent)
+        cache_key = (agent_name, hash(system_prompt))
         try:
-            self.agent = LLMAgent(
-                name=agent_name,
-                model=GenerativeModel(
-                    model_name=settings.GEMINI_MODEL,
-                    api_key=settings.GOOGLE_API_KEY,
-                ),
-                system_instruction=system_prompt,
-                tools=self.tools,
-            )
-            logger.info(f"Initialized {agent_name} with {len(self.tools)} tools")
+            agent = _agent_cache.get(cache_key)
+            if agent is None:
+                agent = LLMAgent(
+                    name=agent_name,
+                    model=GenerativeModel(
+                        model_name=settings.GEMINI_MODEL,
+                        api_key=settings.GOOGLE_API_KEY,
+                    ),
+                    system_instruction=system_prompt,
+                    tools=self.tools,
+                )
+                _agent_cache[cache_key] = agent
+                logger.info(f"Initialized {agent_name} with {len(self.tools)} tools")
+            self.agent = agent
         except Exception as e:
             logger.error(f"Failed to initialize agent {agent_name}: {e}")
             raise
 
     @retry(
+        retry=retry_if_exception_type(RETRYABLE_EXCEPTIONS),
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
     )
@@ -75,11 +120,20 @@ class BaseADKAgent:
         Returns:
             Agent's response
         """
-        # Start Langfuse trace
-        trace = observability_service.trace(
-            name=f"{self.agent_name}_execution",
-            metadata={"session_id": session_id, "user_message": user_message, "user_id": user_id},
-        )
+        # Attach to the session's shared Langfuse trace when there is one so
+        # repeated executions nest under a single trace; fall back to a
+        # per-call trace for sessionless invocations. Skip trace plumbing
+        # entirely when Langfuse is disabled instead of allocating null
+        # objects per request.
+        if not observability_service.is_enabled():
+            trace = None
+        elif session_id:
+            trace = observability_service.trace_for_session(session_id)
+        else:
+            trace = observability_service.trace(
+                name=f"{self.agent_name}_execution",
+                metadata={"session_id": session_id, "user_message": user_message, "user_id": user_id},
+            )
 
         try:
             # Retrieve or create session
@@ -94,18 +148,36 @@ class BaseADKAgent:
 
             # Execute agent
             if trace:
-                span = trace.span(name="agent_execution")
+                span = trace.span(name=f"{self.agent_name}_execution")
             else:
                 span = None
 
-            # Run agent (synchronous for now, async support coming)
-            response = self.agent.run(user_message)
-
-            if span:
-                span.end(output=response.content if hasattr(response, "content") else str(response))
+            # Run agent without blocking the event loop: prefer the native
+            # async entry point, fall back to a worker thread
+            t0 = time.perf_counter()
+            async with _llm_semaphore:
+                if hasattr(self.agent, "arun"):
+                    response = await self.agent.arun(user_message)
+                else:
+                    response = await asyncio.to_thread(self.agent.run, user_message)
+            latency_ms = (time.perf_counter() - t0) * 1000
 
             response_text = response.content if hasattr(response, "content") else str(response)
 
+            if span:
+                span_metadata = {
+                    "latency_ms": latency_ms,
+                    "model": settings.GEMINI_MODEL,
+                }
+                # Gemini reports prompt-cache token counts in usage when
+                # context caching is active
+                usage = getattr(response, "usage", None)
+                for field in ("input_cache_read_tokens", "input_cache_write_tokens"):
+                    value = getattr(usage, field, None)
+                    if value is not None:
+                        span_metadata[field] = value
+                span.end(output=response_text, metadata=span_metadata)
+
             # Save to session
             if session_id:
                 await session_service.add_event(
@@ -140,18 +212,68 @@ class BaseADKAgent:
             if trace:
                 trace.update(status="success")
 
+    async def execute_stream(
+        self, user_message: str, session_id: Optional[str] = None, user_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Execute agent and yield response chunks as they are produced
+
+        Uses the model's native streaming entry point when available so
+        callers see first tokens at first-token latency; agents without
+        one fall back to a single chunk carrying the full execute() result.
+
+        Args:
+            user_message: User's input
+            session_id: Optional session ID for persistence
+            user_id: Optional user ID for session creation
+
+        Yields:
+            Response text chunks
+        """
+        stream_fn = getattr(self.agent, "arun_stream", None)
+        if stream_fn is None:
+            # No streaming support; execute() handles tracing/persistence
+            yield await self.execute(
+                user_message, session_id=session_id, user_id=user_id
+            )
+            return
+
+        chunks: List[str] = []
+        async with _llm_semaphore:
+            async for chunk in stream_fn(user_message):
+                text = chunk.content if hasattr(chunk, "content") else str(chunk)
+                chunks.append(text)
+                yield text
+
+        # Save the assembled response to the session
+        if session_id:
+            await session_service.add_event(
+                session_id=session_id,
+                event={
+                    "user_message": user_message,
+                    "agent_response": "".join(chunks),
+                    "agent_name": self.agent_name,
+                    "metadata": {},
+                },
+            )
+
     async def update_status(
         self, status: str, metrics: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Update agent status in database"""
         try:
-            self.supabase.table("agent_status").upsert(
-                {
-                    "agent_name": self.agent_name,
-                    "status": status,
-                    "metrics": metrics or {},
-                }
-            ).execute()
+            # supabase-py is synchronous; run it off the event loop
+            await asyncio.to_thread(
+                self.supabase.table("agent_status")
+                .upsert(
+                    {
+                        "agent_name": self.agent_name,
+                        "status": status,
+                        "metrics": metrics or {},
+                    }
+                )
+                .execute
+            )
             return True
         except Exception as e:
             logger.error(f"Error updating agent status: {e}")
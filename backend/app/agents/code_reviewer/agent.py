@@ -1,12 +1,28 @@
 """Code Reviewer Agent"""
 
+import asyncio
+import time
+from typing import Dict, Any, List, Tuple
 from app.agents.base_agent import BaseADKAgent
-from app.workflows.review_workflow import review_workflow
+from app.utils.hashing import content_hash
+from app.workflows.review_workflow import (
+    BATCH_DELIMITER,
+    REPORT_DELIMITER,
+    review_workflow,
+)
 from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# How long an in-process review result stays valid
+REVIEW_CACHE_TTL = 3600.0
+
+# Row-marshaling parameters for multi-file reviews: how many code blobs
+# share one workflow invocation, and how many invocations run at once
+REVIEW_BATCH_SIZE = 5
+REVIEW_MAX_CONCURRENCY = 4
+
 SYSTEM_PROMPT = """You are a Code Reviewer Agent that helps developers review code for quality, security, and best practices.
 
 Your responsibilities include:
@@ -29,10 +45,35 @@ class CodeReviewerAgent(BaseADKAgent):
             system_prompt=SYSTEM_PROMPT,
             tools=[],
         )
+        # In-process review cache: code_hash -> (monotonic timestamp, result)
+        self._review_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
     async def review_code(self, code: str) -> Dict[str, Any]:
-        """Review code using LangGraph workflow"""
+        """Review code using LangGraph workflow, cached by content hash"""
+        code_hash = content_hash(code)
+
+        # Sub-second repeats hit the in-process cache
+        cached = self._review_cache.get(code_hash)
+        if cached and time.monotonic() - cached[0] < REVIEW_CACHE_TTL:
+            logger.debug(f"Review cache hit (in-process) for {code_hash}")
+            return cached[1]
+
         try:
+            # Check for a stored review before running the workflow; a hit
+            # skips the entire multi-LLM chain
+            stored = await asyncio.to_thread(
+                self.supabase.table("code_reviews")
+                .select("review_result")
+                .eq("code_hash", code_hash)
+                .limit(1)
+                .execute
+            )
+            if stored.data:
+                result = stored.data[0]["review_result"]
+                self._review_cache[code_hash] = (time.monotonic(), result)
+                logger.debug(f"Review cache hit (database) for {code_hash}")
+                return result
+
             # Execute workflow
             result = await review_workflow.ainvoke(
                 {
@@ -45,21 +86,86 @@ class CodeReviewerAgent(BaseADKAgent):
                 }
             )
 
-            # Store review in database
-            self.supabase.table("code_reviews").insert(
-                {
-                    "review_id": f"review-{hash(code)}",
-                    "code_hash": str(hash(code)),
-                    "review_type": "full",
-                    "review_result": result,
-                    "status": "completed",
-                    "workflow_state": result,
-                }
-            ).execute()
+            # Store review in database, keyed by a stable content hash so
+            # identical code maps to the same review across restarts
+            await asyncio.to_thread(
+                self.supabase.table("code_reviews")
+                .upsert(
+                    {
+                        "review_id": f"review-{code_hash}",
+                        "code_hash": code_hash,
+                        "review_type": "full",
+                        "review_result": result,
+                        "status": "completed",
+                        "workflow_state": result,
+                    }
+                )
+                .execute
+            )
 
+            self._review_cache[code_hash] = (time.monotonic(), result)
             return result
 
         except Exception as e:
             logger.error(f"Error reviewing code: {e}", exc_info=True)
             raise
 
+    async def review_codes(
+        self,
+        codes: List[str],
+        batch_size: int = REVIEW_BATCH_SIZE,
+        max_concurrency: int = REVIEW_MAX_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """Review many code blobs with row-marshaled workflow invocations
+
+        Instead of one workflow run per blob (which fans out sequentially and
+        burns through the RPM quota), blobs are marshaled into batches that
+        share a single workflow invocation, and batches run concurrently
+        under a semaphore.
+
+        Args:
+            codes: Code blobs to review
+            batch_size: How many blobs share one workflow invocation
+            max_concurrency: Concurrent workflow invocations
+
+        Returns:
+            One review result per input blob, aligned with `codes`; each
+            carries its own code and report section, with scan findings
+            shared across its batch
+        """
+        if not codes:
+            return []
+
+        batches = [codes[i : i + batch_size] for i in range(0, len(codes), batch_size)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def review_batch(batch: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.review_code(BATCH_DELIMITER.join(batch))
+
+        batch_results = await asyncio.gather(*(review_batch(b) for b in batches))
+
+        results: List[Dict[str, Any]] = []
+        for batch, batch_result in zip(batches, batch_results):
+            results.extend(self._split_batch_result(batch, batch_result))
+        return results
+
+    @staticmethod
+    def _split_batch_result(
+        batch: List[str], batch_result: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Split a marshaled batch review into one result per blob
+
+        The workflow emits one report section per blob, joined with
+        REPORT_DELIMITER; each blob gets a result with its own code and
+        section. If the sections don't line up (e.g. a stored review that
+        predates per-file reports), every blob gets the full batch report.
+        """
+        sections = batch_result.get("final_report", "").split(REPORT_DELIMITER)
+        if len(sections) != len(batch):
+            sections = [batch_result.get("final_report", "")] * len(batch)
+        return [
+            {**batch_result, "code": code, "final_report": section}
+            for code, section in zip(batch, sections)
+        ]
+
@@ -1,5 +1,6 @@
 """Deployment Orchestrator Agent"""
 
+import asyncio
 from app.agents.base_agent import BaseADKAgent
 from typing import Dict, Any
 import logging
@@ -34,16 +35,20 @@ class DeploymentOrchestratorAgent(BaseADKAgent):
         # TODO: Implement actual deployment logic
         deployment_id = f"deploy-{service_name}-{version}"
         
-        # Store deployment record
-        self.supabase.table("deployments").insert(
-            {
-                "deployment_id": deployment_id,
-                "service_name": service_name,
-                "version": version,
-                "status": "pending",
-                "workflow_state": {},
-            }
-        ).execute()
+        # Store deployment record (off the event loop; supabase-py is sync)
+        await asyncio.to_thread(
+            self.supabase.table("deployments")
+            .insert(
+                {
+                    "deployment_id": deployment_id,
+                    "service_name": service_name,
+                    "version": version,
+                    "status": "pending",
+                    "workflow_state": {},
+                }
+            )
+            .execute
+        )
 
         return {
             "deployment_id": deployment_id,
@@ -1,6 +1,6 @@
 """Infrastructure Monitor Agent"""
 
-from app.agents.infrastructure_monitor.agent import InfrastructureMonitorAgent
+from app.agents.infrastructure_monitor.agent import InfrastructureMonitorAgent, get_agent
 
-__all__ = ["InfrastructureMonitorAgent"]
+__all__ = ["InfrastructureMonitorAgent", "get_agent"]
 
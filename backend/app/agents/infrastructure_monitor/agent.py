@@ -1,6 +1,7 @@
 """Infrastructure Monitor Agent"""
 
 import asyncio
+import bisect
 from typing import Optional
 from google.adk.tools import FunctionTool
 from app.agents.base_agent import BaseADKAgent
@@ -11,12 +12,25 @@ from app.agents.infrastructure_monitor.tools import (
     check_database_connection,
 )
 from app.agents.infrastructure_monitor.prompts import SYSTEM_PROMPT
+from app.services import db_pool
 from app.services.n8n_service import n8n_service
 from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared percent-usage thresholds: healthy below 75, warning below 90,
+# critical above — one place to tune instead of duplicated ternaries
+STATUS_CUTOFFS = [75, 90]
+STATUS_LABELS = ["healthy", "warning", "critical"]
+
+
+def usage_status(percent_used: float) -> str:
+    """Map a percent-usage value onto a status label via threshold lookup"""
+    # bisect_left keeps the cutoffs exclusive (75.0 is still healthy),
+    # matching the previous `> 75` / `> 90` comparisons
+    return STATUS_LABELS[bisect.bisect_left(STATUS_CUTOFFS, percent_used)]
+
 
 class InfrastructureMonitorAgent(BaseADKAgent):
     """Agent for monitoring infrastructure"""
@@ -56,11 +70,21 @@ class InfrastructureMonitorAgent(BaseADKAgent):
     async def monitor_services(self) -> dict:
         """Monitor all services and store metrics"""
         try:
-            # Check all services
-            docker_status = check_docker_containers()
-            disk_status = check_disk_space()
-            memory_status = check_memory_usage()
-            db_status = check_database_connection()
+            # Check all services concurrently; each check is independent I/O,
+            # so wall-clock time is the slowest check instead of the sum
+            docker_status, disk_status, memory_status, db_status = await asyncio.gather(
+                asyncio.to_thread(check_docker_containers),
+                asyncio.to_thread(check_disk_space),
+                asyncio.to_thread(check_memory_usage),
+                asyncio.to_thread(check_database_connection),
+                return_exceptions=True,
+            )
+
+            # Isolate failures so one broken check doesn't sink the others
+            docker_status, disk_status, memory_status, db_status = (
+                {"error": str(s)} if isinstance(s, BaseException) else s
+                for s in (docker_status, disk_status, memory_status, db_status)
+            )
 
             # Store metrics in Supabase
             metrics = [
@@ -76,11 +100,7 @@ class InfrastructureMonitorAgent(BaseADKAgent):
                     "metric_type": "usage_percent",
                     "metric_value": disk_status.get("percent_used", 0),
                     "unit": "percent",
-                    "status": (
-                        "critical" if disk_status.get("percent_used", 0) > 90
-                        else "warning" if disk_status.get("percent_used", 0) > 75
-                        else "healthy"
-                    ),
+                    "status": usage_status(disk_status.get("percent_used", 0)),
                     "metadata": disk_status,
                 },
                 {
@@ -88,18 +108,21 @@ class InfrastructureMonitorAgent(BaseADKAgent):
                     "metric_type": "usage_percent",
                     "metric_value": memory_status.get("percent_used", 0),
                     "unit": "percent",
-                    "status": (
-                        "critical" if memory_status.get("percent_used", 0) > 90
-                        else "warning" if memory_status.get("percent_used", 0) > 75
-                        else "healthy"
-                    ),
+                    "status": usage_status(memory_status.get("percent_used", 0)),
                     "metadata": memory_status,
                 },
             ]
 
-            # Store in database
-            for metric in metrics:
-                self.supabase.table("infrastructure_metrics").insert(metric).execute()
+            # Store in database: prefer the direct asyncpg bulk insert, which
+            # skips PostgREST entirely; fall back to the Supabase client
+            # (single bulk insert, off the event loop) if the pool is down.
+            try:
+                await db_pool.insert_metrics(metrics)
+            except Exception as e:
+                logger.warning(f"Direct metrics insert failed, falling back to PostgREST: {e}")
+                await asyncio.to_thread(
+                    self.supabase.table("infrastructure_metrics").insert(metrics).execute
+                )
 
             # Check for critical issues and send alerts
             critical_metrics = [m for m in metrics if m["status"] == "critical"]
@@ -125,6 +148,9 @@ class InfrastructureMonitorAgent(BaseADKAgent):
             return {
                 "status": "success",
                 "metrics": metrics,
+                # Lets callers (adaptive poll loop) tighten their interval
+                # while an incident is unfolding
+                "anomaly": bool(critical_metrics),
                 "summary": {
                     "docker": docker_status,
                     "disk": disk_status,
@@ -139,13 +165,22 @@ class InfrastructureMonitorAgent(BaseADKAgent):
             raise
 
 
-# Global agent instance
-infrastructure_monitor_agent = InfrastructureMonitorAgent()
+# Lazily constructed singleton; module import stays free of Supabase/Gemini/
+# Docker side effects (test discovery, migrations, etc.)
+_singleton: Optional[InfrastructureMonitorAgent] = None
+
+
+def get_agent() -> InfrastructureMonitorAgent:
+    """Get or create the shared InfrastructureMonitorAgent instance"""
+    global _singleton
+    if _singleton is None:
+        _singleton = InfrastructureMonitorAgent()
+    return _singleton
 
 
 async def main():
     """Main function for running agent in CLI mode"""
-    agent = InfrastructureMonitorAgent()
+    agent = get_agent()
     result = await agent.monitor_services()
     print(f"Monitoring complete: {result}")
 
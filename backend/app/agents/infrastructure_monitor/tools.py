@@ -1,63 +1,118 @@
 """Tools for Infrastructure Monitor Agent"""
 
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional, Tuple
 import docker
 import psutil
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Short-TTL cache for psutil snapshots: back-to-back polls (e.g. several UI
+# clients hitting the monitor) shouldn't re-walk /proc within a few seconds.
+_PSUTIL_CACHE_TTL = 2.0
+_psutil_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _cached_check(name: str, force_refresh: bool) -> Optional[Dict[str, Any]]:
+    """Return the cached result for a check if it is still fresh"""
+    if force_refresh:
+        return None
+    cached = _psutil_cache.get(name)
+    if cached and time.monotonic() - cached[0] < _PSUTIL_CACHE_TTL:
+        return cached[1]
+    return None
+
+# Cached low-level Docker API client so repeated checks reuse the socket
+# connection; the low-level API returns plain dicts in one HTTP call instead
+# of rich objects whose attribute access can trigger further requests
+_docker_api = None
+
+
+def _get_docker_api() -> docker.APIClient:
+    """Get or create the shared low-level Docker API client
+
+    Built with the same env-derived kwargs (DOCKER_HOST, TLS settings)
+    that docker.from_env() honors, so remote and rootless daemons keep
+    working.
+    """
+    global _docker_api
+    if _docker_api is None:
+        _docker_api = docker.APIClient(**docker.utils.kwargs_from_env())
+    return _docker_api
+
 
 def check_docker_containers() -> Dict[str, Any]:
     """Check status of Docker containers"""
     try:
-        client = docker.from_env()
-        containers = client.containers.list(all=True)
-        
-        result = {
-            "total": len(containers),
-            "running": len([c for c in containers if c.status == "running"]),
-            "stopped": len([c for c in containers if c.status == "exited"]),
-            "containers": [
+        api = _get_docker_api()
+        containers = api.containers(all=True)
+
+        # Aggregate counts and details in a single pass over the raw dicts
+        running = 0
+        stopped = 0
+        details = []
+        for c in containers:
+            state = c.get("State", "unknown")
+            names = c.get("Names") or []
+            details.append(
                 {
-                    "name": c.name,
-                    "status": c.status,
-                    "image": c.image.tags[0] if c.image.tags else "unknown",
+                    "name": names[0].lstrip("/") if names else "unknown",
+                    "status": state,
+                    "image": c.get("Image", "unknown"),
                 }
-                for c in containers
-            ],
+            )
+            running += state == "running"
+            stopped += state == "exited"
+
+        return {
+            "total": len(containers),
+            "running": running,
+            "stopped": stopped,
+            "containers": details,
         }
-        return result
     except Exception as e:
         logger.error(f"Error checking Docker containers: {e}")
         return {"error": str(e)}
 
 
-def check_disk_space() -> Dict[str, Any]:
+def check_disk_space(force_refresh: bool = False) -> Dict[str, Any]:
     """Check disk space usage"""
+    cached = _cached_check("disk", force_refresh)
+    if cached is not None:
+        return cached
+
     try:
         disk = psutil.disk_usage("/")
-        return {
+        result = {
             "total_gb": round(disk.total / (1024**3), 2),
             "used_gb": round(disk.used / (1024**3), 2),
             "free_gb": round(disk.free / (1024**3), 2),
             "percent_used": round((disk.used / disk.total) * 100, 2),
         }
+        _psutil_cache["disk"] = (time.monotonic(), result)
+        return result
     except Exception as e:
         logger.error(f"Error checking disk space: {e}")
         return {"error": str(e)}
 
 
-def check_memory_usage() -> Dict[str, Any]:
+def check_memory_usage(force_refresh: bool = False) -> Dict[str, Any]:
     """Check memory usage"""
+    cached = _cached_check("memory", force_refresh)
+    if cached is not None:
+        return cached
+
     try:
         memory = psutil.virtual_memory()
-        return {
+        result = {
             "total_gb": round(memory.total / (1024**3), 2),
             "used_gb": round(memory.used / (1024**3), 2),
             "available_gb": round(memory.available / (1024**3), 2),
             "percent_used": round(memory.percent, 2),
         }
+        _psutil_cache["memory"] = (time.monotonic(), result)
+        return result
     except Exception as e:
         logger.error(f"Error checking memory usage: {e}")
         return {"error": str(e)}
@@ -1,11 +1,19 @@
 """Knowledge Base Agent with RAG"""
 
+import asyncio
+import time
 from app.agents.base_agent import BaseADKAgent
-from typing import Dict, Any, List
+from app.services.observability import observability_service
+from app.utils.hashing import content_hash
+from typing import Dict, Any, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# How long a cached search result stays valid
+SEARCH_CACHE_TTL = 300.0
+SEARCH_CACHE_MAX_ENTRIES = 256
+
 SYSTEM_PROMPT = """You are a Knowledge Base Agent that helps developers find information about their codebase.
 
 Your responsibilities include:
@@ -28,15 +36,42 @@ class KnowledgeBaseAgent(BaseADKAgent):
             system_prompt=SYSTEM_PROMPT,
             tools=[],
         )
+        # Query cache: normalized query key -> (monotonic timestamp, results).
+        # Keys are normalized text for now; once pgvector search lands, the
+        # lookup becomes a cosine-similarity match over cached query
+        # embeddings so same-meaning queries also hit.
+        self._search_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+    @staticmethod
+    def _query_key(query: str, limit: int) -> str:
+        """Normalize a query into a cache key"""
+        return f"{' '.join(query.lower().split())}:{limit}"
 
     async def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Search knowledge base using semantic search"""
         # TODO: Implement pgvector semantic search
-        # For now, return empty results
+        key = self._query_key(query, limit)
+        cached = self._search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+            observability_service.trace(
+                name="knowledge_base_cache_hit", metadata={"query": query}
+            )
+            return cached[1]
+
         try:
-            # Placeholder for vector search
-            results = self.supabase.table("knowledge_base_documents").select("*").limit(limit).execute()
-            return results.data or []
+            # Placeholder for vector search (run off the event loop)
+            results = await asyncio.to_thread(
+                self.supabase.table("knowledge_base_documents").select("*").limit(limit).execute
+            )
+            data = results.data or []
+
+            observability_service.trace(
+                name="knowledge_base_cache_miss", metadata={"query": query}
+            )
+            if len(self._search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+                self._search_cache.clear()
+            self._search_cache[key] = (time.monotonic(), data)
+            return data
         except Exception as e:
             logger.error(f"Error searching knowledge base: {e}")
             return []
@@ -45,15 +80,21 @@ class KnowledgeBaseAgent(BaseADKAgent):
         """Add document to knowledge base"""
         # TODO: Generate embeddings and store
         try:
-            document_id = f"doc-{hash(content)}"
-            self.supabase.table("knowledge_base_documents").insert(
-                {
-                    "document_id": document_id,
-                    "title": title,
-                    "content": content,
-                    "content_type": content_type,
-                }
-            ).execute()
+            # Stable content hash so re-adding the same document dedups
+            # instead of creating a new row per process
+            document_id = f"doc-{content_hash(content)}"
+            await asyncio.to_thread(
+                self.supabase.table("knowledge_base_documents")
+                .upsert(
+                    {
+                        "document_id": document_id,
+                        "title": title,
+                        "content": content,
+                        "content_type": content_type,
+                    }
+                )
+                .execute
+            )
             return {"document_id": document_id, "status": "added"}
         except Exception as e:
             logger.error(f"Error adding document: {e}")
@@ -3,7 +3,9 @@
 from fastapi import APIRouter, HTTPException, Depends
 from typing import List, Dict, Any
 from pydantic import BaseModel
-from app.agents.infrastructure_monitor import InfrastructureMonitorAgent
+# Agent classes are imported lazily inside the registry so route modules
+# don't pull Google ADK / Gemini clients at startup
+from app.agents import get_agent_registry
 from app.middleware.auth import require_auth, require_role, UserContext, Role
 
 router = APIRouter()
@@ -49,27 +51,28 @@ async def get_agent_status(
 async def execute_agent(
     agent_name: str,
     message: Dict[str, Any],
-    user: UserContext = Depends(require_auth)
+    user: UserContext = Depends(require_auth),
+    registry: Dict[str, Any] = Depends(get_agent_registry),
 ) -> Dict[str, Any]:
     """Execute an agent with a message (requires authentication)"""
     user_message = message.get("message", "")
     session_id = message.get("session_id")
 
-    # Route to appropriate agent
-    if agent_name == "infrastructure_monitor":
-        agent = InfrastructureMonitorAgent()
-        response = await agent.execute(user_message, session_id=session_id, user_id=user.user_id)
-        return {
-            "agent": agent_name,
-            "response": response,
-            "status": "completed",
-        }
-    else:
+    # Route to appropriate agent (shared instances, no per-request setup)
+    agent = registry.get(agent_name)
+    if not agent:
         raise HTTPException(
             status_code=404,
             detail=f"Agent {agent_name} not found",
         )
 
+    response = await agent.execute(user_message, session_id=session_id, user_id=user.user_id)
+    return {
+        "agent": agent_name,
+        "response": response,
+        "status": "completed",
+    }
+
 
 @router.delete("/{agent_name}")
 async def delete_agent(
@@ -1,17 +1,47 @@
 """Chat endpoints for agent interactions"""
 
+import asyncio
+import logging
+
+import orjson
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
+from app.event_bus import get_event_dispatcher
+# Agent classes are imported lazily inside the registry so route modules
+# don't pull Google ADK / Gemini clients at startup
+from app.agents import get_agent_registry
 from app.services.session_service import session_service
 from app.services.task_service import task_service
-from app.agents.infrastructure_monitor import InfrastructureMonitorAgent
 from app.middleware.auth import require_auth, get_optional_user, UserContext, Role
 from app.config import settings
-import uuid
+
+# Time-ordered UUIDs keep session keys chronologically clustered in
+# storage (better scan/snapshot locality than random uuid4)
+from uuid_utils import uuid7
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Bound concurrent agent executions so request bursts don't fan out into
+# unbounded LLM calls; requests beyond the queue limit are shed with 503
+_agent_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_AGENT_CALLS)
+AGENT_QUEUE_LIMIT = settings.MAX_CONCURRENT_AGENT_CALLS * 2
+_agent_waiting = 0
+
+# Keep strong references to fire-and-forget tasks so they aren't garbage
+# collected mid-flight
+_background_tasks: set = set()
+
+
+def _fire_and_forget(coro) -> None:
+    """Run a coroutine in the background without blocking the response"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
 
 class ChatRequest(BaseModel):
     """Chat request model"""
@@ -30,50 +60,132 @@ class ChatResponse(BaseModel):
 @router.post("/")
 async def chat(
     request: ChatRequest,
-    user: Optional[UserContext] = Depends(get_optional_user)
+    user: Optional[UserContext] = Depends(get_optional_user),
+    registry: Dict[str, Any] = Depends(get_agent_registry),
 ) -> ChatResponse:
     """Chat with an agent"""
+    # Reject unknown agents before any session writes so misrouted
+    # requests don't pollute the session store
+    agent_name = request.agent_name or "infrastructure_monitor"
+    agent = registry.get(agent_name)
+    if not agent:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown agent: {agent_name}",
+        )
+
     # Get user ID from auth or use default
     user_id = user.user_id if user else "anonymous"
-    
-    # Get or create session
-    session_id = request.session_id or str(uuid.uuid4())
-    session = await session_service.get_session(session_id)
 
-    if not session:
-        # Create new session
-        tenant_id = user.tenant_id if user else None
-        await session_service.create_session(
-            session_id=session_id,
-            user_id=user_id,
-            tenant_id=tenant_id,
+    # Get or create session in one round trip
+    session_id = request.session_id or str(uuid7())
+    tenant_id = user.tenant_id if user else None
+    await session_service.ensure_session(
+        session_id=session_id,
+        user_id=user_id,
+        tenant_id=tenant_id,
+    )
+
+    # Shed load early when the execution queue is already saturated
+    global _agent_waiting
+    if _agent_semaphore.locked() and _agent_waiting >= AGENT_QUEUE_LIMIT:
+        raise HTTPException(
+            status_code=503,
+            detail="Agent capacity exhausted, retry shortly",
+            headers={"Retry-After": "1"},
         )
 
-    # Route to appropriate agent
-    agent_name = request.agent_name or "infrastructure_monitor"
-    
-    if agent_name == "infrastructure_monitor":
-        agent = InfrastructureMonitorAgent()
+    _agent_waiting += 1
+    try:
+        await _agent_semaphore.acquire()
+    finally:
+        _agent_waiting -= 1
+
+    try:
         response_text = await agent.execute(request.message, session_id=session_id, user_id=user_id)
-    else:
-        # Default echo for unknown agents
-        response_text = f"Echo: {request.message}"
+    finally:
+        _agent_semaphore.release()
 
-    # Save to session history
-    await session_service.add_event(
-        session_id=session_id,
-        event={
-            "user_message": request.message,
-            "agent_response": response_text,
-            "agent_name": request.agent_name or "default",
-            "metadata": {},
-        },
+    # Save to session history in the background; the response doesn't need
+    # to wait for the write, and add_event already logs its own failures
+    _fire_and_forget(
+        session_service.add_event(
+            session_id=session_id,
+            event={
+                "user_message": request.message,
+                "agent_response": response_text,
+                "agent_name": agent_name,
+                "metadata": {},
+            },
+        )
     )
 
     return ChatResponse(
         response=response_text,
         session_id=session_id,
-        agent_name=request.agent_name or "default",
+        agent_name=agent_name,
+    )
+
+
+@router.post("/stream")
+async def chat_stream(
+    request: ChatRequest,
+    user: Optional[UserContext] = Depends(get_optional_user),
+    registry: Dict[str, Any] = Depends(get_agent_registry),
+) -> StreamingResponse:
+    """Chat with an agent, streaming response chunks over SSE
+
+    Clients see first tokens at first-token latency instead of waiting
+    for the full generation. Chunks are also published to the event bus
+    so /events subscribers observe the same message.
+    """
+    agent_name = request.agent_name or "infrastructure_monitor"
+    agent = registry.get(agent_name)
+    if not agent:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown agent: {agent_name}",
+        )
+
+    user_id = user.user_id if user else "anonymous"
+    session_id = request.session_id or str(uuid7())
+    tenant_id = user.tenant_id if user else None
+    await session_service.ensure_session(
+        session_id=session_id,
+        user_id=user_id,
+        tenant_id=tenant_id,
+    )
+
+    dispatcher = get_event_dispatcher()
+    message_id = str(uuid7())
+
+    async def sse_generator():
+        """Yield SSE-formatted delta chunks as the agent produces them"""
+        chunks = []
+        try:
+            await dispatcher.agent_message_start(session_id, message_id, agent_name)
+            async for chunk in agent.execute_stream(
+                request.message, session_id=session_id, user_id=user_id
+            ):
+                chunks.append(chunk)
+                await dispatcher.agent_message_delta(session_id, message_id, chunk)
+                yield b"data: " + orjson.dumps({"delta": chunk}) + b"\n\n"
+            await dispatcher.agent_message_end(session_id, message_id, "".join(chunks))
+            yield b"data: " + orjson.dumps(
+                {"done": True, "session_id": session_id, "agent_name": agent_name}
+            ) + b"\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming chat for session {session_id}: {e}")
+            yield b"data: " + orjson.dumps({"error": str(e)}) + b"\n\n"
+
+    return StreamingResponse(
+        sse_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
     )
 
 
@@ -85,19 +197,15 @@ async def chat_async(
     """Chat with an agent asynchronously (returns task ID)"""
     # Get user ID from auth or use default
     user_id = user.user_id if user else "anonymous"
-    
-    # Get or create session
-    session_id = request.session_id or str(uuid.uuid4())
-    session = await session_service.get_session(session_id)
 
-    if not session:
-        # Create new session
-        tenant_id = user.tenant_id if user else None
-        await session_service.create_session(
-            session_id=session_id,
-            user_id=user_id,
-            tenant_id=tenant_id,
-        )
+    # Get or create session in one round trip
+    session_id = request.session_id or str(uuid7())
+    tenant_id = user.tenant_id if user else None
+    await session_service.ensure_session(
+        session_id=session_id,
+        user_id=user_id,
+        tenant_id=tenant_id,
+    )
 
     # Enqueue task
     agent_name = request.agent_name or "infrastructure_monitor"
@@ -129,7 +237,7 @@ async def get_task_status(
     user: UserContext = Depends(require_auth)
 ) -> Dict[str, Any]:
     """Get status of an async task (requires authentication)"""
-    status_info = task_service.get_task_status(task_id)
+    status_info = await task_service.get_task_status_async(task_id)
     
     if not status_info:
         raise HTTPException(
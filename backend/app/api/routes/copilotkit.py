@@ -1,10 +1,15 @@
 """CopilotKit endpoint for AG-UI protocol"""
 
+from typing import Any, Dict
+
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import StreamingResponse
-from app.agents.infrastructure_monitor import InfrastructureMonitorAgent
+
+# Agent classes are imported lazily inside the registry so route modules
+# don't pull Google ADK / Gemini clients at startup
+from app.agents import get_agent_registry
 from app.middleware.auth import get_optional_user, UserContext
-import json
+from app.utils.parsing import parse_json_body
 
 router = APIRouter()
 
@@ -12,17 +17,18 @@ router = APIRouter()
 @router.post("/copilotkit")
 async def copilotkit_endpoint(
     request: Request,
-    user: UserContext = Depends(get_optional_user)
+    user: UserContext = Depends(get_optional_user),
+    registry: Dict[str, Any] = Depends(get_agent_registry),
 ):
     """Handle CopilotKit requests"""
-    body = await request.json()
-    
+    body = await parse_json_body(request)
+
     # Extract message from CopilotKit format
     message = body.get("message", "")
     session_id = body.get("session_id")
-    
-    # Execute agent
-    agent = InfrastructureMonitorAgent()
+
+    # Execute agent (shared instance, no per-request setup)
+    agent = registry["infrastructure_monitor"]
     user_id = user.user_id if user else "anonymous"
     response = await agent.execute(message, session_id=session_id, user_id=user_id)
     
@@ -57,16 +57,18 @@ async def stream_events(session_id: str, request: Request):
     async def event_generator():
         """Generator function that yields SSE-formatted events"""
         try:
-            # Stream events from the event bus
-            async for event in event_bus.stream_session_events(session_id, stop_event):
+            # Stream events from the event bus; SSE bytes arrive
+            # pre-serialized (once per event, shared across subscribers)
+            async for event, sse in event_bus.stream_session_events(
+                session_id, stop_event
+            ):
                 # Check if client disconnected
                 if await request.is_disconnected():
                     logger.info(f"Client disconnected for session {session_id}")
                     stop_event.set()
                     break
-                
-                # Yield SSE-formatted event
-                yield event.to_sse()
+
+                yield sse
                 
         except asyncio.CancelledError:
             logger.info(f"Event stream cancelled for session {session_id}")
@@ -83,7 +85,7 @@ async def stream_events(session_id: str, request: Request):
                     "agent": "system",
                 }
             )
-            yield error_event.to_sse()
+            yield error_event.to_sse_bytes()
         finally:
             # Ensure stop event is set
             stop_event.set()
@@ -1,10 +1,12 @@
 """Health check endpoints"""
 
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+import asyncio
 import httpx
-import redis
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Dict, Any, Tuple
 from app.config import settings
+from app.dependencies import get_redis_client
+from app.services.http import get_http
 
 router = APIRouter()
 
@@ -15,82 +17,99 @@ async def health_check() -> Dict[str, str]:
     return {"status": "healthy", "service": "adk-devops-assistant"}
 
 
-@router.get("/detailed")
-async def detailed_health_check() -> Dict[str, Any]:
-    """Detailed health check for all services"""
-    health_status: Dict[str, Any] = {
-        "status": "healthy",
-        "services": {},
-    }
+async def _check_redis() -> Tuple[str, Dict[str, Any], bool]:
+    """Probe Redis connectivity"""
+    try:
+        await get_redis_client().ping()
+        return "redis", {"status": "healthy"}, True
+    except Exception as e:
+        return "redis", {"status": "unhealthy", "error": str(e)}, False
 
-    # Check Redis
+
+async def _probe_url(client: httpx.AsyncClient, url: str) -> int:
+    """Probe a URL without pulling its response body
+
+    HEAD elides the body entirely (several KB of OpenAPI metadata on
+    Supabase's /rest/v1/); upstreams that reject HEAD get a ranged GET.
+    """
+    response = await client.head(url, timeout=5.0)
+    if response.status_code == 405:
+        response = await client.get(
+            url, headers={"Range": "bytes=0-0"}, timeout=5.0
+        )
+    return response.status_code
+
+
+def _probe_result(
+    name: str, status_code: int, required: bool
+) -> Tuple[str, Dict[str, Any], bool]:
+    """Build a probe tuple; 2xx/3xx count as healthy to tolerate redirects"""
+    if status_code < 400:
+        return name, {"status": "healthy"}, True
+    return (
+        name,
+        {"status": "unhealthy", "error": f"Status code: {status_code}"},
+        not required,
+    )
+
+
+async def _check_supabase(client: httpx.AsyncClient) -> Tuple[str, Dict[str, Any], bool]:
+    """Probe the Supabase REST endpoint"""
     try:
-        r = redis.from_url(settings.REDIS_URL)
-        r.ping()
-        health_status["services"]["redis"] = {"status": "healthy"}
+        status_code = await _probe_url(client, settings.SUPABASE_REST_URL)
+        return _probe_result("supabase", status_code, required=True)
     except Exception as e:
-        health_status["services"]["redis"] = {"status": "unhealthy", "error": str(e)}
-        health_status["status"] = "degraded"
+        return "supabase", {"status": "unhealthy", "error": str(e)}, False
+
 
-    # Check Supabase
+async def _check_langfuse(client: httpx.AsyncClient) -> Tuple[str, Dict[str, Any], bool]:
+    """Probe the Langfuse health endpoint (optional service)"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.SUPABASE_URL}/rest/v1/",
-                timeout=5.0,
-            )
-            if response.status_code == 200:
-                health_status["services"]["supabase"] = {"status": "healthy"}
-            else:
-                health_status["services"]["supabase"] = {
-                    "status": "unhealthy",
-                    "error": f"Status code: {response.status_code}",
-                }
-                health_status["status"] = "degraded"
+        status_code = await _probe_url(
+            client, f"{settings.LANGFUSE_HOST}/api/public/health"
+        )
+        return _probe_result("langfuse", status_code, required=False)
     except Exception as e:
-        health_status["services"]["supabase"] = {"status": "unhealthy", "error": str(e)}
-        health_status["status"] = "degraded"
+        return "langfuse", {"status": "unhealthy", "error": str(e)}, True
 
-    # Check Langfuse (optional)
-    if settings.LANGFUSE_PUBLIC_KEY:
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{settings.LANGFUSE_HOST}/api/public/health",
-                    timeout=5.0,
-                )
-                if response.status_code == 200:
-                    health_status["services"]["langfuse"] = {"status": "healthy"}
-                else:
-                    health_status["services"]["langfuse"] = {
-                        "status": "unhealthy",
-                        "error": f"Status code: {response.status_code}",
-                    }
-        except Exception as e:
-            health_status["services"]["langfuse"] = {
-                "status": "unhealthy",
-                "error": str(e),
-            }
-
-    # Check n8n (optional)
+
+async def _check_n8n(client: httpx.AsyncClient) -> Tuple[str, Dict[str, Any], bool]:
+    """Probe the n8n health endpoint (optional service)"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                settings.N8N_WEBHOOK_URL.replace("/webhook", "/healthz"),
-                timeout=5.0,
-            )
-            if response.status_code == 200:
-                health_status["services"]["n8n"] = {"status": "healthy"}
-            else:
-                health_status["services"]["n8n"] = {
-                    "status": "unhealthy",
-                    "error": f"Status code: {response.status_code}",
-                }
+        status_code = await _probe_url(client, settings.N8N_HEALTHZ_URL)
+        return _probe_result("n8n", status_code, required=False)
     except Exception as e:
-        health_status["services"]["n8n"] = {"status": "unhealthy", "error": str(e)}
+        return "n8n", {"status": "unhealthy", "error": str(e)}, True
+
+
+@router.get("/detailed")
+async def detailed_health_check(
+    client: httpx.AsyncClient = Depends(get_http),
+) -> Dict[str, Any]:
+    """Detailed health check for all services"""
+    health_status: Dict[str, Any] = {
+        "status": "healthy",
+        "services": {},
+    }
+
+    # Probe all services concurrently over the shared keep-alive client;
+    # wall time is the slowest probe rather than the sum
+    checks = [_check_redis(), _check_supabase(client), _check_n8n(client)]
+    if settings.LANGFUSE_PUBLIC_KEY:
+        checks.append(_check_langfuse(client))
+
+    results = await asyncio.gather(*checks, return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, BaseException):
+            health_status["status"] = "degraded"
+            continue
+        name, status, healthy_or_optional = result
+        health_status["services"][name] = status
+        if not healthy_or_optional:
+            health_status["status"] = "degraded"
 
     if health_status["status"] == "degraded":
         raise HTTPException(status_code=503, detail=health_status)
 
     return health_status
-
@@ -1,9 +1,10 @@
 """Webhook endpoints for n8n integration"""
 
-from fastapi import APIRouter, HTTPException, Request, Depends
+from fastapi import APIRouter, Request, Depends
 from typing import Dict, Any
 from pydantic import BaseModel
 from app.middleware.auth import require_api_key
+from app.utils.parsing import parse_json_body
 
 router = APIRouter()
 
@@ -20,12 +21,9 @@ async def n8n_webhook(
     _: bool = Depends(require_api_key())
 ) -> Dict[str, str]:
     """Receive webhooks from n8n (requires API key)"""
-    try:
-        payload = await request.json()
-        # TODO: Process webhook payload
-        return {"status": "received", "message": "Webhook processed"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid webhook payload: {str(e)}")
+    payload = await parse_json_body(request)
+    # TODO: Process webhook payload
+    return {"status": "received", "message": "Webhook processed"}
 
 
 @router.post("/alerts")
@@ -14,11 +14,23 @@ from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# General pool: sized for short request/response commands that should
+# fail fast when the pool or server is saturated
+GENERAL_POOL_MAX_CONNECTIONS = 50
+# Blocking pool: small, dedicated to pubsub subscriptions that hold a
+# connection for the lifetime of the stream
+BLOCKING_POOL_MAX_CONNECTIONS = 10
+
 
 @lru_cache
 def get_redis_client() -> redis.Redis:
     """
-    Get or create the singleton Redis client instance
+    Get or create the singleton Redis client for fast operations
+
+    This client is backed by the general connection pool and is meant for
+    short commands (publish, get/set). Pub/Sub subscriptions must use
+    get_blocking_redis_client() instead, so long-held subscriber
+    connections can't starve fast operations of pool capacity.
 
     Returns:
         Async Redis client configured from settings
@@ -27,25 +39,57 @@ def get_redis_client() -> redis.Redis:
         >>> redis_client = get_redis_client()
         >>> await redis_client.ping()
     """
-    client = redis.from_url(
+    pool = redis.ConnectionPool.from_url(
         settings.REDIS_URL,
         encoding="utf-8",
         decode_responses=True,
         db=settings.REDIS_DB,
+        max_connections=GENERAL_POOL_MAX_CONNECTIONS,
+        socket_timeout=5.0,
+        socket_connect_timeout=0.5,
     )
+    client = redis.Redis(connection_pool=pool)
     logger.info(f"Redis client initialized: {settings.REDIS_URL}")
     return client
 
 
+@lru_cache
+def get_blocking_redis_client() -> redis.Redis:
+    """
+    Get or create the singleton Redis client for blocking operations
+
+    This client is backed by a small dedicated pool with no socket
+    timeout, for pubsub subscriptions that legitimately block on the
+    socket for long periods.
+
+    Returns:
+        Async Redis client configured from settings
+
+    Example:
+        >>> pubsub = get_blocking_redis_client().pubsub()
+    """
+    pool = redis.ConnectionPool.from_url(
+        settings.REDIS_URL,
+        encoding="utf-8",
+        decode_responses=True,
+        db=settings.REDIS_DB,
+        max_connections=BLOCKING_POOL_MAX_CONNECTIONS,
+        socket_connect_timeout=0.5,
+    )
+    client = redis.Redis(connection_pool=pool)
+    logger.info(f"Blocking Redis client initialized: {settings.REDIS_URL}")
+    return client
+
+
 async def close_redis_client():
     """
-    Close the Redis client connection
+    Close the Redis client connections
 
     Call this during application shutdown to gracefully close connections.
 
     Example:
         >>> await close_redis_client()
     """
-    client = get_redis_client()
-    await client.close()
-    logger.info("Redis client closed")
+    await get_redis_client().close()
+    await get_blocking_redis_client().close()
+    logger.info("Redis clients closed")
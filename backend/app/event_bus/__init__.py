@@ -8,6 +8,7 @@ Events follow the AG-UI Protocol specification for compatibility with industry-s
 from .bus import EventBus, get_event_bus
 from .dispatcher import EventDispatcher, get_event_dispatcher
 from .schema import Event
+from .stream_hub import StreamHub, get_stream_hub
 
 __all__ = [
     "Event",
@@ -15,4 +16,6 @@ __all__ = [
     "get_event_bus",
     "EventDispatcher",
     "get_event_dispatcher",
+    "StreamHub",
+    "get_stream_hub",
 ]
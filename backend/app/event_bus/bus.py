@@ -9,15 +9,28 @@ import asyncio
 import json
 import logging
 from functools import lru_cache
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Optional, Tuple
 
 import redis.asyncio as redis
 
-from .channels import session_channel, broadcast_channel
+from .channels import session_channel, broadcast_channel, session_history_key
 from .schema import Event
+from .stream_hub import get_stream_hub
 
 logger = logging.getLogger(__name__)
 
+# Max commands coalesced into one Redis pipeline
+PUBLISH_BATCH_SIZE = 128
+# How long the flusher waits for more commands before flushing (seconds)
+PUBLISH_BATCH_INTERVAL = 0.002
+# How long persisted per-session event lists are kept
+HISTORY_TTL_SECONDS = 3600
+# Upper bound on waiting for the flusher to drain the queue at shutdown
+CLOSE_DRAIN_TIMEOUT = 1.0
+
+# Queue sentinel telling the flusher to flush what it has and exit
+_CLOSE = object()
+
 
 class EventBus:
     """
@@ -28,17 +41,60 @@ class EventBus:
     broadcast channel for system-wide events.
 
     Attributes:
-        redis_client: Async Redis client instance
+        redis_client: Async Redis client for fast operations (publish)
+        blocking_client: Async Redis client dedicated to pubsub subscriptions
     """
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        blocking_client: Optional[redis.Redis] = None,
+    ):
         """
         Initialize the Event Bus
 
         Args:
-            redis_client: Async Redis client instance
+            redis_client: Async Redis client for fast operations
+            blocking_client: Async Redis client for pubsub subscriptions
+                (defaults to redis_client)
         """
         self.redis_client = redis_client
+        self.blocking_client = blocking_client or redis_client
+        self._publish_queue: asyncio.Queue = asyncio.Queue()
+        self._flusher_task: Optional[asyncio.Task] = None
+
+    def publish_nowait(self, event: Event, broadcast: bool = False) -> None:
+        """
+        Queue an event for publishing without suspending the caller
+
+        Enqueueing never blocks, so hot paths (token-delta streams) can
+        emit events with a plain call instead of an await; the background
+        flusher pipelines the actual Redis PUBLISHes.
+
+        Args:
+            event: The event to publish
+            broadcast: If True, also publish to broadcast channel
+        """
+        try:
+            payload = event.to_json()
+            channel = session_channel(event.session_id)
+
+            # Hand off to the background flusher, which pipelines publishes
+            # so concurrent events share one network round trip
+            self._publish_queue.put_nowait(("publish", channel, payload))
+            if broadcast:
+                self._publish_queue.put_nowait(
+                    ("publish", broadcast_channel(), payload)
+                )
+            self._ensure_flusher()
+
+            logger.debug(
+                f"Queued event {event.type} for {channel} (event_id={event.event_id})"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to publish event {event.event_id}: {e}")
+            raise
 
     async def publish(
         self, event: Event, broadcast: bool = False
@@ -46,6 +102,9 @@ class EventBus:
         """
         Publish an event to the appropriate Redis channel(s)
 
+        Awaitable wrapper over publish_nowait, kept for existing call
+        sites; both route through the coalescing flusher.
+
         Args:
             event: The event to publish
             broadcast: If True, also publish to broadcast channel
@@ -53,103 +112,190 @@ class EventBus:
         Example:
             >>> await bus.publish(event)
         """
+        self.publish_nowait(event, broadcast=broadcast)
+
+    async def publish_batch(
+        self, events, broadcast: bool = False
+    ) -> None:
+        """
+        Queue a batch of events for publishing
+
+        All events are enqueued before the flusher wakes, so the whole
+        batch shares one pipelined round trip instead of N.
+
+        Args:
+            events: Iterable of events to publish
+            broadcast: If True, also publish each to the broadcast channel
+        """
+        for event in events:
+            self.publish_nowait(event, broadcast=broadcast)
+
+    async def publish_and_persist(
+        self, event: Event, broadcast: bool = False
+    ) -> None:
+        """
+        Publish an event and append it to the session's recent-event list
+
+        The publish, the RPUSH and the TTL refresh all go through the
+        coalescing flusher, so co-triggered delivery and persistence share
+        one pipeline instead of paying separate round trips.
+
+        Args:
+            event: The event to publish and persist
+            broadcast: If True, also publish to broadcast channel
+        """
         try:
-            # Publish to session-specific channel
-            channel = session_channel(event.session_id)
-            await self.redis_client.publish(channel, event.to_json())
-            logger.debug(
-                f"Published event {event.type} to {channel} (event_id={event.event_id})"
-            )
+            payload = event.to_json()
+            history_key = session_history_key(event.session_id)
 
-            # Optionally publish to broadcast channel
+            self._publish_queue.put_nowait(
+                ("publish", session_channel(event.session_id), payload)
+            )
             if broadcast:
-                await self.redis_client.publish(
-                    broadcast_channel(), event.to_json()
-                )
-                logger.debug(
-                    f"Broadcast event {event.type} (event_id={event.event_id})"
+                self._publish_queue.put_nowait(
+                    ("publish", broadcast_channel(), payload)
                 )
+            self._publish_queue.put_nowait(("rpush", history_key, payload))
+            self._publish_queue.put_nowait(
+                ("expire", history_key, HISTORY_TTL_SECONDS)
+            )
+            self._ensure_flusher()
+
+            logger.debug(
+                f"Queued event {event.type} for publish+persist (event_id={event.event_id})"
+            )
 
         except Exception as e:
             logger.error(f"Failed to publish event {event.event_id}: {e}")
             raise
 
+    def _ensure_flusher(self) -> None:
+        """Start the background publish flusher if it isn't running"""
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Drain queued publishes in batches over a single pipeline"""
+        closing = False
+        while not closing:
+            item = await self._publish_queue.get()
+            if item is _CLOSE:
+                return
+            batch = [item]
+            # Coalesce briefly so bursts of small events share one pipeline
+            try:
+                while len(batch) < PUBLISH_BATCH_SIZE:
+                    item = await asyncio.wait_for(
+                        self._publish_queue.get(),
+                        timeout=PUBLISH_BATCH_INTERVAL,
+                    )
+                    if item is _CLOSE:
+                        closing = True
+                        break
+                    batch.append(item)
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for command, *args in batch:
+                        getattr(pipe, command)(*args)
+                    await pipe.execute()
+                logger.debug(f"Flushed {len(batch)} command(s)")
+            except Exception as e:
+                logger.error(f"Failed to flush {len(batch)} command(s): {e}")
+
+    async def aclose(self) -> None:
+        """
+        Flush pending publishes and stop the background flusher
+
+        Call this during application shutdown so queued events aren't lost.
+        The wait is bounded: a flusher that cannot make progress (Redis
+        down, or a task orphaned on another loop) is cancelled after
+        CLOSE_DRAIN_TIMEOUT instead of blocking shutdown forever.
+        """
+        task = self._flusher_task
+        if task is None:
+            return
+        self._flusher_task = None
+
+        try:
+            self._publish_queue.put_nowait(_CLOSE)
+            await asyncio.wait_for(task, timeout=CLOSE_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Event bus flusher did not drain within {CLOSE_DRAIN_TIMEOUT}s; "
+                f"{self._publish_queue.qsize()} command(s) dropped"
+            )
+        except (RuntimeError, ValueError):
+            # Flusher belongs to a different (closed) event loop and can't
+            # be awaited from here; it holds no resources beyond the queue
+            try:
+                task.cancel()
+            except RuntimeError:
+                pass
+
     async def stream_session_events(
         self, session_id: str, stop_event: asyncio.Event
-    ) -> AsyncIterator[Event]:
+    ) -> AsyncIterator[Tuple[Event, bytes]]:
         """
         Subscribe to a session channel and yield events as they arrive
 
         This is used by the SSE endpoint to stream events to clients.
+        Events arrive paired with their SSE bytes, serialized once in the
+        shared hub regardless of how many clients are streaming.
 
         Args:
             session_id: The session to subscribe to
             stop_event: Asyncio event to signal when to stop streaming
 
         Yields:
-            Event objects as they are published
+            (Event, sse_bytes) pairs as events are published
 
         Example:
             >>> stop = asyncio.Event()
-            >>> async for event in bus.stream_session_events("abc123", stop):
+            >>> async for event, sse in bus.stream_session_events("abc123", stop):
             ...     print(event.type)
         """
-        channel = session_channel(session_id)
         logger.info(f"Starting event stream for session {session_id}")
 
-        # Create a new Redis connection for this subscription
-        # (Redis Pub/Sub requires a dedicated connection)
-        pubsub_client = self.redis_client.pubsub()
+        # Subscribe through the shared hub: one pubsub connection per
+        # session regardless of how many clients are streaming it
+        hub = get_stream_hub()
+        queue = await hub.subscribe(session_id)
+        stop_task = asyncio.ensure_future(stop_event.wait())
 
         try:
-            # Subscribe to the session channel
-            await pubsub_client.subscribe(channel)
-            logger.debug(f"Subscribed to channel {channel}")
-
             # Send initial connection event
             initial_event = Event(
                 session_id=session_id,
                 type="session_stream_started",
                 payload={"message": "SSE connection established"},
             )
-            yield initial_event
+            yield initial_event, initial_event.to_sse_bytes()
 
-            # Listen for messages
             while not stop_event.is_set():
-                try:
-                    # Check for new messages with timeout
-                    message = await asyncio.wait_for(
-                        pubsub_client.get_message(
-                            ignore_subscribe_messages=True, timeout=0.1
-                        ),
-                        timeout=1.0,
+                get_task = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait(
+                    {get_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if get_task in done:
+                    event, sse = get_task.result()
+                    logger.debug(
+                        f"Received event {event.type} for session {session_id}"
                     )
-
-                    if message and message["type"] == "message":
-                        try:
-                            event = Event.from_json(message["data"])
-                            logger.debug(
-                                f"Received event {event.type} on {channel}"
-                            )
-                            yield event
-                        except Exception as e:
-                            logger.error(f"Failed to parse event: {e}")
-
-                except asyncio.TimeoutError:
-                    # No message received, continue waiting
-                    continue
-
-                # Allow other tasks to run
-                await asyncio.sleep(0)
+                    yield event, sse
+                else:
+                    get_task.cancel()
+                    break
 
         except Exception as e:
             logger.error(f"Error in event stream for {session_id}: {e}")
             raise
 
         finally:
-            # Clean up subscription
-            await pubsub_client.unsubscribe(channel)
-            await pubsub_client.close()
+            stop_task.cancel()
+            await hub.unsubscribe(session_id, queue)
             logger.info(f"Stopped event stream for session {session_id}")
 
 
@@ -168,7 +314,6 @@ def get_event_bus() -> EventBus:
         >>> bus = get_event_bus()
         >>> await bus.publish(event)
     """
-    from app.dependencies import get_redis_client
+    from app.dependencies import get_blocking_redis_client, get_redis_client
 
-    redis_client = get_redis_client()
-    return EventBus(redis_client)
+    return EventBus(get_redis_client(), get_blocking_redis_client())
@@ -40,6 +40,23 @@ def broadcast_channel() -> str:
     return "broadcast:all"
 
 
+def session_history_key(session_id: str) -> str:
+    """
+    Generate the Redis key for a session's recent-event list
+
+    Args:
+        session_id: The session identifier
+
+    Returns:
+        Redis key name (e.g., "session:abc123:events")
+
+    Example:
+        >>> session_history_key("abc123")
+        "session:abc123:events"
+    """
+    return f"session:{session_id}:events"
+
+
 def agent_channel(agent_name: str) -> str:
     """
     Generate channel name for a specific agent
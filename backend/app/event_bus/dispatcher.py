@@ -4,18 +4,150 @@ Event Dispatcher - High-Level API for Publishing Events
 This module provides the EventDispatcher class with convenient methods
 for publishing different types of events. It handles event normalization
 and delegates to the EventBus for actual publishing.
+
+The per-type methods share one shape — build a payload dict, construct an
+Event, publish — so they are generated once at import time from the
+EVENT_SCHEMAS table below instead of being hand-written. Each generated
+method is a single specialized coroutine (no generic **kwargs indirection),
+and new event types only need a schema entry.
 """
 
 import logging
-from datetime import datetime
-from functools import lru_cache
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import msgspec
 
 from .bus import get_event_bus
 from .schema import Event
 
 logger = logging.getLogger(__name__)
 
+# Sentinel marking a schema field with no default (required argument)
+_REQUIRED = object()
+
+# Payload schema per event type: field order defines the method signature
+# after session_id. "include_session_id" mirrors session_id into the
+# payload; "empty_dict_fields" get the `value or {}` treatment.
+# "pooled_payload" reuses one payload dict across calls for the dense
+# per-token delta streams — safe because publish_nowait serializes the
+# event before returning, so the dict is never read after the call.
+EVENT_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "session_started": {
+        "fields": (("agent", _REQUIRED), ("metadata", None)),
+        "include_session_id": True,
+        "empty_dict_fields": ("metadata",),
+    },
+    "session_ended": {
+        "fields": (("reason", _REQUIRED), ("summary", None)),
+        "include_session_id": True,
+    },
+    "agent_message_start": {
+        "fields": (("message_id", _REQUIRED), ("agent", _REQUIRED)),
+        "payload_order": ("agent", "message_id"),
+    },
+    "agent_message_delta": {
+        "fields": (("message_id", _REQUIRED), ("delta", _REQUIRED)),
+        "pooled_payload": True,
+    },
+    "tool_call_started": {
+        "fields": (
+            ("tool_call_id", _REQUIRED),
+            ("tool_name", _REQUIRED),
+            ("args", _REQUIRED),
+            ("agent", _REQUIRED),
+        ),
+        "payload_order": ("tool_call_id", "tool_name", "agent", "args"),
+    },
+    "tool_call_delta": {
+        "fields": (("tool_call_id", _REQUIRED), ("delta", _REQUIRED)),
+        "pooled_payload": True,
+    },
+    "tool_call_result": {
+        "fields": (
+            ("tool_call_id", _REQUIRED),
+            ("tool_name", _REQUIRED),
+            ("result", _REQUIRED),
+            ("error", None),
+        ),
+    },
+    "workflow_started": {
+        "fields": (("workflow", _REQUIRED), ("run_id", _REQUIRED)),
+    },
+    "workflow_step_started": {
+        "fields": (
+            ("run_id", _REQUIRED),
+            ("step_id", _REQUIRED),
+            ("description", _REQUIRED),
+        ),
+    },
+    "workflow_step_completed": {
+        "fields": (
+            ("run_id", _REQUIRED),
+            ("step_id", _REQUIRED),
+            ("output", _REQUIRED),
+        ),
+    },
+    "workflow_transition": {
+        "fields": (
+            ("run_id", _REQUIRED),
+            ("from_step", _REQUIRED),
+            ("to_step", _REQUIRED),
+            ("reason", _REQUIRED),
+        ),
+    },
+    "workflow_completed": {
+        "fields": (("run_id", _REQUIRED), ("result", _REQUIRED)),
+    },
+    "agent_thought": {
+        "fields": (
+            ("agent", _REQUIRED),
+            ("content", _REQUIRED),
+            ("debug", True),
+        ),
+    },
+    "run_error": {
+        "fields": (
+            ("error_type", _REQUIRED),
+            ("message", _REQUIRED),
+            ("agent", _REQUIRED),
+            ("step", None),
+            ("traceback", None),
+        ),
+    },
+    "run_retry": {
+        "fields": (
+            ("retry_count", _REQUIRED),
+            ("max_retries", _REQUIRED),
+            ("reason", _REQUIRED),
+        ),
+    },
+    "run_interrupted": {
+        "fields": (("reason", _REQUIRED), ("step", None)),
+    },
+    "retrieval_started": {
+        "fields": (("query", _REQUIRED), ("agent", _REQUIRED)),
+    },
+    "retrieval_result": {
+        "fields": (("documents", _REQUIRED),),
+    },
+    "automation_triggered": {
+        "fields": (("workflow", _REQUIRED), ("trigger", _REQUIRED)),
+    },
+    "automation_completed": {
+        "fields": (("workflow", _REQUIRED), ("result", _REQUIRED)),
+    },
+    "metrics_update": {
+        "fields": (
+            ("cpu", _REQUIRED),
+            ("memory_used", _REQUIRED),
+            ("disk_free", _REQUIRED),
+            ("containers_running", _REQUIRED),
+            ("extra", None),
+        ),
+        "empty_dict_fields": ("extra",),
+    },
+}
+
 
 class EventDispatcher:
     """
@@ -23,6 +155,9 @@ class EventDispatcher:
 
     The EventDispatcher provides type-specific methods for each event type,
     handling the conversion from domain events to the unified Event format.
+    Methods are generated from EVENT_SCHEMAS at import time; only events
+    with extra behavior (agent_message_end persists as well) are written
+    by hand.
 
     Example:
         >>> dispatcher = get_event_dispatcher()
@@ -39,83 +174,28 @@ class EventDispatcher:
         """Initialize the EventDispatcher"""
         self.bus = get_event_bus()
 
-    # ========================================================================
-    # Session Events
-    # ========================================================================
+    async def publish_batch(self, events) -> None:
+        """Publish prebuilt events as one pipelined batch
 
-    async def session_started(
-        self,
-        session_id: str,
-        agent: str,
-        metadata: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Publish a session_started event"""
-        event = Event(
-            session_id=session_id,
-            type="session_started",
-            payload={
-                "session_id": session_id,
-                "agent": agent,
-                "metadata": metadata or {},
-            },
-        )
-        await self.bus.publish(event)
+        For callers that already hold a sequence of Event objects;
+        everything lands in a single Redis pipeline flush.
+        """
+        await self.bus.publish_batch(events)
 
-    async def session_ended(
-        self,
-        session_id: str,
-        reason: str,
-        summary: Optional[str] = None,
-    ) -> None:
-        """Publish a session_ended event"""
-        event = Event(
-            session_id=session_id,
-            type="session_ended",
-            payload={
-                "session_id": session_id,
-                "reason": reason,
-                "summary": summary,
-            },
-        )
-        await self.bus.publish(event)
+    def batch(self) -> "EventBatch":
+        """Collect dispatcher calls and flush them as one batch
 
-    # ========================================================================
-    # Agent Message Events
-    # ========================================================================
+        Returns an async context manager exposing the same per-type
+        methods as the dispatcher; events queue up locally and are handed
+        to the bus together on exit, so the whole block shares one
+        pipelined round trip.
 
-    async def agent_message_start(
-        self,
-        session_id: str,
-        message_id: str,
-        agent: str,
-    ) -> None:
-        """Publish an agent_message_start event"""
-        event = Event(
-            session_id=session_id,
-            type="agent_message_start",
-            payload={
-                "agent": agent,
-                "message_id": message_id,
-            },
-        )
-        await self.bus.publish(event)
-
-    async def agent_message_delta(
-        self,
-        session_id: str,
-        message_id: str,
-        delta: str,
-    ) -> None:
-        """Publish an agent_message_delta event"""
-        event = Event(
-            session_id=session_id,
-            type="agent_message_delta",
-            payload={
-                "message_id": message_id,
-                "delta": delta,
-            },
-        )
-        await self.bus.publish(event)
+        Example:
+            >>> async with dispatcher.batch() as b:
+            ...     await b.workflow_started(session_id, workflow="w", run_id="r")
+            ...     await b.workflow_completed(session_id, run_id="r", result={})
+        """
+        return EventBatch(self.bus)
 
     async def agent_message_end(
         self,
@@ -123,7 +203,11 @@ class EventDispatcher:
         message_id: str,
         content: str,
     ) -> None:
-        """Publish an agent_message_end event"""
+        """Publish an agent_message_end event
+
+        The final message is also persisted to the session's recent-event
+        list; delivery and persistence share one pipeline.
+        """
         event = Event(
             session_id=session_id,
             type="agent_message_end",
@@ -132,357 +216,120 @@ class EventDispatcher:
                 "content": content,
             },
         )
-        await self.bus.publish(event)
-
-    # ========================================================================
-    # Tool Execution Events
-    # ========================================================================
-
-    async def tool_call_started(
-        self,
-        session_id: str,
-        tool_call_id: str,
-        tool_name: str,
-        args: Dict[str, Any],
-        agent: str,
-    ) -> None:
-        """Publish a tool_call_started event"""
-        event = Event(
-            session_id=session_id,
-            type="tool_call_started",
-            payload={
-                "tool_call_id": tool_call_id,
-                "tool_name": tool_name,
-                "agent": agent,
-                "args": args,
-            },
+        await self.bus.publish_and_persist(event)
+
+
+def _make_publisher(event_type: str, spec: Dict[str, Any]):
+    """Build a specialized publisher coroutine for one event type"""
+    fields: Tuple[Tuple[str, Any], ...] = spec["fields"]
+    empty_dict_fields = spec.get("empty_dict_fields", ())
+
+    params = ["self", "session_id"]
+    for name, default in fields:
+        params.append(name if default is _REQUIRED else f"{name}={default!r}")
+
+    payload_names = spec.get("payload_order", [name for name, _ in fields])
+    payload_items = []
+    if spec.get("include_session_id"):
+        payload_items.append('"session_id": session_id')
+    for name in payload_names:
+        value = f"{name} or {{}}" if name in empty_dict_fields else name
+        payload_items.append(f'"{name}": {value}')
+
+    article = "an" if event_type[0] in "aeiou" else "a"
+    if spec.get("pooled_payload"):
+        # One dict per method, overwritten in place each call: the key set
+        # is fixed and publish_nowait serializes synchronously, so nothing
+        # holds a reference to the dict between publishes
+        assigns = "\n".join(
+            f'    _payload["{name}"] = {name}' for name in payload_names
         )
-        await self.bus.publish(event)
-
-    async def tool_call_delta(
-        self,
-        session_id: str,
-        tool_call_id: str,
-        delta: str,
-    ) -> None:
-        """Publish a tool_call_delta event"""
-        event = Event(
-            session_id=session_id,
-            type="tool_call_delta",
-            payload={
-                "tool_call_id": tool_call_id,
-                "delta": delta,
-            },
+        source = (
+            f"async def {event_type}({', '.join(params)}) -> None:\n"
+            f'    """Publish {article} {event_type} event"""\n'
+            f"{assigns}\n"
+            f"    self.bus.publish_nowait(Event(\n"
+            f"        session_id=session_id,\n"
+            f'        type="{event_type}",\n'
+            f"        payload=_payload,\n"
+            f"    ))\n"
         )
-        await self.bus.publish(event)
-
-    async def tool_call_result(
-        self,
-        session_id: str,
-        tool_call_id: str,
-        tool_name: str,
-        result: Any,
-        error: Optional[str] = None,
-    ) -> None:
-        """Publish a tool_call_result event"""
-        event = Event(
-            session_id=session_id,
-            type="tool_call_result",
-            payload={
-                "tool_call_id": tool_call_id,
-                "tool_name": tool_name,
-                "result": result,
-                "error": error,
-            },
+    else:
+        source = (
+            f"async def {event_type}({', '.join(params)}) -> None:\n"
+            f'    """Publish {article} {event_type} event"""\n'
+            f"    await self.bus.publish(Event(\n"
+            f"        session_id=session_id,\n"
+            f'        type="{event_type}",\n'
+            f"        payload={{{', '.join(payload_items)}}},\n"
+            f"    ))\n"
         )
-        await self.bus.publish(event)
+    namespace = {"Event": Event, "_payload": {}}
+    exec(source, namespace)
+    return namespace[event_type]
 
-    # ========================================================================
-    # Workflow Events
-    # ========================================================================
 
-    async def workflow_started(
-        self,
-        session_id: str,
-        workflow: str,
-        run_id: str,
-    ) -> None:
-        """Publish a workflow_started event"""
-        event = Event(
-            session_id=session_id,
-            type="workflow_started",
-            payload={
-                "workflow": workflow,
-                "run_id": run_id,
-            },
-        )
-        await self.bus.publish(event)
+for _event_type, _spec in EVENT_SCHEMAS.items():
+    setattr(EventDispatcher, _event_type, _make_publisher(_event_type, _spec))
 
-    async def workflow_step_started(
-        self,
-        session_id: str,
-        run_id: str,
-        step_id: str,
-        description: str,
-    ) -> None:
-        """Publish a workflow_step_started event"""
-        event = Event(
-            session_id=session_id,
-            type="workflow_step_started",
-            payload={
-                "run_id": run_id,
-                "step_id": step_id,
-                "description": description,
-            },
-        )
-        await self.bus.publish(event)
 
-    async def workflow_step_completed(
-        self,
-        session_id: str,
-        run_id: str,
-        step_id: str,
-        output: Any,
-    ) -> None:
-        """Publish a workflow_step_completed event"""
-        event = Event(
-            session_id=session_id,
-            type="workflow_step_completed",
-            payload={
-                "run_id": run_id,
-                "step_id": step_id,
-                "output": output,
-            },
-        )
-        await self.bus.publish(event)
+class _BatchSink:
+    """Bus stand-in that records events instead of queueing them"""
 
-    async def workflow_transition(
-        self,
-        session_id: str,
-        run_id: str,
-        from_step: str,
-        to_step: str,
-        reason: str,
-    ) -> None:
-        """Publish a workflow_transition event"""
-        event = Event(
-            session_id=session_id,
-            type="workflow_transition",
-            payload={
-                "run_id": run_id,
-                "from_step": from_step,
-                "to_step": to_step,
-                "reason": reason,
-            },
-        )
-        await self.bus.publish(event)
-
-    async def workflow_completed(
-        self,
-        session_id: str,
-        run_id: str,
-        result: Dict[str, Any],
-    ) -> None:
-        """Publish a workflow_completed event"""
-        event = Event(
-            session_id=session_id,
-            type="workflow_completed",
-            payload={
-                "run_id": run_id,
-                "result": result,
-            },
-        )
-        await self.bus.publish(event)
-
-    # ========================================================================
-    # Agent Thinking / Reasoning
-    # ========================================================================
-
-    async def agent_thought(
-        self,
-        session_id: str,
-        agent: str,
-        content: str,
-        debug: bool = True,
-    ) -> None:
-        """Publish an agent_thought event"""
-        event = Event(
-            session_id=session_id,
-            type="agent_thought",
-            payload={
-                "agent": agent,
-                "content": content,
-                "debug": debug,
-            },
-        )
-        await self.bus.publish(event)
+    __slots__ = ("events", "persisted")
 
-    # ========================================================================
-    # Error, Retry & Interrupt Events
-    # ========================================================================
-
-    async def run_error(
-        self,
-        session_id: str,
-        error_type: str,
-        message: str,
-        agent: str,
-        step: Optional[str] = None,
-        traceback: Optional[str] = None,
-    ) -> None:
-        """Publish a run_error event"""
-        event = Event(
-            session_id=session_id,
-            type="run_error",
-            payload={
-                "error_type": error_type,
-                "message": message,
-                "agent": agent,
-                "step": step,
-                "traceback": traceback,
-            },
+    def __init__(self):
+        self.events: List[Event] = []
+        self.persisted: List[Event] = []
+
+    def publish_nowait(self, event: Event, broadcast: bool = False) -> None:
+        # Pooled-payload publishers reuse one dict per method; snapshot it
+        # here because the event outlives the call instead of being
+        # serialized immediately
+        self.events.append(
+            msgspec.structs.replace(event, payload=dict(event.payload))
         )
-        await self.bus.publish(event)
 
-    async def run_retry(
-        self,
-        session_id: str,
-        retry_count: int,
-        max_retries: int,
-        reason: str,
-    ) -> None:
-        """Publish a run_retry event"""
-        event = Event(
-            session_id=session_id,
-            type="run_retry",
-            payload={
-                "retry_count": retry_count,
-                "max_retries": max_retries,
-                "reason": reason,
-            },
-        )
-        await self.bus.publish(event)
+    async def publish(self, event: Event, broadcast: bool = False) -> None:
+        self.events.append(event)
 
-    async def run_interrupted(
-        self,
-        session_id: str,
-        reason: str,
-        step: Optional[str] = None,
+    async def publish_and_persist(
+        self, event: Event, broadcast: bool = False
     ) -> None:
-        """Publish a run_interrupted event"""
-        event = Event(
-            session_id=session_id,
-            type="run_interrupted",
-            payload={
-                "reason": reason,
-                "step": step,
-            },
-        )
-        await self.bus.publish(event)
+        self.persisted.append(event)
 
-    # ========================================================================
-    # Knowledge Base / RAG Events
-    # ========================================================================
 
-    async def retrieval_started(
-        self,
-        session_id: str,
-        query: str,
-        agent: str,
-    ) -> None:
-        """Publish a retrieval_started event"""
-        event = Event(
-            session_id=session_id,
-            type="retrieval_started",
-            payload={
-                "query": query,
-                "agent": agent,
-            },
-        )
-        await self.bus.publish(event)
+class EventBatch(EventDispatcher):
+    """
+    Batched view of the dispatcher API
 
-    async def retrieval_result(
-        self,
-        session_id: str,
-        documents: list,
-    ) -> None:
-        """Publish a retrieval_result event"""
-        event = Event(
-            session_id=session_id,
-            type="retrieval_result",
-            payload={
-                "documents": documents,
-            },
-        )
-        await self.bus.publish(event)
+    Inherits every generated per-type method, but routes them into a
+    local collector; the whole batch is handed to the real bus when the
+    `async with` block exits cleanly (and dropped on error, matching
+    pipeline semantics). Created via EventDispatcher.batch().
+    """
 
-    # ========================================================================
-    # n8n Automation Events
-    # ========================================================================
+    def __init__(self, bus):
+        self._target = bus
+        self.bus = _BatchSink()
 
-    async def automation_triggered(
-        self,
-        session_id: str,
-        workflow: str,
-        trigger: str,
-    ) -> None:
-        """Publish an automation_triggered event"""
-        event = Event(
-            session_id=session_id,
-            type="automation_triggered",
-            payload={
-                "workflow": workflow,
-                "trigger": trigger,
-            },
-        )
-        await self.bus.publish(event)
+    async def __aenter__(self) -> "EventBatch":
+        return self
 
-    async def automation_completed(
-        self,
-        session_id: str,
-        workflow: str,
-        result: str,
-    ) -> None:
-        """Publish an automation_completed event"""
-        event = Event(
-            session_id=session_id,
-            type="automation_completed",
-            payload={
-                "workflow": workflow,
-                "result": result,
-            },
-        )
-        await self.bus.publish(event)
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            sink = self.bus
+            await self._target.publish_batch(sink.events)
+            for event in sink.persisted:
+                await self._target.publish_and_persist(event)
+        return False
 
-    # ========================================================================
-    # System Metrics / Infrastructure Monitor
-    # ========================================================================
 
-    async def metrics_update(
-        self,
-        session_id: str,
-        cpu: float,
-        memory_used: str,
-        disk_free: str,
-        containers_running: int,
-        extra: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Publish a metrics_update event"""
-        event = Event(
-            session_id=session_id,
-            type="metrics_update",
-            payload={
-                "cpu": cpu,
-                "memory_used": memory_used,
-                "disk_free": disk_free,
-                "containers_running": containers_running,
-                "extra": extra or {},
-            },
-        )
-        await self.bus.publish(event)
+# Built on first use rather than at import so the underlying EventBus
+# queue binds to the running event loop, not an import-time one
+_dispatcher: Optional[EventDispatcher] = None
 
 
-@lru_cache
 def get_event_dispatcher() -> EventDispatcher:
     """
     Get or create the singleton EventDispatcher instance
@@ -494,4 +341,7 @@ def get_event_dispatcher() -> EventDispatcher:
         >>> dispatcher = get_event_dispatcher()
         >>> await dispatcher.tool_call_started(...)
     """
-    return EventDispatcher()
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = EventDispatcher()
+    return _dispatcher
@@ -5,40 +5,76 @@ This module defines the unified Event structure used throughout the system.
 All events are normalized to this format before being published to the event bus.
 """
 
-import json
-from datetime import datetime
-from typing import Any, Dict
-from uuid import UUID, uuid4
+import itertools
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Tuple
 
-from pydantic import BaseModel, Field
+import msgspec
 
+# Bound once: datetime.now(_UTC) skips the module attribute lookup and,
+# unlike the deprecated utcnow(), yields an aware datetime that encoders
+# can serialize without a timezone fixup
+_UTC = timezone.utc
 
-class Event(BaseModel):
+
+def _utc_now() -> datetime:
+    """Current aware UTC timestamp"""
+    return datetime.now(_UTC)
+
+# Event IDs come from a time-seeded process counter instead of uuid4:
+# no urandom read and no UUID hex formatting per event, while staying
+# unique across processes (boot timestamp) and within one (counter).
+_BOOT_NS = time.time_ns()
+_COUNTER = itertools.count()
+
+
+def _next_event_id() -> str:
+    """Generate a process-unique event ID without touching urandom"""
+    return f"{_BOOT_NS:x}-{next(_COUNTER):x}"
+
+# Codec instances are built once at import time; per-call
+# msgspec.json.encode/decode would re-resolve the target type each time
+_encoder = msgspec.json.Encoder()
+
+# SSE header bytes per event type. Types form a small closed set (the
+# dispatcher methods), so each header is formatted once and reused for
+# every event of that type on the streaming path.
+_SSE_PREFIX: Dict[str, bytes] = {}
+
+
+def _sse_prefix(event_type: str) -> bytes:
+    """Get the cached b"event: <type>\\ndata: " header for an event type"""
+    prefix = _SSE_PREFIX.get(event_type)
+    if prefix is None:
+        prefix = _SSE_PREFIX[event_type] = f"event: {event_type}\ndata: ".encode()
+    return prefix
+
+
+class Event(msgspec.Struct, frozen=True):
     """
     Unified event structure for the Event Bus
 
     This is the normalized event format that flows through Redis Pub/Sub
-    and is streamed to clients via SSE.
+    and is streamed to clients via SSE. It's a msgspec Struct rather than
+    a pydantic model: events are constructed and decoded on every publish
+    and every SSE delivery, and msgspec's C implementation makes both
+    several times cheaper. Pydantic stays on the FastAPI request/response
+    models where the framework integration matters.
 
     Attributes:
-        event_id: Unique identifier for this event
         session_id: Session this event belongs to
-        timestamp: When the event occurred (UTC)
         type: Event type (e.g., 'tool_call_started', 'agent_message_delta')
         payload: Event-specific data as a dictionary
+        event_id: Unique identifier for this event
+        timestamp: When the event occurred (UTC)
     """
 
-    event_id: str = Field(default_factory=lambda: str(uuid4()))
     session_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
     type: str
     payload: Dict[str, Any]
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-        }
+    event_id: str = msgspec.field(default_factory=_next_event_id)
+    timestamp: datetime = msgspec.field(default_factory=_utc_now)
 
     def to_sse(self) -> str:
         """
@@ -49,31 +85,65 @@ class Event(BaseModel):
 
         Example:
             event: tool_call_started
-            data: {"event_id":"123","session_id":"abc",...}
+            data: {"session_id":"abc","type":"tool_call_started",...}
+
+        """
+        return self.to_sse_bytes().decode()
+
+    def to_sse_bytes(self) -> bytes:
+        """
+        Convert event to SSE format as bytes
+
+        Yielding bytes from the streaming response lets Starlette forward
+        chunks unmodified instead of utf-8 encoding each one.
 
+        Returns:
+            SSE-formatted bytes ready to send to clients
         """
-        data = self.model_dump(mode="json")
-        return f"event: {self.type}\ndata: {json.dumps(data)}\n\n"
+        return _sse_prefix(self.type) + _encoder.encode(self) + b"\n\n"
 
-    def to_json(self) -> str:
+    def to_json(self) -> bytes:
         """
-        Convert event to JSON string
+        Convert event to JSON bytes
 
         Returns:
-            JSON-serialized event
+            JSON-serialized event (Redis accepts bytes directly, so no
+            decode step on the publish path)
         """
-        return json.dumps(self.model_dump(mode="json"))
+        return _encoder.encode(self)
 
     @classmethod
-    def from_json(cls, json_str: str) -> "Event":
+    def from_json(cls, data) -> "Event":
         """
-        Create Event from JSON string
+        Create Event from JSON
 
         Args:
-            json_str: JSON-serialized event
+            data: JSON-serialized event as str or bytes
 
         Returns:
             Event instance
         """
-        data = json.loads(json_str)
-        return cls(**data)
+        return _decoder.decode(data)
+
+    @classmethod
+    def from_wire(cls, data) -> Tuple["Event", bytes]:
+        """
+        Decode a pubsub payload and build its SSE frame in one step
+
+        The wire payload already is the event's JSON, so the SSE frame is
+        assembled by concatenating the cached header around those bytes
+        instead of running a second encoder pass over the struct.
+
+        Args:
+            data: JSON-serialized event as str or bytes, as received from
+                Redis Pub/Sub
+
+        Returns:
+            (Event, sse_bytes) pair
+        """
+        event = _decoder.decode(data)
+        raw = data.encode() if isinstance(data, str) else data
+        return event, _sse_prefix(event.type) + raw + b"\n\n"
+
+
+_decoder = msgspec.json.Decoder(Event)
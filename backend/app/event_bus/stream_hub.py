@@ -0,0 +1,154 @@
+"""
+Shared Pub/Sub fanout for session event streams
+
+Each SSE connection used to open its own Redis Pub/Sub subscription, so N
+browser tabs on the same session meant N Redis connections and N parses of
+every message. The StreamHub keeps one subscription per session and fans
+parsed events out to bounded per-subscriber queues.
+"""
+
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Dict, Set, Tuple
+
+import redis.asyncio as redis
+
+from .channels import session_channel
+from .schema import Event
+
+logger = logging.getLogger(__name__)
+
+# Max events buffered per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class StreamHub:
+    """
+    Fan one Redis Pub/Sub subscription per session out to many subscribers
+
+    The first subscriber for a session creates the pubsub connection and a
+    background pump task that parses and SSE-serializes each message once,
+    pushing an (Event, sse_bytes) pair onto every subscriber queue — so
+    serialization cost stays O(1) in the subscriber count. The last
+    unsubscribe tears both down.
+
+    Attributes:
+        redis_client: Async Redis client instance
+    """
+
+    def __init__(self, redis_client: redis.Redis):
+        """
+        Initialize the Stream Hub
+
+        Args:
+            redis_client: Async Redis client instance
+        """
+        self.redis_client = redis_client
+        self._sessions: Dict[
+            str, Tuple[redis.client.PubSub, asyncio.Task, Set[asyncio.Queue]]
+        ] = {}
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, session_id: str) -> asyncio.Queue:
+        """
+        Register a subscriber for a session and return its event queue
+
+        Args:
+            session_id: The session to subscribe to
+
+        Returns:
+            Bounded queue that receives (Event, sse_bytes) pairs as events
+            are published
+
+        Example:
+            >>> queue = await hub.subscribe("abc123")
+            >>> event, sse = await queue.get()
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        async with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                pubsub_client = self.redis_client.pubsub()
+                await pubsub_client.subscribe(session_channel(session_id))
+                subscribers: Set[asyncio.Queue] = set()
+                pump_task = asyncio.create_task(
+                    self._pump(session_id, pubsub_client, subscribers)
+                )
+                entry = (pubsub_client, pump_task, subscribers)
+                self._sessions[session_id] = entry
+                logger.debug(f"Opened shared subscription for session {session_id}")
+            entry[2].add(queue)
+        return queue
+
+    async def unsubscribe(self, session_id: str, queue: asyncio.Queue) -> None:
+        """
+        Remove a subscriber, closing the shared subscription if it's the last
+
+        Args:
+            session_id: The session the queue was subscribed to
+            queue: The queue returned by subscribe()
+        """
+        async with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return
+            pubsub_client, pump_task, subscribers = entry
+            subscribers.discard(queue)
+            if subscribers:
+                return
+            del self._sessions[session_id]
+
+        pump_task.cancel()
+        try:
+            await pubsub_client.unsubscribe(session_channel(session_id))
+            await pubsub_client.close()
+        except Exception as e:
+            logger.error(f"Error closing subscription for {session_id}: {e}")
+        logger.debug(f"Closed shared subscription for session {session_id}")
+
+    async def _pump(
+        self,
+        session_id: str,
+        pubsub_client,
+        subscribers: Set[asyncio.Queue],
+    ) -> None:
+        """Parse and serialize each pubsub message once, then fan it out"""
+        try:
+            async for message in pubsub_client.listen():
+                if message["type"] != "message":
+                    continue
+                try:
+                    # SSE frame built from the wire bytes themselves; no
+                    # re-encode, and one frame shared by every subscriber
+                    item = Event.from_wire(message["data"])
+                except Exception as e:
+                    logger.error(f"Failed to parse event: {e}")
+                    continue
+                for queue in subscribers:
+                    try:
+                        queue.put_nowait(item)
+                    except asyncio.QueueFull:
+                        # Drop the oldest event rather than stalling the pump
+                        queue.get_nowait()
+                        queue.put_nowait(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Stream hub pump failed for session {session_id}: {e}")
+
+
+@lru_cache
+def get_stream_hub() -> StreamHub:
+    """
+    Get or create the singleton StreamHub instance
+
+    This function is cached, so it will return the same instance
+    across the application lifecycle.
+
+    Returns:
+        StreamHub instance
+    """
+    from app.dependencies import get_blocking_redis_client
+
+    return StreamHub(get_blocking_redis_client())
@@ -1,15 +1,15 @@
 """FastAPI application entry point"""
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.api.routes import health, agents, chat, webhooks, copilotkit, events
+from app.middleware.cors import StaticCORSMiddleware
 from app.middleware.error_handler import setup_error_handlers
 from app.middleware.logging import setup_logging
 from app.middleware.rate_limit import RateLimitMiddleware
-from app.middleware.metrics import MetricsMiddleware, get_metrics
+from app.middleware.metrics import MetricsMiddleware, get_metrics, start_metrics_flusher
 from app.services.langfuse_setup import setup_opentelemetry, shutdown_opentelemetry
 from fastapi.responses import Response
 
@@ -20,19 +20,16 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson encodes the large nested agent/metric payloads several times
+    # faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # Setup OpenTelemetry for Langfuse
 setup_opentelemetry(app)
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:3001"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware (allowed origins precomputed in middleware/cors.py)
+app.add_middleware(StaticCORSMiddleware)
 
 # Setup middleware
 setup_logging(app)
@@ -58,7 +55,7 @@ async def metrics():
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "message": "ADK Dev Environment Manager API",
             "version": "0.1.0",
@@ -67,9 +64,29 @@ async def root():
     )
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Warm shared resources so first requests don't pay construction costs"""
+    from app.agents import get_agent_registry
+    from app.middleware.auth import get_supabase_client
+
+    get_agent_registry()
+    get_supabase_client()
+    start_metrics_flusher()
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
+    from app.event_bus import get_event_bus
+    from app.services import db_pool
+    from app.services.http import close_http
+    from app.services.session_service import session_service
+
+    await get_event_bus().aclose()
+    await session_service.aclose()
+    await db_pool.close_pool()
+    await close_http()
     shutdown_opentelemetry()
 
 
@@ -81,5 +98,9 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        # Pin the C implementations (bundled with uvicorn[standard])
+        # rather than relying on auto-detection
+        loop="uvloop",
+        http="httptools",
     )
 
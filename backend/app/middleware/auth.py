@@ -1,8 +1,11 @@
 """Authentication middleware with Supabase Auth and RBAC"""
 
+import asyncio
+import threading
+import time
 from fastapi import Request, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from enum import Enum
 import logging
 from supabase import create_client, Client
@@ -11,21 +14,40 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Verified tokens are cached briefly so repeated requests with the same
+# bearer token skip verification entirely
+AUTH_CACHE_TTL = 60.0
+AUTH_CACHE_MAX_ENTRIES = 10_000
+_auth_cache: Dict[str, Tuple[float, "UserContext"]] = {}
+
+# Cap concurrent remote verification calls so a burst of cold tokens
+# can't exhaust the thread pool or Supabase's connection limits; with
+# local JWT verification and the cache, this path is rarely taken
+_SUPABASE_AUTH_CONCURRENCY = 32
+_supabase_auth_semaphore = asyncio.Semaphore(_SUPABASE_AUTH_CONCURRENCY)
+
 # Security scheme
 security = HTTPBearer(auto_error=False)
 
 # Supabase client for auth
 supabase_client: Optional[Client] = None
+_supabase_client_lock = threading.Lock()
 
 
 def get_supabase_client() -> Client:
-    """Get or create Supabase client for authentication"""
+    """Get or create Supabase client for authentication
+
+    Warmed at application startup; the lock is a defensive fallback so
+    concurrent first calls can't race and build duplicate clients.
+    """
     global supabase_client
     if supabase_client is None:
-        supabase_client = create_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_ANON_KEY
-        )
+        with _supabase_client_lock:
+            if supabase_client is None:
+                supabase_client = create_client(
+                    settings.SUPABASE_URL,
+                    settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_ANON_KEY
+                )
     return supabase_client
 
 
@@ -37,25 +59,31 @@ class Role(str, Enum):
     SERVICE = "service"  # For service-to-service auth
 
 
+# Roles each role is allowed to act as; built once instead of per check
+_ROLE_HIERARCHY: Dict[Role, frozenset] = {
+    Role.USER: frozenset({Role.USER}),
+    Role.AGENT: frozenset({Role.USER, Role.AGENT}),
+    Role.ADMIN: frozenset({Role.USER, Role.AGENT, Role.ADMIN}),
+    Role.SERVICE: frozenset({Role.SERVICE}),
+}
+_NO_ROLES: frozenset = frozenset()
+
+
 class UserContext:
     """User context from authenticated request"""
-    
+
+    __slots__ = ("user_id", "email", "role", "metadata", "tenant_id")
+
     def __init__(self, user_id: str, email: str, role: Role, metadata: Dict[str, Any] = None, tenant_id: Optional[str] = None):
         self.user_id = user_id
         self.email = email
         self.role = role
         self.metadata = metadata or {}
         self.tenant_id = tenant_id  # Multi-tenancy support
-    
+
     def has_role(self, required_role: Role) -> bool:
         """Check if user has required role"""
-        role_hierarchy = {
-            Role.USER: [Role.USER],
-            Role.AGENT: [Role.USER, Role.AGENT],
-            Role.ADMIN: [Role.USER, Role.AGENT, Role.ADMIN],
-            Role.SERVICE: [Role.SERVICE],
-        }
-        return required_role in role_hierarchy.get(self.role, [])
+        return required_role in _ROLE_HIERARCHY.get(self.role, _NO_ROLES)
 
 
 async def get_current_user(
@@ -69,39 +97,71 @@ async def get_current_user(
     """
     if not credentials:
         return None
-    
+
+    token = credentials.credentials
+
+    # Serve repeat requests from the verification cache
+    now = time.monotonic()
+    cached = _auth_cache.get(token)
+    if cached is not None and now - cached[0] < AUTH_CACHE_TTL:
+        return cached[1]
+
     try:
-        token = credentials.credentials
-        supabase = get_supabase_client()
-        
-        # Verify token with Supabase
-        user_response = supabase.auth.get_user(token)
-        
-        if not user_response or not user_response.user:
-            logger.warning("Invalid token: user not found")
-            return None
-        
-        user = user_response.user
-        user_metadata = user.user_metadata or {}
-        
+        if settings.SUPABASE_JWT_SECRET:
+            # Verify signature and expiry locally — no network round trip
+            claims = jwt.decode(
+                token,
+                settings.SUPABASE_JWT_SECRET,
+                algorithms=["HS256"],
+                options={"verify_aud": False},
+            )
+            user_metadata = claims.get("user_metadata") or {}
+            user_id = claims.get("sub")
+            email = claims.get("email") or ""
+            app_metadata = claims.get("app_metadata") or {}
+        else:
+            # Fall back to remote verification, off the event loop since
+            # supabase-py is synchronous
+            supabase = get_supabase_client()
+            async with _supabase_auth_semaphore:
+                user_response = await asyncio.to_thread(
+                    supabase.auth.get_user, token
+                )
+
+            if not user_response or not user_response.user:
+                logger.warning("Invalid token: user not found")
+                return None
+
+            user = user_response.user
+            user_metadata = user.user_metadata or {}
+            user_id = user.id
+            email = user.email or ""
+            app_metadata = getattr(user, "app_metadata", {}) or {}
+
         # Extract role from metadata or default to USER
         role_str = user_metadata.get("role", "user")
         try:
             role = Role(role_str.lower())
         except ValueError:
             role = Role.USER
-        
+
         # Extract tenant_id from metadata or app_metadata
-        tenant_id = user_metadata.get("tenant_id") or getattr(user, "app_metadata", {}).get("tenant_id")
-        
-        return UserContext(
-            user_id=user.id,
-            email=user.email or "",
+        tenant_id = user_metadata.get("tenant_id") or app_metadata.get("tenant_id")
+
+        context = UserContext(
+            user_id=user_id,
+            email=email,
             role=role,
             metadata=user_metadata,
             tenant_id=tenant_id
         )
-    
+
+        if len(_auth_cache) >= AUTH_CACHE_MAX_ENTRIES:
+            _auth_cache.clear()
+        _auth_cache[token] = (now, context)
+
+        return context
+
     except JWTError as e:
         logger.warning(f"JWT decode error: {e}")
         return None
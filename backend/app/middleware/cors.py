@@ -0,0 +1,89 @@
+"""CORS middleware specialized for the fixed dev origin set"""
+
+ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+# The origin set is small and known at import time, so matching is a
+# frozenset lookup and the response headers are precomputed byte tuples
+# instead of Starlette's per-request list scan and header building
+ALLOWED_ORIGINS = frozenset(
+    {
+        b"http://localhost:3000",
+        b"http://localhost:3001",
+    }
+)
+
+# Credentials are allowed, so methods/headers must be explicit (the spec
+# forbids the * wildcard with credentials) and responses vary by Origin
+_PREFLIGHT_HEADERS = (
+    (b"access-control-allow-methods", ALLOW_METHODS),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"Origin"),
+)
+_RESPONSE_HEADERS = (
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+)
+
+
+class StaticCORSMiddleware:
+    """Pure-ASGI CORS middleware over a precomputed origin set
+
+    Handles preflight requests directly and appends the allow headers on
+    http.response.start for matched origins; unmatched origins pass
+    through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None or origin not in ALLOWED_ORIGINS:
+            await self.app(scope, receive, send)
+            return
+
+        # Answer preflights without entering the application
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = [
+                (b"access-control-allow-origin", origin),
+                *_PREFLIGHT_HEADERS,
+            ]
+            if request_headers:
+                headers.append(
+                    (b"access-control-allow-headers", request_headers)
+                )
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": headers,
+                }
+            )
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message["headers"],
+                    (b"access-control-allow-origin", origin),
+                    *_RESPONSE_HEADERS,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,13 +1,20 @@
 """Global error handling middleware"""
 
+import orjson
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Canonical production 500 body, serialized once; the error path must stay
+# cheap so formatting failures can't amplify an overload
+_GENERIC_ERROR_BYTES = orjson.dumps(
+    {"error": "Internal server error", "message": "An error occurred"}
+)
+
 
 def setup_error_handlers(app: FastAPI) -> None:
     """Setup global error handlers"""
@@ -15,7 +22,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(StarletteHTTPException)
     async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         """Handle HTTP exceptions"""
-        logger.error(f"HTTP {exc.status_code}: {exc.detail}")
+        logger.error("HTTP %s: %s", exc.status_code, exc.detail)
         return JSONResponse(
             status_code=exc.status_code,
             content={
@@ -28,12 +35,13 @@ def setup_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
         """Handle validation errors"""
-        logger.error(f"Validation error: {exc.errors()}")
+        errors = exc.errors()
+        logger.error("Validation error: %s", errors)
         return JSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "error": "Validation error",
-                "details": exc.errors(),
+                "details": errors,
                 "path": str(request.url),
             },
         )
@@ -41,12 +49,21 @@ def setup_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle general exceptions"""
-        logger.exception(f"Unhandled exception: {exc}")
+        logger.exception("Unhandled exception")
+        # isEnabledFor respects the effective level (logger.level only sees
+        # the level set directly on this logger); outside debug the
+        # exception is never stringified for the response
+        if not logger.isEnabledFor(logging.DEBUG):
+            return Response(
+                content=_GENERIC_ERROR_BYTES,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                media_type="application/json",
+            )
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Internal server error",
-                "message": str(exc) if logger.level == logging.DEBUG else "An error occurred",
+                "message": str(exc),
                 "path": str(request.url),
             },
         )
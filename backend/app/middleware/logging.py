@@ -1,45 +1,72 @@
 """Request logging middleware"""
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 import logging
 import time
-from typing import Callable
 
 logger = logging.getLogger(__name__)
 
+# Prometheus scrapes and healthchecks hit many times a second and carry
+# no operational signal; skip them before any timing or formatting work
+SKIP_PATHS = frozenset(
+    {
+        "/api/metrics",
+        "/api/health",
+        "/api/health/live",
+        "/api/health/ready",
+    }
+)
 
-def setup_logging(app: FastAPI) -> None:
-    """Setup request logging middleware"""
 
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next: Callable):
-        """Log all requests"""
-        start_time = time.time()
-
-        # Log request
-        logger.info(
-            f"Request: {request.method} {request.url.path}",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "client": request.client.host if request.client else None,
-            },
-        )
-
-        # Process request
-        response = await call_next(request)
-
-        # Calculate duration
-        duration = time.time() - start_time
-
-        # Log response
-        logger.info(
-            f"Response: {response.status_code} ({duration:.3f}s)",
-            extra={
-                "status_code": response.status_code,
-                "duration": duration,
-            },
-        )
-
-        return response
+class LoggingMiddleware:
+    """Pure-ASGI request logging middleware
+
+    Implemented against the raw ASGI interface instead of
+    @app.middleware("http"): Starlette's BaseHTTPMiddleware wraps every
+    request in an extra task and rebuilds a Request object, which this
+    avoids on the hot path.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        # Skip the format/extra-dict work entirely when INFO is filtered out
+        log_enabled = logger.isEnabledFor(logging.INFO)
+        start_ns = time.perf_counter_ns()
 
+        if log_enabled:
+            method = scope["method"]
+            path = scope["path"]
+            client = scope.get("client")
+            logger.info(
+                f"Request: {method} {path}",
+                extra={
+                    "method": method,
+                    "path": path,
+                    "client": client[0] if client else None,
+                },
+            )
+
+        async def send_wrapper(message):
+            if log_enabled and message["type"] == "http.response.start":
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.info(
+                    f"Response: {message['status']} ({duration:.3f}s)",
+                    extra={
+                        "status_code": message["status"],
+                        "duration": duration,
+                    },
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def setup_logging(app: FastAPI) -> None:
+    """Setup request logging middleware"""
+    app.add_middleware(LoggingMiddleware)
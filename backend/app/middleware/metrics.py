@@ -1,10 +1,9 @@
 """Prometheus metrics middleware"""
 
+import asyncio
 import time
 import logging
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Dict, List, Optional, Tuple
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
 from prometheus_client import REGISTRY
 
@@ -42,59 +41,148 @@ agent_execution_duration_seconds = Histogram(
     buckets=[1.0, 5.0, 10.0, 30.0, 60.0, 300.0]
 )
 
-
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect Prometheus metrics"""
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and collect metrics"""
-        start_time = time.time()
-        
-        # Get endpoint path (remove query params)
-        endpoint = request.url.path
-        
-        # Process request
+# Bound metric children cached per label tuple: .labels() hashes and
+# looks up the label values on every call, which adds up at high QPS.
+# Cleared at cap like the auth cache, though route templates keep the
+# label set small in practice.
+_LABEL_CACHE_MAX_ENTRIES = 2048
+_req_children: dict = {}
+_dur_children: dict = {}
+
+# Per-request observations accumulate in plain dicts (no client locks on
+# the request path) and a background task applies them in bulk; /metrics
+# flushes synchronously first so scrapes stay fresh. Swaps are atomic on
+# a single event loop, so no extra locking is needed.
+METRICS_FLUSH_INTERVAL = 0.1
+_pending_counts: Dict[Tuple[str, str, int], int] = {}
+_pending_durations: Dict[Tuple[str, str], List[float]] = {}
+_flusher_task: Optional[asyncio.Task] = None
+
+
+def _flush_pending() -> None:
+    """Apply accumulated observations to the Prometheus client"""
+    global _pending_counts, _pending_durations
+
+    if _pending_counts:
+        counts, _pending_counts = _pending_counts, {}
+        for key, count in counts.items():
+            counter = _req_children.get(key)
+            if counter is None:
+                if len(_req_children) >= _LABEL_CACHE_MAX_ENTRIES:
+                    _req_children.clear()
+                counter = _req_children[key] = http_requests_total.labels(*key)
+            counter.inc(count)
+
+    if _pending_durations:
+        durations, _pending_durations = _pending_durations, {}
+        for dur_key, values in durations.items():
+            histogram = _dur_children.get(dur_key)
+            if histogram is None:
+                if len(_dur_children) >= _LABEL_CACHE_MAX_ENTRIES:
+                    _dur_children.clear()
+                histogram = _dur_children[dur_key] = (
+                    http_request_duration_seconds.labels(*dur_key)
+                )
+            observe = histogram.observe
+            for value in values:
+                observe(value)
+
+
+async def _flush_loop() -> None:
+    while True:
+        await asyncio.sleep(METRICS_FLUSH_INTERVAL)
+        _flush_pending()
+
+
+def start_metrics_flusher() -> None:
+    """Start the periodic metrics flusher (called at app startup)"""
+    global _flusher_task
+    if _flusher_task is None:
+        _flusher_task = asyncio.create_task(_flush_loop())
+
+
+class MetricsMiddleware:
+    """Pure-ASGI middleware to collect Prometheus metrics
+
+    Like LoggingMiddleware, this sits on the raw ASGI interface instead
+    of BaseHTTPMiddleware, which spawns an extra task and rebuilds a
+    Request object for every request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        # Integer nanoseconds on the hot path; converted to seconds once
+        # at observation time (matches LoggingMiddleware)
+        start_ns = time.perf_counter_ns()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # Record in finally so failed requests still count as 500s
         try:
-            response = await call_next(request)
-            status_code = response.status_code
-        except Exception as e:
-            status_code = 500
-            logger.error(f"Request failed: {e}")
-            raise
+            await self.app(scope, receive, send_wrapper)
         finally:
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            # Record metrics
-            http_requests_total.labels(
-                method=request.method,
-                endpoint=endpoint,
-                status=status_code
-            ).inc()
-            
-            http_request_duration_seconds.labels(
-                method=request.method,
-                endpoint=endpoint
-            ).observe(duration)
-        
-        return response
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+
+            # Label with the parameterized route template where one
+            # matched, so /api/chat/history/abc and .../def share a
+            # series. Unmatched requests collapse into one label rather
+            # than echoing arbitrary scanned paths, keeping the series
+            # set bounded by the route table.
+            route = scope.get("route")
+            endpoint = route.path if route is not None else "unmatched"
+
+            # Defer to the flusher: two dict updates here instead of
+            # taking the prometheus_client locks per request
+            key = (method, endpoint, status_code)
+            _pending_counts[key] = _pending_counts.get(key, 0) + 1
+
+            dur_key = (method, endpoint)
+            values = _pending_durations.get(dur_key)
+            if values is None:
+                values = _pending_durations[dur_key] = []
+            values.append(duration)
 
 
 def get_metrics():
     """Get Prometheus metrics in text format"""
+    _flush_pending()
     return generate_latest(REGISTRY)
 
 
+# Agent label children; the agent set is fixed at registry size, so
+# these never need eviction
+_exec_counter_children: Dict[Tuple[str, str], object] = {}
+_exec_duration_children: Dict[str, object] = {}
+
+
 def record_agent_execution(agent_name: str, duration: float, status: str = "success"):
     """Record agent execution metrics"""
-    agent_executions_total.labels(
-        agent_name=agent_name,
-        status=status
-    ).inc()
-    
-    agent_execution_duration_seconds.labels(
-        agent_name=agent_name
-    ).observe(duration)
+    key = (agent_name, status)
+    counter = _exec_counter_children.get(key)
+    if counter is None:
+        counter = _exec_counter_children[key] = agent_executions_total.labels(
+            agent_name, status
+        )
+    counter.inc()
+
+    histogram = _exec_duration_children.get(agent_name)
+    if histogram is None:
+        histogram = _exec_duration_children[agent_name] = (
+            agent_execution_duration_seconds.labels(agent_name)
+        )
+    histogram.observe(duration)
 
 
 def update_active_sessions(count: int):
@@ -1,48 +1,101 @@
 """Rate limiting middleware"""
 
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-import redis
-from app.config import settings
 import time
 
-redis_client = redis.from_url(settings.REDIS_URL)
+import orjson
+
+from app.config import settings
+from app.dependencies import get_redis_client
+
+# Fixed one-minute counting window
+RATE_LIMIT_WINDOW_SECONDS = 60
+
+# Server-side increment: bumps the counter, starts the window TTL on the
+# first hit only, and reports the remaining window — one round trip and
+# atomic, so concurrent requests can't race the check
+_RATE_LIMIT_LUA = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return {current, redis.call('TTL', KEYS[1])}
+"""
+
+# register_script caches the SHA and falls back to EVAL on NOSCRIPT
+_rate_limit_script = None
+
+# The 429 body never varies, so it's serialized once
+_LIMIT_EXCEEDED_BYTES = orjson.dumps(
+    {"error": "Rate limit exceeded. Please try again later.", "status_code": 429}
+)
+
+_LIMIT_HEADER = str(settings.RATE_LIMIT_PER_MINUTE).encode()
+
 
+def _get_rate_limit_script():
+    global _rate_limit_script
+    if _rate_limit_script is None:
+        _rate_limit_script = get_redis_client().register_script(_RATE_LIMIT_LUA)
+    return _rate_limit_script
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware using Redis"""
 
-    async def dispatch(self, request: Request, call_next):
-        """Check rate limit before processing request"""
+class RateLimitMiddleware:
+    """Pure-ASGI rate limiting middleware using Redis
+
+    The whole check runs server-side as one Lua script: increment, TTL
+    on first hit only, and the remaining window back for the reset
+    header — a single atomic round trip per request. Over-limit requests
+    are answered directly without entering the application.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get client identifier
-        client_id = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        client_id = client[0] if client else "unknown"
 
         # Rate limit key
         key = f"rate_limit:{client_id}"
 
-        # Get current count
-        current = redis_client.get(key)
-        if current and int(current) >= settings.RATE_LIMIT_PER_MINUTE:
-            raise HTTPException(
-                status_code=429,
-                detail="Rate limit exceeded. Please try again later.",
-            )
-
-        # Increment counter
-        pipe = redis_client.pipeline()
-        pipe.incr(key)
-        pipe.expire(key, 60)  # 1 minute window
-        pipe.execute()
+        current, ttl = await _get_rate_limit_script()(
+            keys=[key], args=[RATE_LIMIT_WINDOW_SECONDS]
+        )
 
-        # Process request
-        response = await call_next(request)
+        if current > settings.RATE_LIMIT_PER_MINUTE:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"retry-after", str(ttl).encode()),
+                        (b"x-ratelimit-limit", _LIMIT_HEADER),
+                        (b"x-ratelimit-remaining", b"0"),
+                    ],
+                }
+            )
+            await send(
+                {"type": "http.response.body", "body": _LIMIT_EXCEEDED_BYTES}
+            )
+            return
 
-        # Add rate limit headers
-        remaining = settings.RATE_LIMIT_PER_MINUTE - (int(current) if current else 0) - 1
-        response.headers["X-RateLimit-Limit"] = str(settings.RATE_LIMIT_PER_MINUTE)
-        response.headers["X-RateLimit-Remaining"] = str(max(0, remaining))
-        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + 60)
+        remaining = max(0, settings.RATE_LIMIT_PER_MINUTE - current)
+        reset = int(time.time()) + ttl
 
-        return response
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message["headers"],
+                    (b"x-ratelimit-limit", _LIMIT_HEADER),
+                    (b"x-ratelimit-remaining", str(remaining).encode()),
+                    (b"x-ratelimit-reset", str(reset).encode()),
+                ]
+            await send(message)
 
+        await self.app(scope, receive, send_wrapper)
@@ -6,12 +6,14 @@ This module contains all event types used throughout the backend.
 Events are published to the Event Bus and streamed to the frontend.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Union
-from uuid import UUID, uuid4
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union, get_args
+import orjson
+from uuid_utils import uuid7
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
 
-from pydantic import BaseModel, Field
+_UTC = timezone.utc
 
 
 # ============================================================================
@@ -69,25 +71,57 @@ class EventType(str, Enum):
 class BaseEvent(BaseModel):
     """Base event structure for all events"""
 
-    event_id: str = Field(default_factory=lambda: str(uuid4()))
+    # Frozen: events are write-once, which skips mutation validation on
+    # construction-heavy paths and keeps the serialization cache sound
+    model_config = ConfigDict(use_enum_values=True, frozen=True, extra="forbid")
+
+    # uuid7 is time-ordered and generated in native code — cheaper than
+    # a urandom read per uuid4 and sortable by creation time
+    event_id: str = Field(default_factory=lambda: str(uuid7()))
     session_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(_UTC))
     type: EventType
     payload: Dict[str, Any]
 
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-        }
+    # Serialized form, filled on first to_json(); events are write-once,
+    # so consumers after the first get the same bytes back
+    _cached_json: Optional[bytes] = PrivateAttr(default=None)
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes via orjson
+
+        orjson handles datetime and UUID natively in C, replacing the
+        legacy json_encoders lambdas that forced pydantic's pure-Python
+        encoder on every dump; OPT_UTC_Z renders UTC timestamps with a
+        Z suffix, matching the event-bus wire format. The result is
+        cached, so dumping the same event for several consumers
+        serializes once.
+        """
+        cached = self._cached_json
+        if cached is None:
+            cached = self._cached_json = orjson.dumps(
+                self.model_dump(mode="python"),
+                default=str,
+                option=orjson.OPT_UTC_Z,
+            )
+        return cached
+
+
+class EventPayload(BaseModel):
+    """Base class for all event payloads
+
+    Payloads are immutable once constructed; freezing them lets events
+    flow through queues and fan-out safely and cheaply.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 # ============================================================================
 # 1. Session Event Payloads
 # ============================================================================
 
-class SessionStartedPayload(BaseModel):
+class SessionStartedPayload(EventPayload):
     """Payload for session_started event"""
 
     session_id: str
@@ -95,7 +129,7 @@ class SessionStartedPayload(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
-class SessionEndedPayload(BaseModel):
+class SessionEndedPayload(EventPayload):
     """Payload for session_ended event"""
 
     session_id: str
@@ -107,21 +141,21 @@ class SessionEndedPayload(BaseModel):
 # 2. Agent Message Event Payloads
 # ============================================================================
 
-class AgentMessageStartPayload(BaseModel):
+class AgentMessageStartPayload(EventPayload):
     """Payload for agent_message_start event"""
 
     agent: str
     message_id: str
 
 
-class AgentMessageDeltaPayload(BaseModel):
+class AgentMessageDeltaPayload(EventPayload):
     """Payload for agent_message_delta event"""
 
     message_id: str
     delta: str
 
 
-class AgentMessageEndPayload(BaseModel):
+class AgentMessageEndPayload(EventPayload):
     """Payload for agent_message_end event"""
 
     message_id: str
@@ -132,7 +166,7 @@ class AgentMessageEndPayload(BaseModel):
 # 3. Tool Execution Event Payloads
 # ============================================================================
 
-class ToolCallStartedPayload(BaseModel):
+class ToolCallStartedPayload(EventPayload):
     """Payload for tool_call_started event"""
 
     tool_call_id: str
@@ -141,14 +175,14 @@ class ToolCallStartedPayload(BaseModel):
     args: Dict[str, Any]
 
 
-class ToolCallDeltaPayload(BaseModel):
+class ToolCallDeltaPayload(EventPayload):
     """Payload for tool_call_delta event"""
 
     tool_call_id: str
     delta: str
 
 
-class ToolCallResultPayload(BaseModel):
+class ToolCallResultPayload(EventPayload):
     """Payload for tool_call_result event"""
 
     tool_call_id: str
@@ -161,14 +195,14 @@ class ToolCallResultPayload(BaseModel):
 # 4. Workflow Event Payloads (LangGraph)
 # ============================================================================
 
-class WorkflowStartedPayload(BaseModel):
+class WorkflowStartedPayload(EventPayload):
     """Payload for workflow_started event"""
 
     workflow: str
     run_id: str
 
 
-class WorkflowStepStartedPayload(BaseModel):
+class WorkflowStepStartedPayload(EventPayload):
     """Payload for workflow_step_started event"""
 
     run_id: str
@@ -176,7 +210,7 @@ class WorkflowStepStartedPayload(BaseModel):
     description: str
 
 
-class WorkflowStepCompletedPayload(BaseModel):
+class WorkflowStepCompletedPayload(EventPayload):
     """Payload for workflow_step_completed event"""
 
     run_id: str
@@ -184,7 +218,7 @@ class WorkflowStepCompletedPayload(BaseModel):
     output: Any
 
 
-class WorkflowTransitionPayload(BaseModel):
+class WorkflowTransitionPayload(EventPayload):
     """Payload for workflow_transition event"""
 
     run_id: str
@@ -193,7 +227,7 @@ class WorkflowTransitionPayload(BaseModel):
     reason: str
 
 
-class WorkflowCompletedPayload(BaseModel):
+class WorkflowCompletedPayload(EventPayload):
     """Payload for workflow_completed event"""
 
     run_id: str
@@ -204,7 +238,7 @@ class WorkflowCompletedPayload(BaseModel):
 # 5. Agent Thinking / Reasoning Payloads
 # ============================================================================
 
-class AgentThoughtPayload(BaseModel):
+class AgentThoughtPayload(EventPayload):
     """Payload for agent_thought event"""
 
     agent: str
@@ -216,7 +250,7 @@ class AgentThoughtPayload(BaseModel):
 # 6. Error, Retry & Interrupt Event Payloads
 # ============================================================================
 
-class RunErrorPayload(BaseModel):
+class RunErrorPayload(EventPayload):
     """Payload for run_error event"""
 
     error_type: str
@@ -226,7 +260,7 @@ class RunErrorPayload(BaseModel):
     traceback: Optional[str] = None
 
 
-class RunRetryPayload(BaseModel):
+class RunRetryPayload(EventPayload):
     """Payload for run_retry event"""
 
     retry_count: int
@@ -234,7 +268,7 @@ class RunRetryPayload(BaseModel):
     reason: str
 
 
-class RunInterruptedPayload(BaseModel):
+class RunInterruptedPayload(EventPayload):
     """Payload for run_interrupted event"""
 
     reason: Literal["user_stop", "timeout", "system_error"]
@@ -245,7 +279,7 @@ class RunInterruptedPayload(BaseModel):
 # 7. Knowledge Base / RAG Event Payloads
 # ============================================================================
 
-class RetrievalDocument(BaseModel):
+class RetrievalDocument(EventPayload):
     """A single retrieved document"""
 
     id: str
@@ -254,14 +288,14 @@ class RetrievalDocument(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
-class RetrievalStartedPayload(BaseModel):
+class RetrievalStartedPayload(EventPayload):
     """Payload for retrieval_started event"""
 
     query: str
     agent: str
 
 
-class RetrievalResultPayload(BaseModel):
+class RetrievalResultPayload(EventPayload):
     """Payload for retrieval_result event"""
 
     documents: List[RetrievalDocument]
@@ -271,14 +305,14 @@ class RetrievalResultPayload(BaseModel):
 # 8. n8n Automation Event Payloads
 # ============================================================================
 
-class AutomationTriggeredPayload(BaseModel):
+class AutomationTriggeredPayload(EventPayload):
     """Payload for automation_triggered event"""
 
     workflow: str
     trigger: str
 
 
-class AutomationCompletedPayload(BaseModel):
+class AutomationCompletedPayload(EventPayload):
     """Payload for automation_completed event"""
 
     workflow: str
@@ -289,7 +323,7 @@ class AutomationCompletedPayload(BaseModel):
 # 9. System Metrics / Infrastructure Monitor Payloads
 # ============================================================================
 
-class MetricsUpdatePayload(BaseModel):
+class MetricsUpdatePayload(EventPayload):
     """Payload for metrics_update event"""
 
     cpu: float  # percentage
@@ -461,7 +495,9 @@ class MetricsUpdateEvent(BaseEvent):
 # Union Type for All Events
 # ============================================================================
 
-AgentEvent = Union[
+# Discriminated on the type literal: validation dispatches straight to
+# the matching variant instead of trying all members in order
+AgentEvent = Annotated[Union[
     SessionStartedEvent,
     SessionEndedEvent,
     AgentMessageStartEvent,
@@ -484,7 +520,45 @@ AgentEvent = Union[
     AutomationTriggeredEvent,
     AutomationCompletedEvent,
     MetricsUpdateEvent,
-]
+], Field(discriminator="type")]
+
+# Built once; TypeAdapter construction compiles the validator, so doing
+# it per call would defeat the point of the tagged dispatch
+_agent_event_adapter: "TypeAdapter[AgentEvent]" = TypeAdapter(AgentEvent)
+
+
+def parse_agent_event(data: Union[str, bytes]) -> AgentEvent:
+    """Validate inbound JSON into the matching typed event
+
+    The discriminated union dispatches on the type field, so only the
+    matched variant is validated.
+    """
+    return _agent_event_adapter.validate_json(data)
+
+
+# Direct type-string -> event-class table, built once from the union
+# members; decode_event skips even the discriminator machinery with a
+# plain dict lookup before a single pydantic-core validate_json.
+_EVENT_BY_TYPE: Dict[str, type] = {
+    cls.model_fields["type"].default.value: cls
+    for cls in get_args(get_args(AgentEvent)[0])
+}
+
+
+def decode_event(raw: Union[str, bytes]) -> BaseEvent:
+    """Decode a raw JSON event by indexing its type field
+
+    Args:
+        raw: JSON-serialized event as str or bytes
+
+    Returns:
+        The concrete typed event instance
+
+    Raises:
+        KeyError: If the type field names an unknown event type
+    """
+    event_type = orjson.loads(raw)["type"]
+    return _EVENT_BY_TYPE[event_type].model_validate_json(raw)
 
 
 # ============================================================================
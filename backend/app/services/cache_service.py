@@ -1,102 +1,151 @@
 """Redis caching service"""
 
 from typing import Optional, Any, Dict
-import redis
-import json
+import asyncio
 import logging
-from app.config import settings
+
+import orjson
+
+from app.dependencies import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Max SETs coalesced into one Redis pipeline
+WRITE_BATCH_SIZE = 256
+# How long the writer waits for more SETs before flushing (seconds)
+WRITE_BATCH_INTERVAL = 0.005
+
 
 class CacheService:
-    """Service for caching data in Redis"""
+    """Service for caching data in Redis
+
+    All operations go through the shared async client, so cache calls
+    suspend on the event loop instead of blocking it for the Redis round
+    trip. Connection failures surface per call and degrade to cache
+    misses rather than errors.
+    """
 
     def __init__(self):
-        """Initialize Redis client"""
-        try:
-            self.redis_client = redis.from_url(
-                settings.REDIS_URL, decode_responses=True
-            )
-            # Test connection
-            self.redis_client.ping()
-        except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
-            self.redis_client = None
+        """Initialize with the shared pooled Redis client"""
+        self.redis_client = get_redis_client()
+        # Created on first set() so the queue binds to the running loop
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
 
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
-        if not self.redis_client:
-            return None
-
         try:
-            value = self.redis_client.get(key)
+            value = await self.redis_client.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception as e:
             logger.error(f"Error getting cache key {key}: {e}")
             return None
 
-    def set(
+    async def set(
         self, key: str, value: Any, ttl: int = 3600
     ) -> bool:
-        """Set value in cache with TTL"""
-        if not self.redis_client:
-            return False
+        """Set value in cache with TTL
 
+        Writes are handed to a background writer that coalesces bursts
+        into one non-transactional pipeline, so N concurrent sets cost
+        one Redis round trip instead of N. The returned bool resolves
+        once the write has actually been executed.
+        """
         try:
-            serialized = json.dumps(value)
-            self.redis_client.setex(key, ttl, serialized)
-            return True
+            # orjson emits bytes, which the client sends as-is; the
+            # pool's decode_responses only affects what Redis returns
+            serialized = orjson.dumps(value)
         except Exception as e:
-            logger.error(f"Error setting cache key {key}: {e}")
+            logger.error(f"Error serializing cache key {key}: {e}")
             return False
 
-    def delete(self, key: str) -> bool:
+        self._ensure_writer()
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._write_queue.put_nowait((key, serialized, ttl, future))
+        return await future
+
+    def _ensure_writer(self) -> None:
+        """Start the background write flusher if it isn't running"""
+        if self._write_queue is None:
+            self._write_queue = asyncio.Queue()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def _write_loop(self) -> None:
+        """Drain queued sets in batches over a single pipeline"""
+        while True:
+            batch = [await self._write_queue.get()]
+            # Coalesce briefly so bursts of writes share one pipeline
+            try:
+                while len(batch) < WRITE_BATCH_SIZE:
+                    batch.append(
+                        await asyncio.wait_for(
+                            self._write_queue.get(),
+                            timeout=WRITE_BATCH_INTERVAL,
+                        )
+                    )
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for key, serialized, ttl, _ in batch:
+                        pipe.set(key, serialized, ex=ttl)
+                    await pipe.execute()
+                succeeded = True
+            except Exception as e:
+                logger.error(f"Failed to flush {len(batch)} cache write(s): {e}")
+                succeeded = False
+
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_result(succeeded)
+
+    async def delete(self, key: str) -> bool:
         """Delete key from cache"""
-        if not self.redis_client:
-            return False
-
         try:
-            self.redis_client.delete(key)
+            await self.redis_client.delete(key)
             return True
         except Exception as e:
             logger.error(f"Error deleting cache key {key}: {e}")
             return False
 
-    def exists(self, key: str) -> bool:
+    async def exists(self, key: str) -> bool:
         """Check if key exists in cache"""
-        if not self.redis_client:
-            return False
-
         try:
-            return self.redis_client.exists(key) > 0
+            return await self.redis_client.exists(key) > 0
         except Exception as e:
             logger.error(f"Error checking cache key {key}: {e}")
             return False
 
-    def increment(self, key: str, amount: int = 1) -> Optional[int]:
-        """Increment counter in cache"""
-        if not self.redis_client:
-            return None
+    async def clear_pattern(self, pattern: str) -> int:
+        """Delete all keys matching a glob pattern, returning the count"""
+        try:
+            keys = await self.redis_client.keys(pattern)
+            if not keys:
+                return 0
+            return await self.redis_client.delete(*keys)
+        except Exception as e:
+            logger.error(f"Error clearing cache pattern {pattern}: {e}")
+            return 0
 
+    async def increment(self, key: str, amount: int = 1) -> Optional[int]:
+        """Increment counter in cache"""
         try:
-            return self.redis_client.incrby(key, amount)
+            return await self.redis_client.incrby(key, amount)
         except Exception as e:
             logger.error(f"Error incrementing cache key {key}: {e}")
             return None
 
-    def get_cache_stats(self) -> Dict[str, Any]:
+    async def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        if not self.redis_client:
-            return {"status": "disconnected"}
-
         try:
-            info = self.redis_client.info("stats")
+            info = await self.redis_client.info("stats")
             return {
                 "status": "connected",
-                "keys": self.redis_client.dbsize(),
+                "keys": await self.redis_client.dbsize(),
                 "hits": info.get("keyspace_hits", 0),
                 "misses": info.get("keyspace_misses", 0),
             }
@@ -107,4 +156,3 @@ class CacheService:
 
 # Global cache service instance
 cache_service = CacheService()
-
@@ -0,0 +1,92 @@
+"""asyncpg connection pool for direct Postgres writes
+
+High-frequency writes (metrics, review records, deployments) pay HTTP
+serialization plus a PostgREST round-trip per call when they go through
+supabase-py. This module maintains an asyncpg pool against DATABASE_URL so
+hot write paths can talk to Postgres directly; read/auth traffic keeps
+using the Supabase client.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+import asyncpg
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[asyncpg.Pool] = None
+_pool_lock = asyncio.Lock()
+
+
+async def get_pool() -> asyncpg.Pool:
+    """Get or create the shared asyncpg pool"""
+    global _pool
+    if _pool is None:
+        async with _pool_lock:
+            if _pool is None:
+                _pool = await asyncpg.create_pool(
+                    settings.DATABASE_URL,
+                    min_size=10,
+                    max_size=50,
+                    # Supavisor's transaction pooler does not support
+                    # server-side prepared statements
+                    statement_cache_size=0,
+                    # Recycle idle connections so stale ones don't linger
+                    max_inactive_connection_lifetime=1800.0,
+                )
+                logger.info("asyncpg pool initialized")
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close the shared pool during application shutdown"""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+        logger.info("asyncpg pool closed")
+
+
+async def health_check() -> bool:
+    """Check pool connectivity with a trivial query"""
+    try:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            await conn.fetchval("SELECT 1")
+        return True
+    except Exception as e:
+        logger.error(f"asyncpg health check failed: {e}")
+        return False
+
+
+async def insert_metrics(metrics: List[Dict[str, Any]]) -> None:
+    """Bulk-insert infrastructure metrics via executemany
+
+    Args:
+        metrics: Metric rows as produced by monitor_services
+    """
+    pool = await get_pool()
+    rows = [
+        (
+            m["service_name"],
+            m["metric_type"],
+            float(m.get("metric_value", 0)),
+            m.get("unit"),
+            m["status"],
+            json.dumps(m.get("metadata") or {}),
+        )
+        for m in metrics
+    ]
+    async with pool.acquire() as conn:
+        await conn.executemany(
+            """
+            INSERT INTO infrastructure_metrics
+                (service_name, metric_type, metric_value, unit, status, metadata)
+            VALUES ($1, $2, $3, $4, $5, $6::jsonb)
+            """,
+            rows,
+        )
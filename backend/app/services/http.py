@@ -0,0 +1,42 @@
+"""Shared HTTP client with keep-alive connection pooling
+
+Services that talk HTTP (n8n webhooks, health probes, future outbound
+integrations) should reuse this process-wide client instead of opening a
+fresh httpx.AsyncClient per call — each throwaway client pays a TCP/TLS
+handshake that connection reuse avoids.
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http() -> httpx.AsyncClient:
+    """Get or create the process-wide async HTTP client"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(10.0, connect=3.0),
+        )
+        logger.info("Shared HTTP client initialized")
+    return _client
+
+
+async def close_http() -> None:
+    """Close the shared HTTP client during application shutdown"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        _client = None
+        logger.info("Shared HTTP client closed")
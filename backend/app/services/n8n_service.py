@@ -1,9 +1,9 @@
 """n8n workflow service"""
 
 from typing import Dict, Any, Optional
-import httpx
 import logging
 from app.config import settings
+from app.services.http import get_http
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +26,15 @@ class N8nService:
             if self.api_key:
                 headers["X-N8N-API-KEY"] = self.api_key
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                return True
+            # Shared keep-alive client; no per-call connection setup
+            response = await get_http().post(
+                url,
+                json=payload,
+                headers=headers,
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            return True
         except Exception as e:
             logger.error(f"Error triggering n8n webhook {workflow_id}: {e}")
             return False
@@ -1,5 +1,9 @@
 """Langfuse observability service"""
 
+import atexit
+import random
+import threading
+import time
 from typing import Optional, Dict, Any
 from langfuse import Langfuse
 from app.config import settings
@@ -7,6 +11,19 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Cap on cached per-session traces before the map is reset
+SESSION_TRACE_MAX_ENTRIES = 1024
+
+# SDK buffer sizing: large enough that request threads never flush inline,
+# with the SDK's own worker draining every couple of seconds
+LANGFUSE_FLUSH_AT = 1000
+LANGFUSE_FLUSH_INTERVAL = 2.0
+
+# The background flusher forces a drain once this many traces are pending
+TRACE_FLUSH_THRESHOLD = 1000
+# How often the flusher checks the pending counter (seconds)
+FLUSH_CHECK_INTERVAL = 1.0
+
 
 class ObservabilityService:
     """Service for Langfuse observability"""
@@ -14,6 +31,20 @@ class ObservabilityService:
     def __init__(self):
         """Initialize Langfuse client"""
         self.langfuse: Optional[Langfuse] = None
+        # Public fast path: callers can branch on this bool before
+        # building metadata dicts for a trace that would be a no-op
+        self.enabled = False
+        # One shared trace per session so repeated agent executions nest as
+        # child spans instead of creating a new trace (and Langfuse POST)
+        # per call
+        self._session_traces: Dict[str, Any] = {}
+        # Head sampling: decide at trace creation, so dropped traces never
+        # pay for span bookkeeping or network flushes
+        self._sample_rate = min(max(settings.LANGFUSE_SAMPLE_RATE, 0.0), 1.0)
+
+        # Traces created since the last forced flush; heuristic counter
+        # bumped without a lock, so it only needs to be roughly right
+        self._pending_traces = 0
 
         if settings.LANGFUSE_PUBLIC_KEY and settings.LANGFUSE_SECRET_KEY:
             try:
@@ -21,7 +52,19 @@ class ObservabilityService:
                     public_key=settings.LANGFUSE_PUBLIC_KEY,
                     secret_key=settings.LANGFUSE_SECRET_KEY,
                     host=settings.LANGFUSE_HOST,
+                    flush_at=LANGFUSE_FLUSH_AT,
+                    flush_interval=LANGFUSE_FLUSH_INTERVAL,
                 )
+                threading.Thread(
+                    target=self._flush_loop,
+                    name="langfuse-flusher",
+                    daemon=True,
+                ).start()
+                if settings.LANGFUSE_ENFORCE_FLUSH:
+                    # Short-lived scripts exit before the interval flush
+                    # fires; drain the buffer on interpreter shutdown
+                    atexit.register(self.langfuse.flush)
+                self.enabled = True
                 logger.info("Langfuse observability enabled")
             except Exception as e:
                 logger.error(f"Failed to initialize Langfuse: {e}")
@@ -34,25 +77,95 @@ class ObservabilityService:
         metadata: Optional[Dict[str, Any]] = None,
     ):
         """Create a new trace"""
-        if not self.langfuse:
-            return NoneTrace()
+        if not self.langfuse or not self._sampled():
+            return _NULL_TRACE
 
         try:
-            return self.langfuse.trace(name=name, metadata=metadata or {})
+            trace = self.langfuse.trace(name=name, metadata=metadata or {})
         except Exception as e:
             logger.error(f"Error creating trace: {e}")
-            return NoneTrace()
+            return _NULL_TRACE
+        self._pending_traces += 1
+        return trace
+
+    def trace_for_session(
+        self,
+        session_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """Get or create the shared trace for a session
+
+        All agent executions within a session hang off one trace, which cuts
+        Langfuse chatter from one trace per call to one per session and lets
+        dashboards group the full chain.
+        """
+        if not self.langfuse:
+            return _NULL_TRACE
+
+        trace = self._session_traces.get(session_id)
+        if trace is not None:
+            return trace
+
+        # Sample whole sessions, not individual calls, so a kept session's
+        # trace is complete; the decision is cached alongside the trace
+        if not self._sampled():
+            trace = _NULL_TRACE
+            if len(self._session_traces) >= SESSION_TRACE_MAX_ENTRIES:
+                self._session_traces.clear()
+            self._session_traces[session_id] = trace
+            return trace
+
+        try:
+            trace = self.langfuse.trace(
+                name=f"session_{session_id}",
+                metadata=metadata or {"session_id": session_id},
+            )
+        except Exception as e:
+            logger.error(f"Error creating session trace: {e}")
+            return _NULL_TRACE
+
+        self._pending_traces += 1
+        if len(self._session_traces) >= SESSION_TRACE_MAX_ENTRIES:
+            self._session_traces.clear()
+        self._session_traces[session_id] = trace
+        return trace
+
+    def _flush_loop(self) -> None:
+        """Force a buffer drain off the request path when traces pile up
+
+        The SDK's worker already flushes on its interval; this loop only
+        steps in when a burst outruns it, so request threads never flush.
+        """
+        while True:
+            time.sleep(FLUSH_CHECK_INTERVAL)
+            if self._pending_traces < TRACE_FLUSH_THRESHOLD:
+                continue
+            self._pending_traces = 0
+            try:
+                self.langfuse.flush()
+            except Exception as e:
+                logger.error(f"Error flushing Langfuse: {e}")
+
+    def _sampled(self) -> bool:
+        """Head-sampling decision for a new trace"""
+        return self._sample_rate >= 1.0 or random.random() < self._sample_rate
 
     def is_enabled(self) -> bool:
         """Check if observability is enabled"""
-        return self.langfuse is not None
+        return self.enabled
 
 
 class NoneTrace:
-    """Null object for traces when Langfuse is disabled"""
+    """Null object for traces when Langfuse is disabled or sampled out
+
+    Stateless, so one module singleton (_NULL_TRACE) is shared by every
+    disabled call instead of allocating a fresh instance per trace.
+    """
+
+    __slots__ = ()
 
     def span(self, *args, **kwargs):
-        return NoneSpan()
+        return _NULL_SPAN
 
     def event(self, *args, **kwargs):
         pass
@@ -64,6 +177,8 @@ class NoneTrace:
 class NoneSpan:
     """Null object for spans when Langfuse is disabled"""
 
+    __slots__ = ()
+
     def end(self, *args, **kwargs):
         pass
 
@@ -71,6 +186,11 @@ class NoneSpan:
         pass
 
 
+# Shared null objects: stateless, so every disabled/sampled-out call
+# returns the same instance
+_NULL_TRACE = NoneTrace()
+_NULL_SPAN = NoneSpan()
+
 # Global observability service instance
 observability_service = ObservabilityService()
 
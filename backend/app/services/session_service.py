@@ -1,15 +1,54 @@
 """Supabase session management service"""
 
+import asyncio
+import time
 from typing import Optional, Dict, Any
+
+import httpx
 from supabase import create_client, Client
 from app.config import settings
+from app.dependencies import get_blocking_redis_client, get_redis_client
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Connection budget for the PostgREST client; keep-alive expiry is long
+# enough that idle chat sessions don't pay a new TCP+TLS handshake per
+# message
+POSTGREST_LIMITS = httpx.Limits(
+    max_connections=40,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+# How long the event batcher waits for more appends before flushing
+EVENT_BATCH_INTERVAL = 0.05
+# Upper bound on waiting for the batcher to drain the queue at shutdown
+CLOSE_DRAIN_TIMEOUT = 5.0
+
+# Queue sentinel telling the batcher to flush what it has and exit
+_CLOSE = object()
+
+# Session read cache (enabled via SESSION_CACHE_TTL > 0): bounds on the
+# per-process map and the pub/sub channel workers use to drop entries
+# when another process writes the session
+SESSION_CACHE_MAX_ENTRIES = 50_000
+SESSION_INVALIDATE_CHANNEL = "session_invalidate"
+
+# Columns fetched for session lookups. The events JSONB is deliberately
+# omitted: it grows without bound and no lookup caller needs it, so
+# transferring it made every read O(history size). Use get_recent_events
+# for the tail of the history.
+SESSION_COLUMNS = "session_id,user_id,app_name,state,tenant_id"
+
 
 class SessionService:
-    """Service for managing ADK sessions in Supabase"""
+    """Service for managing ADK sessions in Supabase
+
+    Built once at module import (the module-level instance is the
+    singleton), with the PostgREST transport swapped for a tuned
+    keep-alive HTTP/2 client so session round trips reuse connections.
+    """
 
     def __init__(self):
         """Initialize Supabase client"""
@@ -17,21 +56,114 @@ class SessionService:
             settings.SUPABASE_URL,
             settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_ANON_KEY,
         )
+        # supabase-py's default session uses httpx defaults (5s keepalive
+        # expiry, no HTTP/2); rebuild it with the same base_url/headers
+        # but a tuned pool. Auth header updates mutate the session's
+        # headers in place, so they keep applying to the new client.
+        default_session = self.supabase.postgrest.session
+        self.supabase.postgrest.session = httpx.Client(
+            base_url=default_session.base_url,
+            headers=default_session.headers,
+            limits=POSTGREST_LIMITS,
+            http2=True,
+            timeout=httpx.Timeout(10.0),
+        )
+        # Created on first add_event so the queue binds to the running loop
+        self._event_queue: Optional[asyncio.Queue] = None
+        self._batcher_task: Optional[asyncio.Task] = None
+        # session_id -> (expiry, row) when SESSION_CACHE_TTL > 0
+        self._session_cache: Dict[str, tuple] = {}
+        self._invalidation_task: Optional[asyncio.Task] = None
 
     async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve session from Supabase"""
+        """Retrieve session metadata (without the events history)
+
+        With SESSION_CACHE_TTL > 0, repeat reads within the TTL are
+        answered from a per-process map instead of a Supabase round
+        trip; writes invalidate locally and broadcast over Redis so
+        other workers drop their copies too.
+        """
+        ttl = settings.SESSION_CACHE_TTL
+        if ttl > 0:
+            self._ensure_invalidation_listener()
+            cached = self._session_cache.get(session_id)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
         try:
             response = (
                 self.supabase.table("adk_sessions")
-                .select("*")
+                .select(SESSION_COLUMNS)
                 .eq("session_id", session_id)
                 .execute()
             )
-            return response.data[0] if response.data else None
+            session = response.data[0] if response.data else None
         except Exception as e:
             logger.error(f"Error retrieving session {session_id}: {e}")
             return None
 
+        if ttl > 0 and session is not None:
+            if len(self._session_cache) >= SESSION_CACHE_MAX_ENTRIES:
+                self._session_cache.clear()
+            self._session_cache[session_id] = (time.monotonic() + ttl, session)
+        return session
+
+    def _ensure_invalidation_listener(self) -> None:
+        """Subscribe to cross-worker invalidations once a loop is running"""
+        if self._invalidation_task is not None and not self._invalidation_task.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._invalidation_task = asyncio.create_task(self._invalidation_loop())
+
+    async def _invalidation_loop(self) -> None:
+        """Drop cached sessions that another worker has written"""
+        try:
+            pubsub = get_blocking_redis_client().pubsub()
+            await pubsub.subscribe(SESSION_INVALIDATE_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                session_id = message["data"]
+                if isinstance(session_id, bytes):
+                    session_id = session_id.decode()
+                self._session_cache.pop(session_id, None)
+        except Exception as e:
+            logger.error(f"Session invalidation listener stopped: {e}")
+
+    async def _invalidate_session(self, session_id: str) -> None:
+        """Invalidate a cached session locally and across workers"""
+        if settings.SESSION_CACHE_TTL <= 0:
+            return
+        self._session_cache.pop(session_id, None)
+        try:
+            await get_redis_client().publish(SESSION_INVALIDATE_CHANNEL, session_id)
+        except Exception as e:
+            logger.warning(f"Failed to broadcast invalidation for {session_id}: {e}")
+
+    async def get_recent_events(
+        self, session_id: str, limit: int = 50
+    ) -> list:
+        """Fetch the tail of a session's events, sliced server-side
+
+        Slicing happens in the get_recent_session_events Postgres
+        function, so bytes on the wire stay O(limit) no matter how long
+        the history grows.
+        """
+        try:
+            response = await asyncio.to_thread(
+                self.supabase.rpc(
+                    "get_recent_session_events",
+                    {"p_session_id": session_id, "p_limit": limit},
+                ).execute
+            )
+            return response.data or []
+        except Exception as e:
+            logger.error(f"Error retrieving recent events for {session_id}: {e}")
+            return []
+
     async def create_session(
         self,
         session_id: str,
@@ -59,6 +191,39 @@ class SessionService:
             logger.error(f"Error creating session {session_id}: {e}")
             raise
 
+    async def ensure_session(
+        self,
+        session_id: str,
+        user_id: str,
+        tenant_id: Optional[str] = None,
+    ) -> bool:
+        """Create the session if it doesn't exist, in a single round trip
+
+        Collapses the get_session -> create_session pair the chat handlers
+        used to issue into one idempotent upsert that leaves existing
+        sessions untouched.
+        """
+        try:
+            session_data = {
+                "session_id": session_id,
+                "user_id": user_id,
+                "app_name": "adk-devops-assistant",
+                "state": {},
+                "events": [],
+            }
+            if tenant_id:
+                session_data["tenant_id"] = tenant_id
+
+            await asyncio.to_thread(
+                self.supabase.table("adk_sessions")
+                .upsert(session_data, on_conflict="session_id", ignore_duplicates=True)
+                .execute
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error ensuring session {session_id}: {e}")
+            return False
+
     async def update_session_state(
         self, session_id: str, state: Dict[str, Any]
     ) -> bool:
@@ -67,6 +232,7 @@ class SessionService:
             self.supabase.table("adk_sessions").update({"state": state}).eq(
                 "session_id", session_id
             ).execute()
+            await self._invalidate_session(session_id)
             return True
         except Exception as e:
             logger.error(f"Error updating session state {session_id}: {e}")
@@ -75,19 +241,128 @@ class SessionService:
     async def add_event(
         self, session_id: str, event: Dict[str, Any]
     ) -> bool:
-        """Add event to session history"""
+        """Add event to session history
+
+        Goes through the append_session_event Postgres function (one
+        atomic round trip for the events append plus the history
+        insert). SESSION_EVENT_RPC_ENABLED=false falls back to the
+        legacy client-side read-modify-write sequence.
+        """
+        if not settings.SESSION_EVENT_RPC_ENABLED:
+            appended = await self._add_event_legacy(session_id, event)
+            if appended:
+                await self._invalidate_session(session_id)
+            return appended
+
+        self._ensure_batcher()
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
         try:
-            # Get current events
-            session = await self.get_session(session_id)
-            if not session:
-                return False
+            self._event_queue.put_nowait((session_id, event, future))
+        except asyncio.QueueFull:
+            logger.error(f"Event batcher queue full; dropping event for {session_id}")
+            return False
+        appended = await future
+        if appended:
+            await self._invalidate_session(session_id)
+        return appended
 
-            events = session.get("events", [])
-            events.append(event)
+    def _ensure_batcher(self) -> None:
+        """Start the background event batcher if it isn't running"""
+        if self._event_queue is None:
+            self._event_queue = asyncio.Queue(maxsize=10_000)
+        if self._batcher_task is None or self._batcher_task.done():
+            self._batcher_task = asyncio.create_task(self._batch_loop())
 
-            # Update events
-            self.supabase.table("adk_sessions").update({"events": events}).eq(
-                "session_id", session_id
+    async def _batch_loop(self) -> None:
+        """Coalesce queued appends into one RPC per session per batch"""
+        closing = False
+        while not closing:
+            item = await self._event_queue.get()
+            if item is _CLOSE:
+                return
+            batch = [item]
+            # Coalesce briefly so bursts of appends share round trips
+            try:
+                while len(batch) < settings.SESSION_BATCH_SIZE:
+                    item = await asyncio.wait_for(
+                        self._event_queue.get(),
+                        timeout=EVENT_BATCH_INTERVAL,
+                    )
+                    if item is _CLOSE:
+                        closing = True
+                        break
+                    batch.append(item)
+            except asyncio.TimeoutError:
+                pass
+
+            grouped: Dict[str, list] = {}
+            for session_id, event, _ in batch:
+                grouped.setdefault(session_id, []).append(event)
+
+            results: Dict[str, bool] = {}
+            for session_id, events in grouped.items():
+                try:
+                    await asyncio.to_thread(
+                        self.supabase.rpc(
+                            "append_session_events",
+                            {"p_session_id": session_id, "p_events": events},
+                        ).execute
+                    )
+                    results[session_id] = True
+                except Exception as e:
+                    logger.error(
+                        f"Error appending {len(events)} event(s) to session {session_id}: {e}"
+                    )
+                    results[session_id] = False
+
+            for session_id, _, future in batch:
+                if not future.done():
+                    future.set_result(results[session_id])
+
+    async def aclose(self) -> None:
+        """Flush pending event appends and stop the batcher
+
+        Call this during application shutdown so queued events aren't lost.
+        The wait is bounded: a batcher that cannot make progress (Supabase
+        down, or a task orphaned on another loop) is cancelled after
+        CLOSE_DRAIN_TIMEOUT instead of blocking shutdown forever.
+        """
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            self._invalidation_task = None
+        task = self._batcher_task
+        if task is None:
+            return
+        self._batcher_task = None
+
+        try:
+            self._event_queue.put_nowait(_CLOSE)
+            await asyncio.wait_for(task, timeout=CLOSE_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Session event batcher did not drain within {CLOSE_DRAIN_TIMEOUT}s; "
+                f"{self._event_queue.qsize()} append(s) dropped"
+            )
+        except (RuntimeError, ValueError, asyncio.QueueFull):
+            # Batcher orphaned on another (closed) event loop, or the
+            # queue is saturated; it can't be drained from here
+            try:
+                task.cancel()
+            except RuntimeError:
+                pass
+
+    async def _add_event_legacy(
+        self, session_id: str, event: Dict[str, Any]
+    ) -> bool:
+        """Client-side event append (two round trips); rollback path
+
+        Events live in the append-only adk_session_events table, so even
+        this fallback is an O(1) insert rather than a rewrite of the
+        whole history.
+        """
+        try:
+            self.supabase.table("adk_session_events").insert(
+                {"session_id": session_id, "payload": event}
             ).execute()
 
             # Also save to session_history table
@@ -124,6 +399,39 @@ class SessionService:
             logger.error(f"Error retrieving session history {session_id}: {e}")
             return []
 
+    async def get_session_histories(
+        self, session_ids: list, limit: int = 50
+    ) -> Dict[str, list]:
+        """Get history for many sessions in one round trip
+
+        Dashboards that loop get_session_history pay one Supabase RTT per
+        session; this fetches all of them with a single IN query (over-
+        fetching up to limit rows per session) and buckets the rows in
+        Python. Sessions with no history map to empty lists.
+        """
+        results: Dict[str, list] = {session_id: [] for session_id in session_ids}
+        if not session_ids:
+            return results
+
+        try:
+            response = await asyncio.to_thread(
+                self.supabase.table("session_history")
+                .select("*")
+                .in_("session_id", session_ids)
+                .order("created_at", desc=True)
+                .limit(limit * len(session_ids))
+                .execute
+            )
+        except Exception as e:
+            logger.error(f"Error retrieving histories for {len(session_ids)} sessions: {e}")
+            return results
+
+        for row in response.data or []:
+            bucket = results.get(row.get("session_id"))
+            if bucket is not None and len(bucket) < limit:
+                bucket.append(row)
+        return results
+
 
 # Global session service instance
 session_service = SessionService()
@@ -1,15 +1,38 @@
 """RQ task queue service for async processing"""
 
-from typing import Optional, Dict, Any
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Tuple
 import logging
+import redis.asyncio as aioredis
 from redis import Redis
-from rq import Queue, Job
-from rq.job import JobStatus
+from rq import Queue
+from rq.job import Job, JobStatus
+from rq.queue import EnqueueData
 from app.config import settings
 from app.dependencies import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Job retention defaults shared by single and bulk enqueue
+JOB_TIMEOUT = "10m"
+RESULT_TTL_SECONDS = 3600
+FAILURE_TTL_SECONDS = 86400
+
+# Tasks are enqueued by dotted path so the worker resolves the function
+# itself; the API process never imports the (heavy) agent stack just to
+# enqueue, and client and worker can't disagree on task identity
+TASK_MODULE = "app.tasks.agent_tasks"
+KNOWN_TASKS = frozenset(
+    {"execute_agent_task", "process_long_running_agent_task"}
+)
+
+# Terminal job statuses never change, so repeated polls of a finished
+# task can be answered from memory for a few seconds
+STATUS_CACHE_TTL = 5.0
+STATUS_CACHE_MAX_ENTRIES = 10_000
+_TERMINAL_STATUSES = frozenset({JobStatus.FINISHED, JobStatus.FAILED})
+
 
 class TaskService:
     """Service for managing async tasks with RQ"""
@@ -25,6 +48,15 @@ class TaskService:
                 db=settings.REDIS_DB + 1  # Use different DB for RQ
             )
             self.queue = Queue('default', connection=self.redis_conn)
+            # Async client on the same DB for status polls, so the event
+            # loop isn't blocked for a Redis round trip per poll
+            self.async_redis = aioredis.from_url(
+                settings.REDIS_URL,
+                db=settings.REDIS_DB + 1,
+                decode_responses=True,
+            )
+            # task_id -> (expiry, status_info) for terminal states
+            self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
             self.enabled = True
             logger.info("RQ task queue initialized")
         except Exception as e:
@@ -32,6 +64,8 @@ class TaskService:
             self.enabled = False
             self.queue = None
             self.redis_conn = None
+            self.async_redis = None
+            self._status_cache = {}
 
     def enqueue_task(
         self, task_name: str, *args, **kwargs
@@ -51,31 +85,138 @@ class TaskService:
             logger.warning("Task queue not enabled, task not queued")
             return None
 
+        if task_name not in KNOWN_TASKS:
+            logger.error(f"Task function {task_name} not found")
+            return None
+
         try:
-            # Import task function dynamically
-            from app.tasks import get_task_function
-            task_func = get_task_function(task_name)
-            
-            if not task_func:
-                logger.error(f"Task function {task_name} not found")
-                return None
-            
-            # Enqueue the task
+            # Enqueue by dotted path; the worker imports the function
             job = self.queue.enqueue(
-                task_func,
+                f"{TASK_MODULE}.{task_name}",
                 *args,
                 **kwargs,
-                job_timeout='10m',  # 10 minute timeout
-                result_ttl=3600,  # Keep results for 1 hour
-                failure_ttl=86400,  # Keep failures for 24 hours
+                job_timeout=JOB_TIMEOUT,
+                result_ttl=RESULT_TTL_SECONDS,
+                failure_ttl=FAILURE_TTL_SECONDS,
             )
-            
+
             logger.info(f"Task {task_name} enqueued with ID {job.id}")
             return job.id
         except Exception as e:
             logger.error(f"Error enqueueing task {task_name}: {e}")
             return None
 
+    def enqueue_many(
+        self, tasks: List[Tuple[str, tuple, dict]]
+    ) -> List[Optional[str]]:
+        """
+        Enqueue several tasks over one pipelined round trip
+
+        RQ issues multiple Redis commands per enqueue (job hash, registry
+        and queue updates); batching them through enqueue_many with a
+        shared pipeline collapses N tasks into one round trip.
+
+        Args:
+            tasks: List of (task_name, args, kwargs) tuples
+
+        Returns:
+            Job IDs in submission order (None for unknown task names)
+        """
+        if not self.enabled or not self.queue:
+            logger.warning("Task queue not enabled, tasks not queued")
+            return [None] * len(tasks)
+
+        job_ids: List[Optional[str]] = [None] * len(tasks)
+        job_datas: List[EnqueueData] = []
+        data_indexes: List[int] = []
+        for index, (task_name, args, kwargs) in enumerate(tasks):
+            if task_name not in KNOWN_TASKS:
+                logger.error(f"Task function {task_name} not found")
+                continue
+            job_datas.append(
+                Queue.prepare_data(
+                    f"{TASK_MODULE}.{task_name}",
+                    args=args,
+                    kwargs=kwargs,
+                    timeout=JOB_TIMEOUT,
+                    result_ttl=RESULT_TTL_SECONDS,
+                    failure_ttl=FAILURE_TTL_SECONDS,
+                )
+            )
+            data_indexes.append(index)
+
+        if not job_datas:
+            return job_ids
+
+        try:
+            with self.redis_conn.pipeline() as pipe:
+                jobs = self.queue.enqueue_many(job_datas, pipeline=pipe)
+                pipe.execute()
+        except Exception as e:
+            logger.error(f"Error enqueueing {len(job_datas)} task(s): {e}")
+            return [None] * len(tasks)
+
+        for index, job in zip(data_indexes, jobs):
+            job_ids[index] = job.id
+        logger.info(f"Enqueued {len(jobs)} task(s) in one pipeline")
+        return job_ids
+
+    async def get_task_status_async(
+        self, task_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get status of a task without blocking the event loop
+
+        In-flight jobs are answered with one async HGETALL of the job
+        hash. Terminal jobs need result deserialization, which is done
+        once in a worker thread and then cached for STATUS_CACHE_TTL —
+        clients poll finished jobs repeatedly, and those answers never
+        change.
+
+        Args:
+            task_id: Task ID returned from enqueue_task
+
+        Returns:
+            Dictionary with task status information
+        """
+        if not self.enabled or self.async_redis is None:
+            return None
+
+        cached = self._status_cache.get(task_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        try:
+            job_hash = await self.async_redis.hgetall(f"rq:job:{task_id}")
+        except Exception as e:
+            logger.error(f"Error getting task status for {task_id}: {e}")
+            return None
+
+        if not job_hash:
+            return None
+
+        status = job_hash.get("status")
+        if status in _TERMINAL_STATUSES:
+            # Results/exceptions are serialized; let RQ deserialize them
+            # off the loop, then cache the immutable answer
+            status_info = await asyncio.to_thread(self.get_task_status, task_id)
+            if status_info is not None:
+                if len(self._status_cache) >= STATUS_CACHE_MAX_ENTRIES:
+                    self._status_cache.clear()
+                self._status_cache[task_id] = (
+                    time.monotonic() + STATUS_CACHE_TTL,
+                    status_info,
+                )
+            return status_info
+
+        return {
+            "task_id": task_id,
+            "status": status,
+            "created_at": job_hash.get("created_at"),
+            "started_at": job_hash.get("started_at"),
+            "ended_at": job_hash.get("ended_at"),
+        }
+
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
         Get status of a task
@@ -1,5 +1,7 @@
 """Task definitions for RQ worker"""
 
+from types import MappingProxyType
+
 from app.tasks.agent_tasks import execute_agent_task, process_long_running_agent_task
 
 __all__ = [
@@ -7,12 +9,17 @@ __all__ = [
     "process_long_running_agent_task",
 ]
 
-
-def get_task_function(task_name: str):
-    """Get task function by name"""
-    task_map = {
+# Built once and read-only; lookups are a single hash hit instead of
+# rebuilding the dict per call
+_TASK_MAP = MappingProxyType(
+    {
         "execute_agent_task": execute_agent_task,
         "process_long_running_agent_task": process_long_running_agent_task,
     }
-    return task_map.get(task_name)
+)
+
+
+def get_task_function(task_name: str):
+    """Get task function by name"""
+    return _TASK_MAP.get(task_name)
 
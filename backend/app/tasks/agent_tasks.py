@@ -2,11 +2,71 @@
 
 import asyncio
 import logging
+import threading
+from functools import lru_cache
 from typing import Dict, Any, Optional
+
+try:
+    import uvloop
+except ImportError:  # uvloop is Linux/macOS only
+    uvloop = None
+
 from app.agents.infrastructure_monitor import InfrastructureMonitorAgent
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single agent execution inside a worker job
+AGENT_TASK_TIMEOUT = 600.0
+
+# One event loop per worker process, running in a daemon thread. Jobs
+# submit coroutines to it instead of building (and tearing down) a fresh
+# loop each time, so the agents' HTTP pools and clients stay warm
+# between jobs.
+_task_loop: Optional[asyncio.AbstractEventLoop] = None
+_task_loop_lock = threading.Lock()
+
+
+def _get_task_loop() -> asyncio.AbstractEventLoop:
+    """Get the persistent worker event loop, starting it on first use"""
+    global _task_loop
+    if _task_loop is None:
+        with _task_loop_lock:
+            if _task_loop is None:
+                if uvloop is not None:
+                    loop = uvloop.new_event_loop()
+                else:
+                    loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="agent-task-loop",
+                    daemon=True,
+                ).start()
+                _task_loop = loop
+    return _task_loop
+
+
+def _run_coroutine(coro) -> Any:
+    """Run a coroutine on the persistent loop and wait for its result"""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_task_loop())
+    return future.result(timeout=AGENT_TASK_TIMEOUT)
+
+
+# Agents by task name; construction compiles tool schemas and opens SDK
+# clients, so instances are shared across jobs. Per-call state travels
+# as execute() arguments, never on the agent itself.
+_AGENT_CLASSES = {
+    "infrastructure_monitor": InfrastructureMonitorAgent,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_agent(agent_name: str):
+    """Get or build the shared agent instance for a task name"""
+    agent_class = _AGENT_CLASSES.get(agent_name)
+    if agent_class is None:
+        raise ValueError(f"Unknown agent: {agent_name}")
+    return agent_class()
+
 
 def execute_agent_task(
     agent_name: str,
@@ -30,21 +90,12 @@ def execute_agent_task(
     """
     try:
         logger.info(f"Executing agent task: {agent_name} for session {session_id}")
-        
-        # Route to appropriate agent
-        if agent_name == "infrastructure_monitor":
-            agent = InfrastructureMonitorAgent()
-            # Run async execute in sync context
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                response = loop.run_until_complete(
-                    agent.execute(message, session_id=session_id, user_id=user_id)
-                )
-            finally:
-                loop.close()
-        else:
-            raise ValueError(f"Unknown agent: {agent_name}")
+
+        # Route to appropriate agent and run on the persistent worker loop
+        agent = _get_agent(agent_name)
+        response = _run_coroutine(
+            agent.execute(message, session_id=session_id, user_id=user_id)
+        )
         
         return {
             "status": "completed",
@@ -87,19 +138,10 @@ def process_long_running_agent_task(
         # job.meta['progress'] = 50
         # job.save_meta()
         
-        if agent_name == "infrastructure_monitor":
-            agent = InfrastructureMonitorAgent()
-            # Run async execute in sync context
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                response = loop.run_until_complete(
-                    agent.execute(message, session_id=session_id, user_id=user_id)
-                )
-            finally:
-                loop.close()
-        else:
-            raise ValueError(f"Unknown agent: {agent_name}")
+        agent = _get_agent(agent_name)
+        response = _run_coroutine(
+            agent.execute(message, session_id=session_id, user_id=user_id)
+        )
         
         return {
             "status": "completed",
@@ -0,0 +1,20 @@
+"""Content hashing utilities"""
+
+import xxhash
+
+
+def content_hash(content: str) -> str:
+    """Compute a stable, fast content hash for dedup keys and cache keys
+
+    Python's built-in hash() is randomized per process (PYTHONHASHSEED), so
+    it cannot be used for database keys: the same content would get a
+    different key after every restart. xxhash is stable and fast enough to
+    hash large code blobs on the request path.
+
+    Args:
+        content: Text to hash
+
+    Returns:
+        16-character hex digest
+    """
+    return xxhash.xxh3_128(content.encode()).hexdigest()[:16]
@@ -0,0 +1,45 @@
+"""Request body parsing helpers"""
+
+import asyncio
+from typing import Any
+
+import orjson
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.config import settings
+
+# Bodies above this size are parsed in a worker thread so a large payload
+# can't stall the event loop
+PARSE_OFFLOAD_BYTES = 64 * 1024
+
+
+async def parse_json_body(request: Request) -> Any:
+    """Read and parse a JSON request body with a size limit
+
+    Uses orjson instead of Starlette's stdlib json path, rejects bodies
+    over settings.MAX_WEBHOOK_BYTES with 413, and offloads parsing of
+    large payloads to a worker thread.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Parsed JSON body
+
+    Raises:
+        HTTPException: 413 when the body exceeds the size limit,
+            400 when it isn't valid JSON
+    """
+    raw = await request.body()
+    if len(raw) > settings.MAX_WEBHOOK_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Request body exceeds {settings.MAX_WEBHOOK_BYTES} bytes",
+        )
+    try:
+        if len(raw) > PARSE_OFFLOAD_BYTES:
+            return await asyncio.to_thread(orjson.loads, raw)
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
@@ -14,28 +14,37 @@ class DeploymentState(TypedDict):
     errors: list
 
 
+# Node results built once; LangGraph merges returned dicts into state
+# without mutating them, so hot nodes can share these instead of
+# allocating a fresh dict per invocation
+_PREFLIGHT_OK = {"status": "preflight_checks_complete"}
+_BUILD_OK = {"status": "build_complete"}
+_DEPLOY_OK = {"status": "deployed"}
+_VERIFY_OK = {"status": "verified"}
+
+
 async def preflight_checks_node(state: DeploymentState) -> DeploymentState:
     """Run pre-deployment checks"""
     # TODO: Implement pre-flight checks
-    return {"status": "preflight_checks_complete"}
+    return _PREFLIGHT_OK
 
 
 async def build_node(state: DeploymentState) -> DeploymentState:
     """Build service"""
     # TODO: Implement build
-    return {"status": "build_complete"}
+    return _BUILD_OK
 
 
 async def deploy_node(state: DeploymentState) -> DeploymentState:
     """Deploy service"""
     # TODO: Implement deployment
-    return {"status": "deployed"}
+    return _DEPLOY_OK
 
 
 async def verify_node(state: DeploymentState) -> DeploymentState:
     """Verify deployment"""
     # TODO: Implement verification
-    return {"status": "verified"}
+    return _VERIFY_OK
 
 
 # Build graph
@@ -54,3 +63,11 @@ workflow.add_edge("verify", END)
 
 deployment_workflow = workflow.compile()
 
+# Shared invocation config, built once instead of per call
+_CFG = {"recursion_limit": 10}
+
+
+async def run_deployment(initial: DeploymentState) -> DeploymentState:
+    """Invoke the compiled deployment workflow with the shared config"""
+    return await deployment_workflow.ainvoke(initial, config=_CFG)
+
@@ -1,11 +1,18 @@
 """LangGraph workflow for code review"""
 
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
 from typing import TypedDict, Annotated
 import operator
 from typing import List, Dict, Any
 
 
+# Boundary marker between code blobs marshaled into one review invocation;
+# generate_report emits one report section per blob (joined with
+# REPORT_DELIMITER) so callers can split the merged report back apart
+BATCH_DELIMITER = "\n\n# === FILE BOUNDARY ===\n\n"
+REPORT_DELIMITER = "\n# === REPORT BOUNDARY ===\n"
+
+
 class ReviewState(TypedDict):
     """State for code review workflow"""
     code: str
@@ -16,55 +23,75 @@ class ReviewState(TypedDict):
     errors: List[str]
 
 
+# Node results built once; the operator.add reducers copy the lists on
+# merge and nothing mutates the inner dicts, so hot nodes can share
+# these instead of allocating fresh ones per invocation
+_STATIC_ANALYSIS_OK = {
+    "static_analysis_result": [
+        {
+            "step": "static_analysis",
+            "status": "completed",
+            "findings": [],
+            "message": "Static analysis completed",
+        }
+    ]
+}
+_SECURITY_SCAN_OK = {
+    "security_scan_result": [
+        {
+            "step": "security_scan",
+            "status": "completed",
+            "findings": [],
+            "message": "Security scan completed",
+        }
+    ]
+}
+_BEST_PRACTICES_OK = {
+    "best_practices_result": [
+        {
+            "step": "best_practices",
+            "status": "completed",
+            "findings": [],
+            "message": "Best practices check completed",
+        }
+    ]
+}
+
+
 async def static_analysis_node(state: ReviewState) -> ReviewState:
     """Run static analysis on code"""
     # TODO: Implement actual static analysis
-    result = {
-        "step": "static_analysis",
-        "status": "completed",
-        "findings": [],
-        "message": "Static analysis completed",
-    }
-    return {"static_analysis_result": [result]}
+    return _STATIC_ANALYSIS_OK
 
 
 async def security_scan_node(state: ReviewState) -> ReviewState:
     """Run security scan"""
     # TODO: Implement actual security scan
-    result = {
-        "step": "security_scan",
-        "status": "completed",
-        "findings": [],
-        "message": "Security scan completed",
-    }
-    return {"security_scan_result": [result]}
+    return _SECURITY_SCAN_OK
 
 
 async def best_practices_node(state: ReviewState) -> ReviewState:
     """Check best practices"""
     # TODO: Implement actual best practices check
-    result = {
-        "step": "best_practices",
-        "status": "completed",
-        "findings": [],
-        "message": "Best practices check completed",
-    }
-    return {"best_practices_result": [result]}
+    return _BEST_PRACTICES_OK
 
 
 async def generate_report_node(state: ReviewState) -> ReviewState:
-    """Generate final report"""
+    """Generate final report, one section per marshaled code blob"""
     # TODO: Use agent to generate report
-    report = f"""
-Code Review Report
+    blobs = state.get("code", "").split(BATCH_DELIMITER)
+    sections = []
+    for index in range(len(blobs)):
+        sections.append(f"""
+Code Review Report ({index + 1}/{len(blobs)})
 
 Static Analysis: {len(state.get('static_analysis_result', []))} findings
 Security Scan: {len(state.get('security_scan_result', []))} findings
 Best Practices: {len(state.get('best_practices_result', []))} findings
 
 Review completed successfully.
-"""
-    return {"final_report": report}
+""")
+    return {"final_report": REPORT_DELIMITER.join(sections)}
 
 
 # Build graph
@@ -75,13 +102,26 @@ workflow.add_node("security_scan", security_scan_node)
 workflow.add_node("best_practices", best_practices_node)
 workflow.add_node("generate_report", generate_report_node)
 
-# Define edges
-workflow.set_entry_point("static_analysis")
-workflow.add_edge("static_analysis", "security_scan")
-workflow.add_edge("security_scan", "best_practices")
+# Define edges: the three scans only read state['code'] and write to
+# separate reducer keys, so they fan out from the entry point and run
+# concurrently, joining at generate_report. End-to-end latency becomes
+# max(scan times) instead of their sum.
+workflow.add_edge(START, "static_analysis")
+workflow.add_edge(START, "security_scan")
+workflow.add_edge(START, "best_practices")
+workflow.add_edge("static_analysis", "generate_report")
+workflow.add_edge("security_scan", "generate_report")
 workflow.add_edge("best_practices", "generate_report")
 workflow.add_edge("generate_report", END)
 
 # Compile workflow
 review_workflow = workflow.compile()
 
+# Shared invocation config, built once instead of per call
+_CFG = {"recursion_limit": 10}
+
+
+async def run_review(initial: ReviewState) -> ReviewState:
+    """Invoke the compiled review workflow with the shared config"""
+    return await review_workflow.ainvoke(initial, config=_CFG)
+
@@ -39,7 +39,7 @@ async def main():
     logger.info(f"Evaluating agent: {agent.agent_name}")
     logger.info(f"Test cases: {len(evaluator.test_cases)}")
     
-    results = evaluator.evaluate_agent(agent)
+    results = await evaluator.evaluate_agent(agent)
     
     # Generate report
     report = evaluator.generate_report(results)
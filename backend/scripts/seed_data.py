@@ -1,13 +1,14 @@
 """Seed database with sample data"""
 
 import asyncio
-from supabase import create_client, Client
-from app.config import settings
+from app.services.session_service import session_service
 
 
 async def seed_database():
     """Seed database with initial data"""
-    supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
+    # Reuse the service-wide client (service key with its tuned pool)
+    # rather than opening a second connection pool toward Supabase
+    supabase = session_service.supabase
 
     # Seed agent status
     agents = [
@@ -2,23 +2,76 @@
 
 import asyncio
 import logging
+from uuid import uuid4
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # uvloop is Linux/macOS only
+    pass
+
 from app.agents.infrastructure_monitor import InfrastructureMonitorAgent
+from app.dependencies import get_redis_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Adaptive poll interval: tighten toward MIN during anomalies, relax
+# toward MAX while everything is quiet
+BASE_INTERVAL = 30.0
+MIN_INTERVAL = 5.0
+MAX_INTERVAL = 300.0
+
+# Leader lock so multiple replicas don't duplicate the poll
+LEADER_LOCK_KEY = "monitor:leader"
+LEADER_LOCK_TTL_MS = 60_000
+
+
+async def _is_leader(redis_client, instance_id: str) -> bool:
+    """Acquire or refresh the monitor leader lock"""
+    try:
+        if await redis_client.set(
+            LEADER_LOCK_KEY, instance_id, nx=True, px=LEADER_LOCK_TTL_MS
+        ):
+            return True
+        holder = await redis_client.get(LEADER_LOCK_KEY)
+        if isinstance(holder, bytes):
+            holder = holder.decode()
+        if holder == instance_id:
+            await redis_client.pexpire(LEADER_LOCK_KEY, LEADER_LOCK_TTL_MS)
+            return True
+        return False
+    except Exception as e:
+        # Fail open: a duplicated poll beats no poll at all
+        logger.warning(f"Leader lock check failed: {e}")
+        return True
+
 
 async def start_monitoring():
     """Start infrastructure monitoring"""
     agent = InfrastructureMonitorAgent()
-    
+    redis_client = get_redis_client()
+    instance_id = uuid4().hex
+    interval = BASE_INTERVAL
+
     while True:
         try:
+            if not await _is_leader(redis_client, instance_id):
+                await asyncio.sleep(BASE_INTERVAL)
+                continue
+
             result = await agent.monitor_services()
             logger.info(f"Monitoring complete: {result['status']}")
-            await asyncio.sleep(30)  # Monitor every 30 seconds
+            # Poll faster while an incident is unfolding, back off when
+            # services stay healthy to save RTTs and LLM tokens
+            if result.get("anomaly"):
+                interval = max(MIN_INTERVAL, interval * 0.5)
+            else:
+                interval = min(MAX_INTERVAL, interval * 1.5)
+            await asyncio.sleep(interval)
         except Exception as e:
             logger.error(f"Error in monitoring: {e}")
+            interval = BASE_INTERVAL
             await asyncio.sleep(60)  # Wait longer on error
 
 
@@ -4,7 +4,14 @@
 import os
 import sys
 import logging
-from rq import Worker, Queue, Connection
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # uvloop is Linux/macOS only
+    pass
+
+from rq import SimpleWorker, Queue
 from redis import Redis
 from app.config import settings
 
@@ -14,6 +21,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Heartbeat TTL and how often running jobs are checked on
+WORKER_TTL = 420
+JOB_MONITORING_INTERVAL = 30
+
+
+def _log_job_failure(job, exc_type, exc_value, traceback):
+    """Log failed jobs; returning True lets default handlers run too"""
+    logger.error(f"Job {job.id} failed: {exc_value}")
+    return True
+
 
 def main():
     """Start RQ worker"""
@@ -31,10 +48,18 @@ def main():
         logger.info(f"Redis URL: {settings.REDIS_URL}")
         logger.info(f"Queue: default")
         
-        # Start worker
-        with Connection(redis_conn):
-            worker = Worker([queue])
-            worker.work()
+        # SimpleWorker runs jobs in-process instead of forking a work
+        # horse per job. Agent tasks are I/O-bound, and skipping the fork
+        # keeps the cached agent instances and the persistent event loop
+        # warm across jobs; scale with OS-level worker replicas instead.
+        worker = SimpleWorker(
+            [queue],
+            connection=redis_conn,
+            worker_ttl=WORKER_TTL,
+            job_monitoring_interval=JOB_MONITORING_INTERVAL,
+        )
+        worker.push_exc_handler(_log_job_failure)
+        worker.work()
     except KeyboardInterrupt:
         logger.info("Worker stopped by user")
         sys.exit(0)
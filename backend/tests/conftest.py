@@ -1,16 +1,131 @@
 """Pytest configuration and fixtures"""
 
+import asyncio
+
 import pytest
+from collections import defaultdict
+from typing import Dict, List
 from unittest.mock import Mock, AsyncMock
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from app.main import app
 from app.middleware.auth import UserContext, Role
 
 
-@pytest.fixture
+class FakeAsyncRedis:
+    """Minimal async Redis double for unit tests
+
+    Records each call's positional args in `calls` and serves results
+    from `returns`; a fraction of AsyncMock's per-call bookkeeping cost,
+    which dominates short unit tests. Pipelines queue commands and replay
+    them through the same recording methods on execute().
+    """
+
+    _DEFAULTS = {
+        "get": None,
+        "set": True,
+        "delete": 1,
+        "exists": False,
+        "keys": ["key1", "key2"],
+    }
+
+    def __init__(self):
+        self.calls: Dict[str, List[tuple]] = defaultdict(list)
+        self.returns = dict(self._DEFAULTS)
+
+    def reset(self):
+        """Clear call records and restore default return values"""
+        self.calls.clear()
+        self.returns = dict(self._DEFAULTS)
+
+    async def get(self, key):
+        self.calls["get"].append((key,))
+        return self.returns["get"]
+
+    async def set(self, key, value, ex=None):
+        self.calls["set"].append((key, value, ex))
+        return self.returns["set"]
+
+    async def delete(self, *keys):
+        self.calls["delete"].append(keys)
+        return self.returns["delete"]
+
+    async def exists(self, key):
+        self.calls["exists"].append((key,))
+        return self.returns["exists"]
+
+    async def keys(self, pattern):
+        self.calls["keys"].append((pattern,))
+        return self.returns["keys"]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    """Pipeline double: queues commands, replays them on execute()"""
+
+    def __init__(self, fake: FakeAsyncRedis):
+        self._fake = fake
+        self._queued: List[tuple] = []
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self._queued.append((name, args, kwargs))
+        return _queue
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def execute(self):
+        return [
+            await getattr(self._fake, name)(*args, **kwargs)
+            for name, args, kwargs in self._queued
+        ]
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """uvloop-backed loop policy when available
+
+    The session-wide loop itself comes from the asyncio_default_*_loop_scope
+    ini options; overriding the `event_loop` fixture stopped working in
+    pytest-asyncio 1.0. One loop for the whole session means services with
+    background tasks (cache writer, event bus flusher) stay bound to a live
+    loop across tests.
+    """
+    try:
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Test client fixture"""
-    return TestClient(app)
+    """Shared test client
+
+    Session-scoped: app startup/shutdown and ASGI transport construction
+    run once for the whole suite instead of once per test.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+async def aclient():
+    """Async test client over the ASGI app
+
+    Requests run on the test's event loop rather than blocking the test
+    thread, so async tests can issue independent calls concurrently with
+    asyncio.gather.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture
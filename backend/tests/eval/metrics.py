@@ -1,10 +1,49 @@
 """Evaluation metrics and scoring functions"""
 
-from typing import Dict, Any, List
+import functools
+from typing import Dict, Any, List, FrozenSet, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Last (id(context), vocabulary) pair seen by faithfulness scoring.
+# Evaluation loops score many answers against the same context list, so
+# a single-slot memo catches the common case without holding stale
+# references alive.
+_last_context_vocab: Optional[Tuple[int, FrozenSet[str]]] = None
+
+# Common stop words ignored by relevancy scoring, built once at import
+_STOP_WORDS = frozenset({"the", "a", "an", "is", "are", "was", "were", "be", "been"})
+
+
+def _context_vocabulary(context: List[str]) -> FrozenSet[str]:
+    """Token set for a context list, memoized on list identity
+
+    Tokenizes chunk by chunk rather than joining the whole context into
+    one throwaway string first.
+    """
+    global _last_context_vocab
+    if _last_context_vocab is not None and _last_context_vocab[0] == id(context):
+        return _last_context_vocab[1]
+
+    context_words = set()
+    for chunk in context:
+        context_words.update(chunk.lower().split())
+    vocabulary = frozenset(context_words)
+    _last_context_vocab = (id(context), vocabulary)
+    return vocabulary
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokenize(text: str) -> FrozenSet[str]:
+    """Lowercased token set for a string, cached per input
+
+    The same answers/expectations are tokenized repeatedly across
+    metrics (precision, recall, F1 all see the same pair), so the
+    split+lower work is done once per distinct string.
+    """
+    return frozenset(text.lower().split())
+
 
 class MetricsCalculator:
     """Calculate various evaluation metrics"""
@@ -13,54 +52,48 @@ class MetricsCalculator:
     def calculate_faithfulness_score(answer: str, context: List[str]) -> float:
         """
         Calculate faithfulness score (how well answer is supported by context)
-        
+
         Args:
             answer: Agent's answer
             context: Context used to generate answer
-        
+
         Returns:
             Score between 0 and 1
         """
         # Simple implementation - check if answer keywords appear in context
         if not context:
             return 0.0
-        
-        answer_words = set(answer.lower().split())
-        context_text = " ".join(context).lower()
-        context_words = set(context_text.split())
-        
+
+        answer_words = _tokenize(answer)
+        context_words = _context_vocabulary(context)
+
         overlap = len(answer_words & context_words)
         total_answer_words = len(answer_words)
-        
+
         if total_answer_words == 0:
             return 0.0
-        
+
         return min(overlap / total_answer_words, 1.0)
 
     @staticmethod
     def calculate_relevancy_score(question: str, answer: str) -> float:
         """
         Calculate answer relevancy score
-        
+
         Args:
             question: Original question
             answer: Agent's answer
-        
+
         Returns:
             Score between 0 and 1
         """
-        # Simple implementation - check keyword overlap
-        question_words = set(question.lower().split())
-        answer_words = set(answer.lower().split())
-        
-        # Remove common stop words
-        stop_words = {"the", "a", "an", "is", "are", "was", "were", "be", "been"}
-        question_words = question_words - stop_words
-        answer_words = answer_words - stop_words
-        
+        # Simple implementation - check keyword overlap, ignoring stop words
+        question_words = _tokenize(question) - _STOP_WORDS
+        answer_words = _tokenize(answer) - _STOP_WORDS
+
         if not question_words:
             return 0.0
-        
+
         overlap = len(question_words & answer_words)
         return min(overlap / len(question_words), 1.0)
 
@@ -68,20 +101,20 @@ class MetricsCalculator:
     def calculate_precision_score(expected: str, actual: str) -> float:
         """
         Calculate precision score
-        
+
         Args:
             expected: Expected answer
             actual: Actual answer
-        
+
         Returns:
             Score between 0 and 1
         """
-        expected_words = set(expected.lower().split())
-        actual_words = set(actual.lower().split())
-        
+        expected_words = _tokenize(expected)
+        actual_words = _tokenize(actual)
+
         if not actual_words:
             return 0.0
-        
+
         overlap = len(expected_words & actual_words)
         return min(overlap / len(actual_words), 1.0)
 
@@ -89,20 +122,20 @@ class MetricsCalculator:
     def calculate_recall_score(expected: str, actual: str) -> float:
         """
         Calculate recall score
-        
+
         Args:
             expected: Expected answer
             actual: Actual answer
-        
+
         Returns:
             Score between 0 and 1
         """
-        expected_words = set(expected.lower().split())
-        actual_words = set(actual.lower().split())
-        
+        expected_words = _tokenize(expected)
+        actual_words = _tokenize(actual)
+
         if not expected_words:
             return 0.0
-        
+
         overlap = len(expected_words & actual_words)
         return min(overlap / len(expected_words), 1.0)
 
@@ -110,19 +143,27 @@ class MetricsCalculator:
     def calculate_f1_score(expected: str, actual: str) -> float:
         """
         Calculate F1 score (harmonic mean of precision and recall)
-        
+
         Args:
             expected: Expected answer
             actual: Actual answer
-        
+
         Returns:
             F1 score between 0 and 1
         """
-        precision = MetricsCalculator.calculate_precision_score(expected, actual)
-        recall = MetricsCalculator.calculate_recall_score(expected, actual)
-        
+        # Tokenize once and derive both components from a single overlap
+        # instead of delegating to precision/recall (which would redo it)
+        expected_words = _tokenize(expected)
+        actual_words = _tokenize(actual)
+
+        if not expected_words or not actual_words:
+            return 0.0
+
+        overlap = len(expected_words & actual_words)
+        precision = min(overlap / len(actual_words), 1.0)
+        recall = min(overlap / len(expected_words), 1.0)
+
         if precision + recall == 0:
             return 0.0
-        
-        return 2 * (precision * recall) / (precision + recall)
 
+        return 2 * (precision * recall) / (precision + recall)
@@ -3,8 +3,9 @@
 from app.tests.eval.agent_evaluator import TestCase
 
 
-# Test cases for infrastructure monitoring
-INFRASTRUCTURE_TEST_CASES = [
+# Test cases for infrastructure monitoring (immutable: frozen cases in a
+# tuple, safe to share across concurrent evaluation runs)
+INFRASTRUCTURE_TEST_CASES = (
     TestCase(
         name="check_docker_status",
         question="What is the status of Docker containers?",
@@ -29,5 +30,5 @@ INFRASTRUCTURE_TEST_CASES = [
         expected_answer="database",
         ground_truth="The agent should check database connection status and report health."
     ),
-]
+)
 
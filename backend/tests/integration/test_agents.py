@@ -1,12 +1,7 @@
 """Integration tests for agent endpoints"""
 
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
-
-
-def test_list_agents():
+def test_list_agents(client):
     """Test listing all agents"""
     response = client.get("/api/agents/")
     assert response.status_code == 200
@@ -15,7 +10,7 @@ def test_list_agents():
     assert len(data) > 0
 
 
-def test_get_agent_status():
+def test_get_agent_status(client):
     """Test getting agent status"""
     response = client.get("/api/agents/infrastructure_monitor")
     assert response.status_code == 200
@@ -1,12 +1,7 @@
 """Integration tests for chat endpoints"""
 
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
-
-
-def test_chat_endpoint():
+def test_chat_endpoint(client):
     """Test chat endpoint"""
     response = client.post(
         "/api/chat/",
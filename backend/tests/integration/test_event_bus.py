@@ -0,0 +1,118 @@
+"""Integration tests for the Event Bus
+
+Converted from the standalone test_event_bus.py script: the same three
+checks (direct publish, dispatcher batch, SSE formatting) now run under
+pytest-asyncio on one shared event loop, so the bus flusher task and
+pooled Redis connection are reused across tests instead of being rebuilt
+per run.
+"""
+
+import pytest
+
+from app.event_bus import get_event_bus, get_event_dispatcher
+from app.event_bus.schema import Event
+
+
+@pytest.fixture(scope="session")
+async def bus():
+    """Shared singleton event bus, drained once after the session"""
+    bus = get_event_bus()
+    yield bus
+    await bus.aclose()
+
+
+async def test_event_bus_direct(bus):
+    """Publish an event directly to the event bus"""
+    event = Event(
+        session_id="test-session-123",
+        type="tool_call_started",
+        payload={
+            "tool_call_id": "tc_001",
+            "tool_name": "docker_list_containers",
+            "args": {"status": "running"},
+            "agent": "infrastructure_monitor",
+        },
+    )
+
+    await bus.publish(event)
+
+
+async def test_event_dispatcher(bus):
+    """Publish one event per type through the dispatcher batch context"""
+    dispatcher = get_event_dispatcher()
+    session_id = "test-session-456"
+
+    async with dispatcher.batch() as b:
+        await b.session_started(
+            session_id=session_id,
+            agent="infrastructure_monitor",
+            metadata={"test": True},
+        )
+        await b.agent_message_delta(
+            session_id=session_id,
+            message_id="msg_001",
+            delta="Checking Docker containers...",
+        )
+        await b.tool_call_started(
+            session_id=session_id,
+            tool_call_id="tc_002",
+            tool_name="docker_list_containers",
+            args={"status": "running"},
+            agent="infrastructure_monitor",
+        )
+        await b.tool_call_result(
+            session_id=session_id,
+            tool_call_id="tc_002",
+            tool_name="docker_list_containers",
+            result={"containers": [{"id": "abc123", "name": "nginx"}]},
+        )
+        await b.workflow_started(
+            session_id=session_id,
+            workflow="monitoring_workflow",
+            run_id="run_001",
+        )
+        await b.workflow_step_started(
+            session_id=session_id,
+            run_id="run_001",
+            step_id="check_docker",
+            description="Checking Docker containers",
+        )
+        await b.workflow_transition(
+            session_id=session_id,
+            run_id="run_001",
+            from_step="check_docker",
+            to_step="analyze_metrics",
+            reason="Docker check completed",
+        )
+        await b.metrics_update(
+            session_id=session_id,
+            cpu=45.2,
+            memory_used="2.1GB",
+            disk_free="50GB",
+            containers_running=3,
+        )
+        await b.run_error(
+            session_id=session_id,
+            error_type="ConnectionError",
+            message="Failed to connect to Docker daemon",
+            agent="infrastructure_monitor",
+            step="check_docker",
+        )
+
+
+async def test_sse_format():
+    """SSE formatting wraps the event JSON in an event/data frame"""
+    event = Event(
+        session_id="test-session-789",
+        type="agent_message_delta",
+        payload={
+            "message_id": "msg_001",
+            "delta": "Hello from the event bus!",
+        },
+    )
+
+    sse_output = event.to_sse()
+
+    assert sse_output.startswith("event: agent_message_delta\ndata: ")
+    assert sse_output.endswith("\n\n")
+    assert event.to_sse_bytes() == sse_output.encode()
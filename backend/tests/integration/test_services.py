@@ -9,16 +9,16 @@ from app.services.session_service import session_service
 async def test_cache_service():
     """Test cache service"""
     # Test set and get
-    cache_service.set("test_key", {"test": "value"}, ttl=60)
-    value = cache_service.get("test_key")
+    await cache_service.set("test_key", {"test": "value"}, ttl=60)
+    value = await cache_service.get("test_key")
     assert value == {"test": "value"}
 
     # Test exists
-    assert cache_service.exists("test_key") is True
+    assert await cache_service.exists("test_key") is True
 
     # Test delete
-    cache_service.delete("test_key")
-    assert cache_service.exists("test_key") is False
+    await cache_service.delete("test_key")
+    assert await cache_service.exists("test_key") is False
 
 
 @pytest.mark.asyncio
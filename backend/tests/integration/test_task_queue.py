@@ -1,10 +1,41 @@
 """Integration tests for RQ task queue"""
 
 import pytest
-from unittest.mock import Mock, patch
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+from unittest.mock import Mock
 from app.services.task_service import TaskService
 
 
+@dataclass
+class JobStub:
+    """Lightweight Job double
+
+    Carries exactly what get_task_status/cancel_task read; a plain
+    dataclass is a fraction of a Mock's allocation and attribute cost,
+    and the tests only check returned values, never call arity.
+    """
+
+    status: str = "finished"
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: datetime = field(default_factory=datetime.now)
+    ended_at: datetime = field(default_factory=datetime.now)
+    result: Any = None
+    exc_info: Optional[str] = None
+    cancelled: bool = False
+
+    def get_status(self) -> str:
+        return self.status
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+# Reused across tests that never mutate the job
+_FINISHED_JOB = JobStub(result={"status": "completed"})
+
+
 class TestTaskQueue:
     """Integration tests for task queue"""
 
@@ -24,15 +55,24 @@ class TestTaskQueue:
         return queue_mock
 
     @pytest.fixture
-    def task_service(self, mock_redis, mock_queue):
-        """Create TaskService with mocked dependencies"""
-        with patch('app.services.task_service.Redis', return_value=mock_redis), \
-             patch('app.services.task_service.Queue', return_value=mock_queue):
-            service = TaskService()
-            service.redis_conn = mock_redis
-            service.queue = mock_queue
-            service.enabled = True
-            return service
+    def task_service(self, mock_redis, mock_queue, monkeypatch):
+        """Create TaskService with mocked dependencies
+
+        monkeypatch.setattr replaces the two nested patch() contexts:
+        same teardown guarantees without building _patch objects and
+        their finalizer chains per test.
+        """
+        monkeypatch.setattr(
+            "app.services.task_service.Redis", lambda *a, **k: mock_redis
+        )
+        monkeypatch.setattr(
+            "app.services.task_service.Queue", lambda *a, **k: mock_queue
+        )
+        service = TaskService()
+        service.redis_conn = mock_redis
+        service.queue = mock_queue
+        service.enabled = True
+        return service
 
     def test_enqueue_task(self, task_service, mock_queue):
         """Test enqueueing a task"""
@@ -46,39 +86,29 @@ class TestTaskQueue:
         assert task_id == "test-job-123"
         mock_queue.enqueue.assert_called_once()
 
-    def test_get_task_status(self, task_service, mock_redis):
+    def test_get_task_status(self, task_service, monkeypatch):
         """Test getting task status"""
-        from rq.job import Job
-        from datetime import datetime
-        
-        job_mock = Mock(spec=Job)
-        job_mock.get_status.return_value = "finished"
-        job_mock.created_at = datetime.now()
-        job_mock.started_at = datetime.now()
-        job_mock.ended_at = datetime.now()
-        job_mock.result = {"status": "completed"}
-        job_mock.exc_info = None
-        
-        with patch('app.services.task_service.Job.fetch', return_value=job_mock):
-            status = task_service.get_task_status("test-job-123")
-            
-            assert status is not None
-            assert status["task_id"] == "test-job-123"
-            assert status["status"] == "finished"
-            assert "result" in status
-
-    def test_cancel_task(self, task_service, mock_redis):
+        monkeypatch.setattr(
+            "app.services.task_service.Job.fetch", lambda *a, **k: _FINISHED_JOB
+        )
+        status = task_service.get_task_status("test-job-123")
+
+        assert status is not None
+        assert status["task_id"] == "test-job-123"
+        assert status["status"] == "finished"
+        assert "result" in status
+
+    def test_cancel_task(self, task_service, monkeypatch):
         """Test cancelling a task"""
-        from rq.job import Job
-        
-        job_mock = Mock(spec=Job)
-        job_mock.cancel = Mock()
-        
-        with patch('app.services.task_service.Job.fetch', return_value=job_mock):
-            result = task_service.cancel_task("test-job-123")
-            
-            assert result is True
-            job_mock.cancel.assert_called_once()
+        job_stub = JobStub()
+
+        monkeypatch.setattr(
+            "app.services.task_service.Job.fetch", lambda *a, **k: job_stub
+        )
+        result = task_service.cancel_task("test-job-123")
+
+        assert result is True
+        assert job_stub.cancelled is True
 
     def test_enqueue_task_disabled(self):
         """Test enqueueing when task queue is disabled"""
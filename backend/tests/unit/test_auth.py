@@ -1,6 +1,7 @@
 """Unit tests for authentication middleware"""
 
 import pytest
+from types import SimpleNamespace
 from fastapi import HTTPException
 from app.middleware.auth import (
     UserContext,
@@ -30,26 +31,19 @@ class TestUserContext:
         assert user.role == Role.USER
         assert user.metadata == {"name": "Test User"}
 
-    def test_has_role_user(self):
-        """Test role checking for USER role"""
-        user = UserContext("user-1", "user@example.com", Role.USER)
-        assert user.has_role(Role.USER) is True
-        assert user.has_role(Role.ADMIN) is False
-        assert user.has_role(Role.AGENT) is False
-
-    def test_has_role_agent(self):
-        """Test role checking for AGENT role"""
-        user = UserContext("agent-1", "agent@example.com", Role.AGENT)
-        assert user.has_role(Role.USER) is True
-        assert user.has_role(Role.AGENT) is True
-        assert user.has_role(Role.ADMIN) is False
-
-    def test_has_role_admin(self):
-        """Test role checking for ADMIN role"""
-        user = UserContext("admin-1", "admin@example.com", Role.ADMIN)
-        assert user.has_role(Role.USER) is True
-        assert user.has_role(Role.AGENT) is True
-        assert user.has_role(Role.ADMIN) is True
+    @pytest.mark.parametrize(
+        "role,expected",
+        [
+            (Role.USER, {Role.USER: True, Role.AGENT: False, Role.ADMIN: False}),
+            (Role.AGENT, {Role.USER: True, Role.AGENT: True, Role.ADMIN: False}),
+            (Role.ADMIN, {Role.USER: True, Role.AGENT: True, Role.ADMIN: True}),
+        ],
+    )
+    def test_has_role(self, role, expected):
+        """Test role checking across the role hierarchy"""
+        user = UserContext("user-1", "user@example.com", role)
+        for target_role, allowed in expected.items():
+            assert user.has_role(target_role) is allowed
 
 
 class TestRequireRole:
@@ -79,41 +73,23 @@ class TestVerifyAPIKey:
     """Tests for API key verification"""
 
     @pytest.mark.asyncio
-    async def test_verify_api_key_valid(self, monkeypatch):
-        """Test verifying a valid API key"""
-        test_key = "test-service-key"
-        monkeypatch.setattr(settings, "SUPABASE_SERVICE_KEY", test_key)
-        
-        from fastapi import Request
-        from unittest.mock import Mock
-        
-        request = Mock(spec=Request)
-        request.headers = {"X-API-Key": test_key}
-        
-        result = await verify_api_key(request)
-        assert result is True
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            ({"X-API-Key": "test-service-key"}, True),
+            ({"X-API-Key": "invalid-key"}, False),
+            ({}, False),
+        ],
+        ids=["valid", "invalid", "missing"],
+    )
+    async def test_verify_api_key(self, monkeypatch, headers, expected):
+        """Test API key verification for valid, invalid and missing keys"""
+        monkeypatch.setattr(settings, "SUPABASE_SERVICE_KEY", "test-service-key")
+
+        # verify_api_key only reads .headers; a namespace skips the heavy
+        # Mock(spec=Request) reflection over the Request class
+        request = SimpleNamespace(headers=headers)
 
-    @pytest.mark.asyncio
-    async def test_verify_api_key_invalid(self):
-        """Test verifying an invalid API key"""
-        from fastapi import Request
-        from unittest.mock import Mock
-        
-        request = Mock(spec=Request)
-        request.headers = {"X-API-Key": "invalid-key"}
-        
-        result = await verify_api_key(request)
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_verify_api_key_missing(self):
-        """Test verifying when API key is missing"""
-        from fastapi import Request
-        from unittest.mock import Mock
-        
-        request = Mock(spec=Request)
-        request.headers = {}
-        
         result = await verify_api_key(request)
-        assert result is False
+        assert result is expected
 
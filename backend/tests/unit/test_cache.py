@@ -1,81 +1,90 @@
 """Unit tests for cache service"""
 
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import patch
 from app.services.cache_service import CacheService
+from tests.conftest import FakeAsyncRedis
+
+
+@pytest.fixture(scope="module")
+def mock_redis():
+    """Fake Redis client, built once per module"""
+    return FakeAsyncRedis()
+
+
+@pytest.fixture(scope="module")
+def cache_service(mock_redis):
+    """Create CacheService with the fake Redis, once per module"""
+    with patch('app.services.cache_service.get_redis_client', return_value=mock_redis):
+        return CacheService()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_redis(mock_redis):
+    """Clear call records and restore defaults on the shared fake"""
+    yield
+    mock_redis.reset()
 
 
 class TestCacheService:
-    """Tests for CacheService"""
-
-    @pytest.fixture
-    def mock_redis(self):
-        """Mock Redis client"""
-        redis_mock = AsyncMock()
-        redis_mock.get = AsyncMock(return_value=None)
-        redis_mock.set = AsyncMock(return_value=True)
-        redis_mock.delete = AsyncMock(return_value=1)
-        redis_mock.exists = AsyncMock(return_value=False)
-        return redis_mock
-
-    @pytest.fixture
-    def cache_service(self, mock_redis):
-        """Create CacheService with mocked Redis"""
-        with patch('app.services.cache_service.get_redis_client', return_value=mock_redis):
-            return CacheService()
+    """Tests for CacheService
+
+    The fake client and service come from the module-scoped fixtures
+    above; each test sees a reset fake rather than a fresh one.
+    """
 
     @pytest.mark.asyncio
     async def test_get_cache_miss(self, cache_service, mock_redis):
         """Test getting a value that doesn't exist"""
-        mock_redis.get.return_value = None
-        
+        mock_redis.returns["get"] = None
+
         result = await cache_service.get("test-key")
         assert result is None
-        mock_redis.get.assert_called_once_with("test-key")
+        assert mock_redis.calls["get"] == [("test-key",)]
 
     @pytest.mark.asyncio
     async def test_get_cache_hit(self, cache_service, mock_redis):
         """Test getting a cached value"""
-        mock_redis.get.return_value = '{"test": "value"}'
-        
+        mock_redis.returns["get"] = '{"test": "value"}'
+
         result = await cache_service.get("test-key")
         assert result == {"test": "value"}
-        mock_redis.get.assert_called_once_with("test-key")
+        assert mock_redis.calls["get"] == [("test-key",)]
 
     @pytest.mark.asyncio
     async def test_set_cache(self, cache_service, mock_redis):
         """Test setting a cache value"""
         await cache_service.set("test-key", {"test": "value"}, ttl=3600)
-        
-        mock_redis.set.assert_called_once()
-        call_args = mock_redis.set.call_args
-        assert call_args[0][0] == "test-key"
-        assert "test" in call_args[0][1]
-        assert call_args[1]["ex"] == 3600
+
+        # Writes go through the coalescing pipeline; the replayed SET
+        # lands in the fake's call record
+        assert len(mock_redis.calls["set"]) == 1
+        key, value, ex = mock_redis.calls["set"][0]
+        assert key == "test-key"
+        assert b"test" in value
+        assert ex == 3600
 
     @pytest.mark.asyncio
     async def test_delete_cache(self, cache_service, mock_redis):
         """Test deleting a cache value"""
         await cache_service.delete("test-key")
-        
-        mock_redis.delete.assert_called_once_with("test-key")
+
+        assert mock_redis.calls["delete"] == [("test-key",)]
 
     @pytest.mark.asyncio
     async def test_exists(self, cache_service, mock_redis):
         """Test checking if a key exists"""
-        mock_redis.exists.return_value = True
-        
+        mock_redis.returns["exists"] = True
+
         result = await cache_service.exists("test-key")
         assert result is True
-        mock_redis.exists.assert_called_once_with("test-key")
+        assert mock_redis.calls["exists"] == [("test-key",)]
 
     @pytest.mark.asyncio
     async def test_clear_pattern(self, cache_service, mock_redis):
         """Test clearing cache by pattern"""
-        mock_redis.keys = AsyncMock(return_value=["key1", "key2"])
-        mock_redis.delete = AsyncMock(return_value=2)
-        
+        mock_redis.returns["delete"] = 2
+
         result = await cache_service.clear_pattern("test:*")
         assert result == 2
-        mock_redis.keys.assert_called_once_with("test:*")
-
+        assert mock_redis.calls["keys"] == [("test:*",)]
@@ -1,12 +1,7 @@
 """Unit tests for health endpoints"""
 
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
-
-
-def test_health_check():
+def test_health_check(client):
     """Test basic health check"""
     response = client.get("/api/health/")
     assert response.status_code == 200
@@ -15,7 +10,7 @@ def test_health_check():
     assert data["service"] == "adk-devops-assistant"
 
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint"""
     response = client.get("/")
     assert response.status_code == 200
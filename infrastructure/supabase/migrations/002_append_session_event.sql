@@ -0,0 +1,29 @@
+-- Single round-trip event append for SessionService.add_event
+--
+-- Replaces the read-modify-write sequence (select events, append in
+-- Python, update, insert history) with one atomic function call, which
+-- also closes the lost-update window between concurrent appends.
+
+CREATE OR REPLACE FUNCTION append_session_event(p_session_id TEXT, p_event JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE adk_sessions
+    SET events = events || p_event
+    WHERE session_id = p_session_id;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO session_history (session_id, user_message, agent_response, agent_name, metadata)
+    VALUES (
+        p_session_id,
+        COALESCE(p_event->>'user_message', ''),
+        COALESCE(p_event->>'agent_response', ''),
+        COALESCE(p_event->>'agent_name', 'unknown'),
+        COALESCE(p_event->'metadata', '{}'::jsonb)
+    );
+END;
+$$;
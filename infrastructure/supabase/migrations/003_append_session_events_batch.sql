@@ -0,0 +1,29 @@
+-- Batch variant of append_session_event for the in-process event batcher
+--
+-- Takes a jsonb array of events: one array concat onto adk_sessions.events
+-- plus a set-based insert into session_history, so a coalesced burst of
+-- appends costs a single round trip per session.
+
+CREATE OR REPLACE FUNCTION append_session_events(p_session_id TEXT, p_events JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE adk_sessions
+    SET events = events || p_events
+    WHERE session_id = p_session_id;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO session_history (session_id, user_message, agent_response, agent_name, metadata)
+    SELECT
+        p_session_id,
+        COALESCE(e->>'user_message', ''),
+        COALESCE(e->>'agent_response', ''),
+        COALESCE(e->>'agent_name', 'unknown'),
+        COALESCE(e->'metadata', '{}'::jsonb)
+    FROM jsonb_array_elements(p_events) AS e;
+END;
+$$;
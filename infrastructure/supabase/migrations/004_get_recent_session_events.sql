@@ -0,0 +1,22 @@
+-- Server-side slice of a session's events history.
+-- PostgREST cannot slice JSONB arrays, so without this function callers
+-- had to pull the entire events column to read its tail. Returns the
+-- last p_limit events in chronological order as a JSONB array.
+CREATE OR REPLACE FUNCTION get_recent_session_events(
+    p_session_id TEXT,
+    p_limit INT DEFAULT 50
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(jsonb_agg(recent.e ORDER BY recent.ord), '[]'::jsonb)
+    FROM (
+        SELECT t.e, t.ord
+        FROM adk_sessions s,
+             jsonb_array_elements(s.events) WITH ORDINALITY AS t(e, ord)
+        WHERE s.session_id = p_session_id
+        ORDER BY t.ord DESC
+        LIMIT p_limit
+    ) recent;
+$$;
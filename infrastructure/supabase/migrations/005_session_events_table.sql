@@ -0,0 +1,116 @@
+-- Move session events out of the adk_sessions.events JSONB array into an
+-- append-only child table.
+--
+-- Appending to a JSONB array rewrites the whole TOASTed value (and
+-- proportional WAL) on every append, so each event cost O(history size).
+-- An append-only table makes every append an O(1) insert; reads take the
+-- tail with ORDER BY seq DESC LIMIT N off the primary key.
+
+CREATE TABLE IF NOT EXISTS adk_session_events (
+    session_id TEXT NOT NULL,
+    seq BIGINT GENERATED ALWAYS AS IDENTITY,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (session_id, seq)
+);
+-- The composite primary key's btree already serves
+-- (session_id, seq DESC) tail scans; no extra index needed.
+
+-- Backfill existing histories in their array order.
+INSERT INTO adk_session_events (session_id, payload)
+SELECT s.session_id, t.e
+FROM adk_sessions s,
+     jsonb_array_elements(s.events) WITH ORDINALITY AS t(e, ord)
+ORDER BY s.session_id, t.ord;
+
+-- Repoint the append functions at the child table. Signatures are
+-- unchanged, so SessionService needs no code change; the JSONB array in
+-- adk_sessions is left as-is (frozen) for rollback.
+CREATE OR REPLACE FUNCTION append_session_event(p_session_id TEXT, p_event JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM 1 FROM adk_sessions WHERE session_id = p_session_id;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO adk_session_events (session_id, payload)
+    VALUES (p_session_id, p_event);
+
+    INSERT INTO session_history (session_id, user_message, agent_response, agent_name, metadata)
+    VALUES (
+        p_session_id,
+        COALESCE(p_event->>'user_message', ''),
+        COALESCE(p_event->>'agent_response', ''),
+        COALESCE(p_event->>'agent_name', 'unknown'),
+        COALESCE(p_event->'metadata', '{}'::jsonb)
+    );
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION append_session_events(p_session_id TEXT, p_events JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM 1 FROM adk_sessions WHERE session_id = p_session_id;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO adk_session_events (session_id, payload)
+    SELECT p_session_id, t.e
+    FROM jsonb_array_elements(p_events) WITH ORDINALITY AS t(e, ord)
+    ORDER BY t.ord;
+
+    INSERT INTO session_history (session_id, user_message, agent_response, agent_name, metadata)
+    SELECT
+        p_session_id,
+        COALESCE(e->>'user_message', ''),
+        COALESCE(e->>'agent_response', ''),
+        COALESCE(e->>'agent_name', 'unknown'),
+        COALESCE(e->'metadata', '{}'::jsonb)
+    FROM jsonb_array_elements(p_events) AS e;
+END;
+$$;
+
+-- Tail reads come off the child table now: an index scan over the last
+-- p_limit rows instead of exploding the JSONB array.
+CREATE OR REPLACE FUNCTION get_recent_session_events(
+    p_session_id TEXT,
+    p_limit INT DEFAULT 50
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(jsonb_agg(recent.payload ORDER BY recent.seq), '[]'::jsonb)
+    FROM (
+        SELECT payload, seq
+        FROM adk_session_events
+        WHERE session_id = p_session_id
+        ORDER BY seq DESC
+        LIMIT p_limit
+    ) recent;
+$$;
+
+-- Backward-compat view exposing the old shape (session row + full events
+-- array) for consumers not yet migrated off it.
+CREATE OR REPLACE VIEW adk_sessions_v AS
+SELECT
+    s.session_id,
+    s.user_id,
+    s.app_name,
+    s.state,
+    s.tenant_id,
+    COALESCE(
+        (
+            SELECT jsonb_agg(e.payload ORDER BY e.seq)
+            FROM adk_session_events e
+            WHERE e.session_id = s.session_id
+        ),
+        '[]'::jsonb
+    ) AS events
+FROM adk_sessions s;